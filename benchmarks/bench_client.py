@@ -0,0 +1,175 @@
+"""
+Throughput and latency benchmark against the local mock Binance server.
+
+Drives `BinanceFuturesClient.place_order`, `place_order_with_validation`,
+cancel-then-place `requote` and the CLI `handle_order` path, and reports p50/p99 latency, orders/sec and CPU
+time per order. With `--baseline` it acts as a regression gate: the exit code
+is non-zero if any scenario's p50 latency or CPU per order got worse than the
+saved baseline by more than `--max-regression`.
+
+    python -m benchmarks.bench_client --orders 500 --save bench_baseline.json
+    python -m benchmarks.bench_client --orders 500 --baseline bench_baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import statistics
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from benchmarks.mock_server import MOCK_API_KEY, MOCK_API_SECRET, MockBinanceServer
+from bot.client import BinanceApiError, BinanceFuturesClient, OrderResult
+from bot.orders import place_order_with_validation
+
+Scenario = Callable[[int], None]
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_scenario(name: str, scenario: Scenario, orders: int, warmup: int = 20) -> Dict[str, float]:
+    for i in range(warmup):
+        try:
+            scenario(i)
+        except BinanceApiError:
+            pass
+
+    latencies: List[float] = []
+    errors = 0
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    for i in range(orders):
+        start = time.perf_counter()
+        try:
+            scenario(i)
+        except BinanceApiError:
+            errors += 1
+        latencies.append(time.perf_counter() - start)
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    latencies.sort()
+    return {
+        "p50_ms": _percentile(latencies, 50) * 1000,
+        "p99_ms": _percentile(latencies, 99) * 1000,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+        "orders_per_s": orders / wall,
+        "cpu_us_per_order": cpu / orders * 1e6,
+        "errors": float(errors),
+    }
+
+
+def build_scenarios(base_url: str) -> Dict[str, Scenario]:
+    client = BinanceFuturesClient(MOCK_API_KEY, MOCK_API_SECRET, base_url=base_url)
+
+    def raw_place_order(i: int) -> None:
+        client.place_order("BTCUSDT", "BUY", "LIMIT", Decimal("0.010"), price=Decimal("65000.1"))
+
+    def validated_order(i: int) -> None:
+        place_order_with_validation(
+            client, "btcusdt", "buy", "limit", Decimal("0.010"), Decimal("65000.1"), None
+        )
+
+    resting: List[int] = []
+
+    def requote(i: int) -> None:
+        # Quote refresh: replace the resting order with one a tick away
+        if not resting:
+            order = client.place_order("BTCUSDT", "BUY", "LIMIT", Decimal("0.010"), Decimal("65000.1"))
+            resting.append(order.order_id)
+        price = Decimal("65000.1") + Decimal("0.1") * (i % 2)
+        result = client.requote("BTCUSDT", "BUY", Decimal("0.010"), price, order_id=resting[0])
+        if isinstance(result.placed, OrderResult):
+            resting[0] = result.placed.order_id
+        else:
+            resting.clear()
+            raise BinanceApiError(0, None, f"requote failed: {result}")
+
+    def cli_handle_order(i: int) -> None:
+        # Imported lazily: cli.py pulls in rich and dotenv
+        from cli import handle_order
+
+        # handle_order prints with rich and attaches a console log handler
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(
+            devnull
+        ), contextlib.redirect_stderr(devnull):
+            exit_code = handle_order(
+                "BTCUSDT", "BUY", "LIMIT", Decimal("0.010"), Decimal("65000.1"), None, "bench.log"
+            )
+        if exit_code != 0:
+            raise BinanceApiError(0, None, "handle_order failed")
+
+    return {
+        "place_order": raw_place_order,
+        "place_order_with_validation": validated_order,
+        "requote": requote,
+        "cli_handle_order": cli_handle_order,
+    }
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline_path: Path, max_regression: float) -> bool:
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    ok = True
+    for name, metrics in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        for key in ("p50_ms", "cpu_us_per_order"):
+            change = metrics[key] / base[key] - 1
+            flag = "REGRESSION" if change > max_regression else "ok"
+            print(f"  {name:<28} {key:<17} {base[key]:>9.3f} -> {metrics[key]:>9.3f} ({change:+.1%}) {flag}")
+            ok = ok and change <= max_regression
+    return ok
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orders", type=int, default=300)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--scenario", action="append", help="Run only these scenarios.")
+    parser.add_argument("--save", type=Path, help="Write results as a JSON baseline.")
+    parser.add_argument("--baseline", type=Path, help="Compare against a saved baseline.")
+    parser.add_argument("--max-regression", type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    with MockBinanceServer(args.latency_ms, args.jitter_ms, args.error_rate) as server:
+        os.environ.update(
+            BINANCE_API_KEY=MOCK_API_KEY,
+            BINANCE_API_SECRET=MOCK_API_SECRET,
+            BINANCE_BASE_URL=server.base_url,
+        )
+        scenarios = build_scenarios(server.base_url)
+        results: Dict[str, Dict[str, float]] = {}
+        print(f"{'scenario':<28} {'p50 ms':>8} {'p99 ms':>8} {'orders/s':>9} {'cpu us/order':>13} {'errors':>7}")
+        for name, scenario in scenarios.items():
+            if args.scenario and name not in args.scenario:
+                continue
+            metrics = run_scenario(name, scenario, args.orders)
+            results[name] = metrics
+            print(
+                f"{name:<28} {metrics['p50_ms']:>8.3f} {metrics['p99_ms']:>8.3f} "
+                f"{metrics['orders_per_s']:>9.0f} {metrics['cpu_us_per_order']:>13.0f} "
+                f"{int(metrics['errors']):>7}"
+            )
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    if args.baseline:
+        print("Comparison with baseline:")
+        return 0 if compare(results, args.baseline, args.max_regression) else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
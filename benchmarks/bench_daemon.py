@@ -0,0 +1,123 @@
+"""
+Order latency through the daemon vs one `cli.py order` process per order.
+
+Starts the mock server and `cli.py daemon` against it, then reports:
+
+- the round trip of `DaemonClient.order` from a warm connection, and the
+  daemon-side time from receiving an order to its response;
+- the wall time of `cli.py order --daemon` from the shell, next to that of
+  a bare `python -c pass` (the interpreter startup it cannot avoid);
+- the wall time of a direct `cli.py order`.
+
+Run with:
+
+    python -m benchmarks.bench_daemon [--orders 500] [--latency-ms 1]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks.mock_server import MOCK_API_KEY, MOCK_API_SECRET, MockBinanceServer
+from bot.daemon_client import DaemonClient, DaemonUnavailable
+
+ROOT = Path(__file__).resolve().parent.parent
+ORDER = ["order", "BTCUSDT", "BUY", "LIMIT", "0.010", "-p", "65000.1"]
+
+
+def _summary(label: str, samples_ms: List[float]) -> str:
+    samples_ms = sorted(samples_ms)
+    p50 = samples_ms[len(samples_ms) // 2]
+    p99 = samples_ms[min(len(samples_ms) - 1, int(len(samples_ms) * 0.99))]
+    return f"{label:<30} p50 {p50:8.2f} ms   p99 {p99:8.2f} ms   (n={len(samples_ms)})"
+
+
+def _wait_for_daemon(socket_path: str, timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            with DaemonClient(socket_path) as daemon:
+                if daemon.request("ping")["ok"]:
+                    return
+        except DaemonUnavailable:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+def _run(args: List[str], env: Dict[str, str]) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, *args],
+        cwd=ROOT,
+        env=env,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--orders", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    parser.add_argument("--shell-runs", type=int, default=10)
+    args = parser.parse_args()
+
+    server = MockBinanceServer(latency_ms=args.latency_ms)
+    with server, tempfile.TemporaryDirectory() as tmp:
+        socket_path = os.path.join(tmp, "daemon.sock")
+        env = {
+            **os.environ,
+            "BINANCE_API_KEY": MOCK_API_KEY,
+            "BINANCE_API_SECRET": MOCK_API_SECRET,
+            "BINANCE_BASE_URL": server.base_url,
+            "BINANCE_BOT_SOCKET": socket_path,
+        }
+        daemon_process = subprocess.Popen(
+            [sys.executable, "cli.py", "daemon", "-l", "bench_daemon.log"],
+            cwd=ROOT,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            _wait_for_daemon(socket_path)
+            round_trips: List[float] = []
+            in_daemon: List[float] = []
+            with DaemonClient(socket_path) as daemon:
+                for _ in range(args.orders):
+                    start = time.perf_counter()
+                    response = daemon.order("BTCUSDT", "BUY", "LIMIT", "0.010", "65000.1")
+                    round_trips.append((time.perf_counter() - start) * 1000)
+                    in_daemon.append(response["latency_ms"])
+            print(f"mock server latency: {args.latency_ms} ms")
+            print(_summary("daemon: in-daemon order", in_daemon))
+            print(_summary("daemon: client round trip", round_trips))
+
+            runs = range(args.shell_runs)
+            startup = [_run(["-c", "pass"], env) for _ in runs]
+            print(_summary("shell: python -c pass", startup))
+            shell = [_run(["cli.py", *ORDER, "--daemon"], env) for _ in runs]
+            print(_summary("shell: cli.py order --daemon", shell))
+            direct = [_run(["cli.py", *ORDER, "-l", "bench_daemon.log"], env) for _ in runs]
+            print(_summary("shell: cli.py order", direct))
+
+            with DaemonClient(socket_path) as daemon:
+                daemon.request("shutdown")
+            daemon_process.wait(timeout=10)
+        finally:
+            if daemon_process.poll() is None:
+                daemon_process.terminate()
+
+
+if __name__ == "__main__":
+    main()
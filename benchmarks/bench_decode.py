@@ -0,0 +1,75 @@
+"""
+Response decode time: stdlib json + dict walking vs the typed decoders.
+
+Replays recorded Binance responses from `benchmarks/fixtures/` through the
+previous pipeline (stdlib `json`, as used by `httpx.Response.json()`,
+followed by `.get()`/`int()` lookups per order) and through `bot.client.decode_order` /
+`decode_orders`, which decode the raw bytes with the fastest installed
+backend. Run with:
+
+    python -m benchmarks.bench_decode
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from bot.client import OrderResult, decode_order, decode_orders
+from bot.decoding import JSON_BACKEND
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _legacy_order(data: Dict[str, Any]) -> OrderResult:
+    order_id = int(data.get("orderId"))
+    status = data.get("status", "UNKNOWN")
+    executed_qty = data.get("executedQty", "0")
+    avg_price = data.get("avgPrice") or data.get("avgPrice", None)
+    return OrderResult(
+        order_id=order_id,
+        status=status,
+        executed_qty=executed_qty,
+        avg_price=str(avg_price) if avg_price is not None else None,
+        raw=data,
+    )
+
+
+def _legacy_decode(content: bytes, many: bool) -> Any:
+    data = json.loads(content)
+    if many:
+        return [_legacy_order(item) for item in data]
+    return _legacy_order(data)
+
+
+def _fast_decode(content: bytes, many: bool) -> Any:
+    if many:
+        return decode_orders(content)
+    return decode_order(content)
+
+
+def _per_call_us(fn: Callable[[], Any], number: int) -> float:
+    best = min(timeit.repeat(fn, number=number, repeat=5))
+    return best / number * 1e6
+
+
+def main() -> None:
+    print(f"JSON backend: {JSON_BACKEND}")
+    rows: List[str] = []
+    for path in sorted(FIXTURES.glob("*.json")):
+        content = path.read_bytes()
+        many = content.lstrip().startswith(b"[")
+        number = max(200, 2_000_000 // len(content))
+        legacy_us = _per_call_us(lambda: _legacy_decode(content, many), number)
+        fast_us = _per_call_us(lambda: _fast_decode(content, many), number)
+        rows.append(
+            f"{path.stem:<14} {len(content):>8} B  json: {legacy_us:9.2f} us  "
+            f"typed: {fast_us:9.2f} us  ({fast_us / legacy_us - 1:+.0%})"
+        )
+    print("\n".join(rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Per-order encode time: float values vs the exact Decimal pipeline.
+
+Measures building order params and the signed query string, i.e. everything
+`place_order` does before the request hits the wire. Run with:
+
+    python -m benchmarks.bench_encode
+"""
+
+from __future__ import annotations
+
+import timeit
+from decimal import Decimal
+
+from bot.client import BinanceFuturesClient
+from bot.exchange_info import ExchangeInfoCache
+from bot.validators import apply_symbol_filters
+
+EXCHANGE_INFO = {
+    "rateLimits": [],
+    "symbols": [
+        {
+            "symbol": "BTCUSDT",
+            "filters": [
+                {"filterType": "PRICE_FILTER", "minPrice": "556.80", "maxPrice": "4529764", "tickSize": "0.10"},
+                {"filterType": "LOT_SIZE", "stepSize": "0.001", "maxQty": "1000", "minQty": "0.001"},
+                {"filterType": "MARKET_LOT_SIZE", "stepSize": "0.001", "maxQty": "120", "minQty": "0.001"},
+                {"filterType": "MIN_NOTIONAL", "notional": "100"},
+            ],
+        }
+    ],
+}
+
+ROUNDS = 50_000
+
+
+def _encode(client: BinanceFuturesClient, quantity, price) -> str:
+    params = client._build_order_params("BTCUSDT", "BUY", "LIMIT", quantity, price)
+    return client._build_signed_query(params)[1]
+
+
+def _per_order_us(fn) -> float:
+    best = min(timeit.repeat(fn, number=ROUNDS, repeat=5))
+    return best / ROUNDS * 1e6
+
+
+def main() -> None:
+    cache = ExchangeInfoCache(path=None)
+    cache.update(EXCHANGE_INFO)
+    filters = cache.filters("BTCUSDT")
+
+    float_client = BinanceFuturesClient("key", "secret")
+    decimal_client = BinanceFuturesClient("key", "secret", exchange_info=cache)
+
+    float_qty, float_price = 0.1 + 0.2, 65000.1
+    qty, price, _ = apply_symbol_filters(
+        filters, "BUY", "LIMIT", Decimal("0.3"), Decimal("65000.1"), None
+    )
+
+    print("float   :", _encode(float_client, float_qty, float_price).split("&recvWindow")[0])
+    print("decimal :", _encode(decimal_client, qty, price).split("&recvWindow")[0])
+
+    float_us = _per_order_us(lambda: _encode(float_client, float_qty, float_price))
+    decimal_us = _per_order_us(lambda: _encode(decimal_client, qty, price))
+    print(f"float path   : {float_us:.2f} us/order")
+    print(f"decimal path : {decimal_us:.2f} us/order ({decimal_us / float_us - 1:+.1%})")
+
+    float_client.close()
+    decimal_client.close()
+
+
+if __name__ == "__main__":
+    main()
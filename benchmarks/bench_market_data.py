@@ -0,0 +1,127 @@
+"""
+Market data store ingest rate, lookup time and memory.
+
+Feeds synthetic combined-stream messages (book ticker, mark price and
+aggTrade events, round-robin over the symbols) through the same decode and
+`MarketData.update` path as `MarketDataStream`, then times the O(1) price
+lookups and the pricing helpers, and compares the store's memory with
+keeping the last `--capacity` decoded events per symbol in deques. Run with:
+
+    python -m benchmarks.bench_market_data [--symbols 50] [--events 200000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import timeit
+import tracemalloc
+from collections import deque
+from decimal import Decimal
+from typing import Any, Callable, Deque, Dict, List
+
+from bot.decoding import JSON_BACKEND, loads
+from bot.market_data import MarketData
+from bot.orders import passive_price
+
+
+def _messages(symbols: List[str], events: int) -> List[bytes]:
+    start_ms = int(time.time() * 1000) - events
+    messages = []
+    for i in range(events):
+        symbol = symbols[i % len(symbols)]
+        stream = symbol.lower()
+        now = start_ms + i
+        price = f"{65000 + (i % 200) / 10:.1f}"
+        kind = i % 3
+        if kind == 0:
+            ask = f"{float(price) + 0.1:.1f}"
+            data = {"e": "bookTicker", "E": now, "T": now, "s": symbol, "b": price, "a": ask}
+            data.update(u=i, B="1.250", A="0.800")
+            stream += "@bookTicker"
+        elif kind == 1:
+            data = {"e": "markPriceUpdate", "E": now, "s": symbol, "p": price, "i": price}
+            data.update(P=price, r="0.00010000", T=now + 3_600_000)
+            stream += "@markPrice@1s"
+        else:
+            data = {"e": "aggTrade", "E": now, "s": symbol, "a": i, "p": price, "q": "0.010"}
+            data.update(f=i, l=i, T=now, m=bool(i & 1))
+            stream += "@aggTrade"
+        messages.append(json.dumps({"stream": stream, "data": data}).encode())
+    return messages
+
+
+def _per_call_ns(fn: Callable[[], Any], number: int = 200_000) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e9
+
+
+def _traced_bytes(build: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--symbols", type=int, default=50)
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--capacity", type=int, default=1024)
+    args = parser.parse_args()
+
+    symbols = [f"SYM{i}USDT" for i in range(args.symbols)]
+    messages = _messages(symbols, args.events)
+    print(f"JSON backend: {JSON_BACKEND}")
+
+    market_data = MarketData(args.capacity)
+    update = market_data.update
+    start = time.perf_counter()
+    for message in messages:
+        update(loads(message)["data"])
+    elapsed = time.perf_counter() - start
+    print(
+        f"ingest     : {args.events / elapsed:,.0f} events/s "
+        f"({elapsed / args.events * 1e6:.2f} us/event incl. decode)"
+    )
+
+    symbol = symbols[-1]
+    tick = Decimal("0.1")
+    print(f"best_bid   : {_per_call_ns(lambda: market_data.best_bid(symbol)):.0f} ns")
+    print(f"quote      : {_per_call_ns(lambda: market_data.quote(symbol)):.0f} ns")
+    print(f"mark_price : {_per_call_ns(lambda: market_data.mark_price(symbol)):.0f} ns")
+    print(
+        "passive    : "
+        f"{_per_call_ns(lambda: passive_price(market_data, symbol, 'BUY', 1, tick), 50_000):.0f}"
+        " ns (BUY one tick behind the bid)"
+    )
+
+    def ring_buffers() -> MarketData:
+        store = MarketData(args.capacity)
+        for message in messages:
+            store.update(loads(message)["data"])
+        return store
+
+    def event_deques() -> Dict[str, Deque[Dict[str, Any]]]:
+        store: Dict[str, Deque[Dict[str, Any]]] = {}
+        for message in messages:
+            data = loads(message)["data"]
+            key = f"{data['s']}:{data['e']}"
+            if key not in store:
+                store[key] = deque(maxlen=args.capacity)
+            store[key].append(data)
+        return store
+
+    ring = _traced_bytes(ring_buffers)
+    dicts = _traced_bytes(event_deques)
+    print(
+        f"memory     : ring buffers {ring / 2**20:.1f} MiB vs event deques "
+        f"{dicts / 2**20:.1f} MiB ({args.symbols} symbols x 3 streams x {args.capacity} rows)"
+    )
+
+
+if __name__ == "__main__":
+    main()
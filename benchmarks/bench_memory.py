@@ -0,0 +1,80 @@
+"""
+Memory held by 100k order results, per raw retention mode.
+
+Decodes the recorded order responses in `benchmarks/fixtures/` into
+`OrderResult`s and measures the retained heap with tracemalloc, against the
+previous `@dataclass` result that always kept the decoded dict. Run with:
+
+    python -m benchmarks.bench_memory [--count 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from bot.client import RAW_RETENTION_MODES, OrderResult
+from bot.decoding import dumps, loads
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@dataclass
+class _DataclassOrderResult:
+    order_id: int
+    status: str
+    executed_qty: str
+    avg_price: Optional[str]
+    raw: Dict[str, Any]
+
+
+def _dataclass_result(data: Dict[str, Any]) -> _DataclassOrderResult:
+    avg_price = data.get("avgPrice")
+    return _DataclassOrderResult(
+        order_id=int(data["orderId"]),
+        status=data.get("status", "UNKNOWN"),
+        executed_qty=data.get("executedQty", "0"),
+        avg_price=str(avg_price) if avg_price is not None else None,
+        raw=data,
+    )
+
+
+def _retained_bytes(
+    bodies: List[bytes], count: int, build: Callable[[Dict[str, Any]], Any]
+) -> int:
+    gc.collect()
+    tracemalloc.start()
+    results = [build(loads(bodies[i % len(bodies)])) for i in range(count)]
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000, help="results to hold in memory")
+    args = parser.parse_args()
+
+    # Every order of every fixture, so statuses and field values vary.
+    bodies: List[bytes] = []
+    for path in sorted(FIXTURES.glob("*.json")):
+        data = loads(path.read_bytes())
+        bodies.extend(dumps(item) for item in (data if isinstance(data, list) else [data]))
+
+    baseline = _retained_bytes(bodies, args.count, _dataclass_result)
+    print(f"{'dataclass (raw dict)':<22} {baseline / 2**20:8.1f} MiB")
+    for mode in RAW_RETENTION_MODES:
+        size = _retained_bytes(
+            bodies, args.count, lambda data, mode=mode: OrderResult.from_data(data, mode)
+        )
+        print(f"{'slots, raw=' + mode:<22} {size / 2**20:8.1f} MiB  ({size / baseline - 1:+.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+Order book replay: diff apply rate and depth query time.
+
+Replays recorded depth files (by default `benchmarks/fixtures/depth_*.jsonl.gz`)
+into `--books` copies of `OrderBook` at once, as `OrderBookStream` would for
+that many symbols, and compares the sorted-array book with a plain dict of
+levels that sorts on demand. A recording is one JSON object per line: the
+`/fapi/v1/depth` snapshot, then the combined-stream messages as received.
+Record one from the testnet with `--record`:
+
+    python -m benchmarks.bench_order_book [--books 50] [files ...]
+    python -m benchmarks.bench_order_book --record depth.jsonl.gz --symbol BTCUSDT --seconds 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gzip
+import json
+import time
+import timeit
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import websockets
+
+from bot.async_client import AsyncBinanceFuturesClient
+from bot.decoding import JSON_BACKEND, loads
+from bot.market_data import TESTNET_MARKET_STREAM_URL
+from bot.order_book import OrderBook
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _open(path: Path, mode: str) -> IO[Any]:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+
+def load_recording(path: Path) -> Tuple[Dict[str, Any], List[bytes]]:
+    with _open(path, "rb") as f:
+        lines = [line.rstrip(b"\n") for line in f if line.strip()]
+    return loads(lines[0]), lines[1:]
+
+
+class _DictBook:
+    """Baseline: levels in dicts, sorted when queried."""
+
+    def __init__(self, snapshot: Dict[str, Any]) -> None:
+        self.bids = {float(p): float(q) for p, q in snapshot["bids"]}
+        self.asks = {float(p): float(q) for p, q in snapshot["asks"]}
+        self.last_update_id = snapshot["lastUpdateId"]
+
+    def apply(self, event: Dict[str, Any]) -> bool:
+        if event["u"] < self.last_update_id:
+            return True
+        for levels, updates in ((self.bids, event["b"]), (self.asks, event["a"])):
+            for price, qty in updates:
+                if float(qty):
+                    levels[float(price)] = float(qty)
+                else:
+                    levels.pop(float(price), None)
+        return True
+
+    def best_bid(self) -> float:
+        return max(self.bids)
+
+    def cumulative_bid_qty(self, n: int) -> float:
+        return sum(self.bids[p] for p in sorted(self.bids, reverse=True)[:n])
+
+
+def _replay(books: Sequence[Any], messages: List[bytes]) -> Tuple[float, int]:
+    gaps = 0
+    start = time.perf_counter()
+    for message in messages:
+        for book in books:
+            # Decoded per book, as each symbol's diffs arrive separately.
+            if not book.apply(loads(message)["data"]):
+                gaps += 1
+    return time.perf_counter() - start, gaps
+
+
+def _per_call_ns(fn: Callable[[], Any], number: int = 100_000) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e9
+
+
+def replay(paths: List[Path], book_count: int) -> None:
+    print(f"JSON backend: {JSON_BACKEND}")
+    for path in paths:
+        snapshot, messages = load_recording(path)
+        events = len(messages) * book_count
+        print(f"{path.name}: {len(messages)} diffs x {book_count} books")
+
+        books: List[Any] = []
+        for i in range(book_count):
+            book = OrderBook(f"SYM{i}")
+            book.load_snapshot(snapshot)
+            books.append(book)
+        elapsed, gaps = _replay(books, messages)
+        print(
+            f"  array book    : {events / elapsed:,.0f} diffs/s "
+            f"({elapsed / events * 1e6:.2f} us/diff incl. decode), {gaps} gaps"
+        )
+        baseline = [_DictBook(snapshot) for _ in range(book_count)]
+        dict_elapsed, _ = _replay(baseline, messages)
+        print(f"  dict book     : {events / dict_elapsed:,.0f} diffs/s")
+
+        book, dict_book = books[-1], baseline[-1]
+        best_bid = book.best_bid()
+        assert book.bids.levels() == sorted(dict_book.bids.items(), reverse=True)
+        assert book.asks.levels() == sorted(dict_book.asks.items())
+        print(
+            f"  top           : bid {best_bid} / ask {book.best_ask()}, "
+            f"{len(book.bids)} bid levels"
+        )
+        queries = [
+            ("best_bid", book.best_bid, dict_book.best_bid),
+            (
+                "depth(20)",
+                lambda: book.bids.cumulative_qty(20),
+                lambda: dict_book.cumulative_bid_qty(20),
+            ),
+        ]
+        for name, fast, slow in queries:
+            print(
+                f"  {name:<13} : {_per_call_ns(fast):8.0f} ns  "
+                f"(dict book {_per_call_ns(slow, 1_000):,.0f} ns)"
+            )
+        for name, query in (
+            ("qty_through", lambda: book.bids.qty_through(best_bid - 5)),
+            ("price_for_qty", lambda: book.asks.price_for_qty(10.0)),
+        ):
+            print(f"  {name:<13} : {_per_call_ns(query):8.0f} ns")
+
+
+async def record(
+    path: Path, symbol: str, seconds: float, url: str, base_url: Optional[str]
+) -> None:
+    """Record `symbol`'s diff stream plus a snapshot taken after it started."""
+    client = AsyncBinanceFuturesClient("", "", **({"base_url": base_url} if base_url else {}))
+    messages: List[str] = []
+    async with websockets.connect(f"{url}?streams={symbol.lower()}@depth@100ms") as ws:
+
+        async def collect() -> None:
+            async for message in ws:
+                messages.append(message)
+
+        collector = asyncio.create_task(collect())
+        await asyncio.sleep(1.0)
+        snapshot = await client.get_depth(symbol)
+        await asyncio.sleep(seconds)
+        collector.cancel()
+    await client.close()
+    with _open(path, "wt") as f:
+        f.write(json.dumps(snapshot, separators=(",", ":")) + "\n")
+        for message in messages:
+            f.write(message + "\n")
+    print(f"Recorded {len(messages)} diffs to {path}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("files", nargs="*", type=Path)
+    parser.add_argument("--books", type=int, default=50, help="books replayed side by side")
+    parser.add_argument("--record", type=Path, help="record a depth file instead of replaying")
+    parser.add_argument("--symbol", default="BTCUSDT")
+    parser.add_argument("--seconds", type=float, default=60.0)
+    parser.add_argument("--url", default=TESTNET_MARKET_STREAM_URL)
+    parser.add_argument("--base-url", help="REST endpoint for the snapshot (default: testnet)")
+    args = parser.parse_args()
+    if args.record is not None:
+        asyncio.run(record(args.record, args.symbol, args.seconds, args.url, args.base_url))
+        return
+    replay(args.files or sorted(FIXTURES.glob("depth_*.jsonl*")), args.books)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Order file throughput vs one `cli.py order` process per order.
+
+Writes a generated order file, places it with `cli.py orders-file` against
+the local mock server at several concurrency levels, and compares the
+orders/sec with running `cli.py order` once per order, as looping shell
+scripts do. Run with:
+
+    python -m benchmarks.bench_orders_file [--orders 500] [--latency-ms 1]
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks.mock_server import MOCK_API_KEY, MOCK_API_SECRET, MockBinanceServer
+from bot.order_file import ORDER_FILE_FIELDS
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def write_order_file(path: Path, orders: int) -> None:
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=ORDER_FILE_FIELDS)
+        writer.writeheader()
+        for i in range(orders):
+            writer.writerow(
+                {
+                    "symbol": "BTCUSDT",
+                    "side": "BUY" if i % 2 else "SELL",
+                    "type": "LIMIT",
+                    "quantity": "0.010",
+                    "price": f"{65000 + i % 50 / 10:.1f}",
+                    "client_order_id": f"bench-{i}",
+                }
+            )
+
+
+def _run(args: List[str], env: Dict[str, str]) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "cli.py", *args],
+        cwd=ROOT,
+        env=env,
+        check=False,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--orders", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    parser.add_argument("--concurrency", type=int, action="append")
+    parser.add_argument("--single-runs", type=int, default=10, help="`cli.py order` runs")
+    args = parser.parse_args()
+
+    server = MockBinanceServer(latency_ms=args.latency_ms)
+    with server, tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "BINANCE_API_KEY": MOCK_API_KEY,
+            "BINANCE_API_SECRET": MOCK_API_SECRET,
+            "BINANCE_BASE_URL": server.base_url,
+        }
+        order_file = Path(tmp) / "orders.csv"
+        write_order_file(order_file, args.orders)
+        log_file = "bench_orders_file.log"
+
+        single = ["order", "BTCUSDT", "BUY", "LIMIT", "0.010", "-p", "65000.1", "-l", log_file]
+        elapsed = sum(_run(single, env) for _ in range(args.single_runs))
+        label = f"cli.py order x{args.single_runs}"
+        print(f"{label:<28} {args.single_runs / elapsed:>9.1f} orders/s")
+
+        for concurrency in args.concurrency or [1, 4, 16, 32]:
+            elapsed = _run(
+                ["orders-file", str(order_file), "-c", str(concurrency), "-l", log_file], env
+            )
+            with open(Path(tmp) / "orders.results.csv", newline="") as f:
+                placed = sum(1 for row in csv.DictReader(f) if row["status"] == "NEW")
+            label = f"orders-file -c {concurrency}"
+            print(f"{label:<28} {args.orders / elapsed:>9.1f} orders/s ({placed} placed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Per-request CPU of building a signed query string, before and after
+`bot.signing.RequestSigner`.
+
+"before" reproduces the original `_signed_request` steps: mutate params,
+sort keys, build f-strings, join, and key a fresh HMAC per request. Run with:
+
+    python -m benchmarks.bench_signing
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import time
+import timeit
+from urllib.parse import quote
+
+from bot.client import BinanceFuturesClient
+
+API_SECRET = "s3cr3t" * 8
+ROUNDS = 100_000
+
+
+def _order_params() -> dict:
+    return {
+        "symbol": "BTCUSDT",
+        "side": "BUY",
+        "type": "LIMIT",
+        "quantity": "0.010",
+        "price": "65000.1",
+        "timeInForce": "GTC",
+    }
+
+
+def legacy_signed_query(secret: bytes, recv_window: int, params: dict) -> str:
+    params["timestamp"] = int(time.time() * 1000)
+    params["recvWindow"] = recv_window
+    query_items = [f"{k}={quote(str(params[k]), safe='')}" for k in sorted(params)]
+    query_string = "&".join(query_items)
+    signature = hmac.new(secret, query_string.encode("utf-8"), hashlib.sha256).hexdigest()
+    return f"{query_string}&signature={signature}"
+
+
+def _verify(client: BinanceFuturesClient) -> None:
+    _, signed = client._build_signed_query(_order_params())
+    query, signature = signed.rsplit("&signature=", 1)
+    expected = hmac.new(API_SECRET.encode(), query.encode(), hashlib.sha256).hexdigest()
+    assert signature == expected, "signature mismatch"
+    print("signed query:", signed)
+
+
+def _per_request_us(fn) -> float:
+    best = min(timeit.repeat(fn, number=ROUNDS, repeat=5))
+    return best / ROUNDS * 1e6
+
+
+def main() -> None:
+    client = BinanceFuturesClient("key", API_SECRET)
+    _verify(client)
+    secret = API_SECRET.encode()
+
+    before = _per_request_us(lambda: legacy_signed_query(secret, 5_000, _order_params()))
+    after = _per_request_us(lambda: client._build_signed_query(_order_params()))
+    baseline = _per_request_us(_order_params)
+
+    before -= baseline
+    after -= baseline
+    print(f"before : {before:.2f} us/request")
+    print(f"after  : {after:.2f} us/request ({after / before - 1:+.1%})")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
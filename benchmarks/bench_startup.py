@@ -0,0 +1,138 @@
+"""
+Startup cost of `cli.py` per invocation path, from `python -X importtime`.
+
+For each scenario this reports the wall time of the whole process (median
+over `--runs`, next to a bare `python -c pass`), the time spent importing
+modules once `site` is done (the part `cli.py` controls) and the heaviest
+top-level imports. The scenarios:
+
+- `--help`, and an order that fails validation, with and without `--plain`;
+- `order --daemon` when no daemon is listening;
+- a full order against the mock server, with and without `--plain`.
+
+With `--check` the script exits non-zero if a fast path (help, `--plain`
+validation failure, daemon forwarding) imports any of httpx, rich, dotenv
+or `bot.client`, so a stray top-level import shows up as a failure.
+
+Run with:
+
+    python -m benchmarks.bench_startup [--runs 10] [--check]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Tuple
+
+from benchmarks.mock_server import MOCK_API_KEY, MOCK_API_SECRET, MockBinanceServer
+
+ROOT = Path(__file__).resolve().parent.parent
+INVALID = ["order", "BTCUSDT", "HOLD", "MARKET", "0.010"]
+ORDER = ["order", "BTCUSDT", "BUY", "LIMIT", "0.010", "-p", "65000.1", "-l", "bench_startup.log"]
+
+# (label, cli.py arguments, whether the path must stay free of HEAVY_MODULES)
+SCENARIOS: List[Tuple[str, List[str], bool]] = [
+    ("--help", ["--help"], True),
+    ("invalid order", INVALID, False),
+    ("invalid order --plain", [*INVALID, "--plain"], True),
+    ("order --daemon (none running)", [*INVALID[:2], "BUY", "MARKET", "0.010", "--daemon"], True),
+    ("order", ORDER, False),
+    ("order --plain", [*ORDER, "--plain"], False),
+]
+HEAVY_MODULES = ("httpx", "rich", "dotenv", "bot.client")
+
+
+class ImportProfile(NamedTuple):
+    site_us: int
+    imports_us: int
+    modules: Dict[str, int]
+    top: List[Tuple[str, int]]
+
+
+def parse_importtime(stderr: str) -> ImportProfile:
+    """Split `-X importtime` output into `site`, the rest and per-module times."""
+    site_us = imports_us = 0
+    modules: Dict[str, int] = {}
+    top: List[Tuple[str, int]] = []
+    after_site = False
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|", 2)
+        module = name.strip()
+        modules[module] = int(cumulative)
+        if name[1:] != module:  # Indented: counted in its importer's cumulative time
+            continue
+        if module == "site":
+            site_us = int(cumulative)
+            after_site = True
+        elif after_site:
+            imports_us += int(cumulative)
+            top.append((module, int(cumulative)))
+    top.sort(key=lambda item: item[1], reverse=True)
+    return ImportProfile(site_us, imports_us, modules, top)
+
+
+def heavy_imports(profile: ImportProfile) -> List[str]:
+    return [module for module in HEAVY_MODULES if module in profile.modules]
+
+
+def _run(args: List[str], env: Dict[str, str], importtime: bool = False) -> Tuple[float, str]:
+    command = [sys.executable, *(["-X", "importtime"] if importtime else []), *args]
+    start = time.perf_counter()
+    completed = subprocess.run(
+        command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    return (time.perf_counter() - start) * 1000, completed.stderr
+
+
+def _median(samples: List[float]) -> float:
+    return sorted(samples)[len(samples) // 2]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=4, help="Heaviest imports shown per scenario.")
+    parser.add_argument(
+        "--check", action="store_true", help="Fail if a fast path imports httpx, rich or dotenv."
+    )
+    args = parser.parse_args()
+
+    failures: List[str] = []
+    with MockBinanceServer() as server, tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            "BINANCE_API_KEY": MOCK_API_KEY,
+            "BINANCE_API_SECRET": MOCK_API_SECRET,
+            "BINANCE_BASE_URL": server.base_url,
+            "BINANCE_BOT_SOCKET": os.path.join(tmp, "no-daemon.sock"),
+        }
+        baseline = _median([_run(["-c", "pass"], env)[0] for _ in range(args.runs)])
+        print(f"{'python -c pass':<32} wall {baseline:7.1f} ms")
+        for label, cli_args, fast in SCENARIOS:
+            wall = _median([_run(["cli.py", *cli_args], env)[0] for _ in range(args.runs)])
+            profile = parse_importtime(_run(["cli.py", *cli_args], env, importtime=True)[1])
+            top = ", ".join(f"{name} {us / 1000:.1f}" for name, us in profile.top[: args.top])
+            print(
+                f"{label:<32} wall {wall:7.1f} ms   site {profile.site_us / 1000:5.1f} ms   "
+                f"imports {profile.imports_us / 1000:6.1f} ms   ({top})"
+            )
+            heavy = heavy_imports(profile)
+            if fast and heavy:
+                failures.append(f"{label} imports {', '.join(heavy)}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if args.check and failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+User data stream dispatch throughput and reconnect behaviour.
+
+Pushes `ORDER_TRADE_UPDATE` events from the local WebSocket stand-in through
+`UserDataStream` into an `OrderTracker`, reports delivered events/sec and
+the client CPU time per event, then drops the connection and reports how
+long the reconnect and gap resync took. Run with:
+
+    python -m benchmarks.bench_user_stream [--events 20000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from decimal import Decimal
+from typing import Any, Dict, List
+
+from benchmarks.mock_server import MOCK_API_KEY, MOCK_API_SECRET, MockBinanceServer
+from benchmarks.mock_user_stream import MockUserStream, order_trade_update
+from bot.async_client import AsyncBinanceFuturesClient
+from bot.order_tracker import OrderTracker
+from bot.user_stream import GAP_EVENT, UserDataStream
+
+
+async def run(base_url: str, events: int) -> None:
+    client = AsyncBinanceFuturesClient(MOCK_API_KEY, MOCK_API_SECRET, base_url=base_url)
+    client.order_tracker = tracker = OrderTracker()
+    other = AsyncBinanceFuturesClient(MOCK_API_KEY, MOCK_API_SECRET, base_url=base_url)
+    order = await client.place_order(
+        "BTCUSDT", "BUY", "LIMIT", Decimal("0.010"), price=Decimal("65000.1")
+    )
+
+    received = asyncio.Event()
+    gaps: List[Dict[str, Any]] = []
+    count = 0
+
+    def on_update(event: Dict[str, Any]) -> None:
+        nonlocal count
+        count += 1
+        if count == events:
+            received.set()
+
+    async with MockUserStream() as server:
+        async with UserDataStream(client, stream_url=server.url) as stream:
+            stream.subscribe("ORDER_TRADE_UPDATE", on_update)
+            stream.subscribe(GAP_EVENT, gaps.append)
+            await server.wait_for_clients()
+
+            # Distinct, increasing event times that all precede the cancel below
+            first_ms = int(time.time() * 1000) - events
+            updates = [
+                order_trade_update(order.order_id, "PARTIALLY_FILLED", event_time=first_ms + i)
+                for i in range(events)
+            ]
+            cpu_start = time.process_time()
+            wall_start = time.perf_counter()
+            for update in updates:
+                await server.push(update)
+            await received.wait()
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            # Includes the stand-in's encoding and sending, which share the process.
+            print(
+                f"dispatch   : {events / wall:,.0f} events/s, "
+                f"{cpu / events * 1e6:.1f} us CPU/event"
+            )
+            print(f"tracker    : order {order.order_id} is {tracker.get(order.order_id).status}")
+
+            # The order is canceled elsewhere while the stream is down; the
+            # gap resync must notice.
+            await other.cancel_order("BTCUSDT", order_id=order.order_id)
+            reconnect_start = time.perf_counter()
+            await server.drop()
+            while tracker.get(order.order_id).is_open:
+                await asyncio.sleep(0.001)
+            print(
+                f"reconnect  : {(time.perf_counter() - reconnect_start) * 1000:.1f} ms "
+                f"incl. gap resync ({len(gaps)} gap); order {order.order_id} is now "
+                f"{tracker.get(order.order_id).status}"
+            )
+    await client.close()
+    await other.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=20_000)
+    args = parser.parse_args()
+    with MockBinanceServer() as server:
+        asyncio.run(run(server.base_url, args.events))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Per-order latency over the WebSocket API vs REST, against local mock servers.
+
+Places `--orders` LIMIT orders one at a time through `BinanceFuturesClient`,
+`AsyncBinanceFuturesClient` and `BinanceWsApiClient`, with the same
+simulated server latency on the REST (`benchmarks.mock_server`) and
+WebSocket (`benchmarks.mock_ws_api`) stand-ins, and reports p50/p99 latency,
+orders/sec and CPU time per order. Each client's connection is opened before
+timing starts. Cancel-then-place requotes are timed the same way, over REST
+and over the WebSocket API with and without pipelining.
+
+Run with:
+
+    python -m benchmarks.bench_ws_api [--orders 500] [--latency-ms 1]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable, List
+
+from benchmarks.mock_server import MOCK_API_KEY, MOCK_API_SECRET, MockBinanceServer
+from benchmarks.mock_ws_api import MockWsApiServer
+from bot.async_client import AsyncBinanceFuturesClient
+from bot.client import BinanceFuturesClient
+from bot.ws_api import BinanceWsApiClient
+
+ORDER = {
+    "symbol": "BTCUSDT",
+    "side": "BUY",
+    "order_type": "LIMIT",
+    "quantity": "0.010",
+    "price": "65000.1",
+    "time_in_force": "GTC",
+}
+
+
+def _report(label: str, latencies_ms: List[float], wall_s: float, cpu_s: float) -> None:
+    latencies_ms = sorted(latencies_ms)
+    n = len(latencies_ms)
+    p50 = latencies_ms[n // 2]
+    p99 = latencies_ms[min(n - 1, int(n * 0.99))]
+    print(
+        f"{label:<26} p50 {p50:7.3f} ms   p99 {p99:7.3f} ms   "
+        f"{n / wall_s:7.0f} orders/s   {cpu_s / n * 1e6:6.0f} cpu us/order"
+    )
+
+
+def _bench_sync(label: str, place: Callable[[], object], orders: int) -> None:
+    latencies: List[float] = []
+    wall, cpu = time.perf_counter(), time.process_time()
+    for _ in range(orders):
+        start = time.perf_counter()
+        place()
+        latencies.append((time.perf_counter() - start) * 1000)
+    _report(label, latencies, time.perf_counter() - wall, time.process_time() - cpu)
+
+
+async def _bench_async(label: str, place: Callable[[], Awaitable[object]], orders: int) -> None:
+    latencies: List[float] = []
+    wall, cpu = time.perf_counter(), time.process_time()
+    for _ in range(orders):
+        start = time.perf_counter()
+        await place()
+        latencies.append((time.perf_counter() - start) * 1000)
+    _report(label, latencies, time.perf_counter() - wall, time.process_time() - cpu)
+
+
+async def _bench_async_clients(base_url: str, ws_url: str, orders: int) -> None:
+    rest = AsyncBinanceFuturesClient(MOCK_API_KEY, MOCK_API_SECRET, base_url=base_url)
+    await rest.warm_up()
+    await _bench_async("REST (async)", lambda: rest.place_order(**ORDER), orders)
+    await rest.close()
+
+    ws = BinanceWsApiClient(MOCK_API_KEY, MOCK_API_SECRET, ws_url=ws_url)
+    await ws.connect()
+    await _bench_async("WebSocket API", lambda: ws.place_order(**ORDER), orders)
+    for pipeline in (False, True):
+        resting = [(await ws.place_order(**ORDER)).order_id]
+
+        async def requote() -> None:
+            result = await ws.requote(
+                "BTCUSDT",
+                "BUY",
+                "0.010",
+                "65000.1",
+                resting[0],
+                time_in_force="GTC",
+                pipeline=pipeline,
+            )
+            resting[0] = result.placed.order_id  # type: ignore[union-attr]
+
+        label = "WebSocket requote" + (" (pipe)" if pipeline else "")
+        await _bench_async(label, requote, orders)
+    await ws.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--orders", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    with MockBinanceServer(latency_ms=args.latency_ms) as rest_server, MockWsApiServer(
+        latency_ms=args.latency_ms
+    ) as ws_server:
+        print(f"mock server latency: {args.latency_ms} ms")
+        client = BinanceFuturesClient(MOCK_API_KEY, MOCK_API_SECRET, base_url=rest_server.base_url)
+        client.warm_up()
+        _bench_sync("REST (sync)", lambda: client.place_order(**ORDER), args.orders)
+        resting = [client.place_order(**ORDER).order_id]
+
+        def requote() -> None:
+            result = client.requote(
+                "BTCUSDT", "BUY", "0.010", "65000.1", resting[0], time_in_force="GTC"
+            )
+            resting[0] = result.placed.order_id  # type: ignore[union-attr]
+
+        _bench_sync("REST requote (sync)", requote, args.orders)
+        client.close()
+        asyncio.run(_bench_async_clients(rest_server.base_url, ws_server.url, args.orders))
+
+
+if __name__ == "__main__":
+    main()
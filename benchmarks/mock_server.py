@@ -0,0 +1,321 @@
+"""
+Local stand-in for the Binance Futures REST API.
+
+Implements the endpoints the bot uses (`/fapi/v1/order`, `/fapi/v1/batchOrders`,
+`/fapi/v1/allOpenOrders`, `/fapi/v1/openOrders`, `/fapi/v1/listenKey`,
+`/fapi/v1/time`, `/fapi/v1/exchangeInfo`) with configurable latency, jitter
+and error rate, so client throughput and latency can be measured without the
+testnet. Signatures are verified against the configured secret; orders are
+kept in memory, LIMIT orders resting until canceled.
+
+Runs in a separate process so its CPU time does not pollute client
+measurements:
+
+    with MockBinanceServer(latency_ms=1.0) as server:
+        client = BinanceFuturesClient("key", MOCK_API_SECRET, base_url=server.base_url)
+
+or standalone: `python -m benchmarks.mock_server --port 8081`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import hmac
+import itertools
+import json
+import multiprocessing
+import random
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+MOCK_API_KEY = "mock-api-key"
+MOCK_API_SECRET = "mock-api-secret"
+MOCK_LISTEN_KEY = "mock-listen-key"
+
+EXCHANGE_INFO = {
+    "timezone": "UTC",
+    "rateLimits": [
+        {"rateLimitType": "REQUEST_WEIGHT", "interval": "MINUTE", "intervalNum": 1, "limit": 2400},
+        {"rateLimitType": "ORDERS", "interval": "MINUTE", "intervalNum": 1, "limit": 1200},
+        {"rateLimitType": "ORDERS", "interval": "SECOND", "intervalNum": 10, "limit": 300},
+    ],
+    "symbols": [
+        {
+            "symbol": symbol,
+            "filters": [
+                {"filterType": "PRICE_FILTER", "minPrice": "0.10", "maxPrice": "4529764", "tickSize": "0.10"},
+                {"filterType": "LOT_SIZE", "stepSize": "0.001", "maxQty": "1000", "minQty": "0.001"},
+                {"filterType": "MARKET_LOT_SIZE", "stepSize": "0.001", "maxQty": "120", "minQty": "0.001"},
+                {"filterType": "MIN_NOTIONAL", "notional": "5"},
+            ],
+        }
+        for symbol in ("BTCUSDT", "ETHUSDT", "BNBUSDT")
+    ],
+}
+
+_INVALID_API_KEY = {"code": -2015, "msg": "Invalid API-key, IP, or permissions for action."}
+# Binance's rejection of a cancel for an unknown or no longer open order
+_UNKNOWN_ORDER = (-2011, "Unknown order sent.")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without TCP_NODELAY every
+    # response stalls on Nagle + delayed ACK (~40ms).
+    disable_nagle_algorithm = True
+    server: "_MockHTTPServer"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - stdlib signature
+        pass
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_PUT(self) -> None:
+        self._dispatch("PUT")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+
+        url = urlsplit(self.path)
+        config = self.server.config
+        delay = config["latency_ms"] + random.uniform(0, config["jitter_ms"])
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+        if url.path == "/fapi/v1/time":
+            self._reply(200, {"serverTime": int(time.time() * 1000)})
+            return
+        if url.path == "/fapi/v1/ping":
+            self._reply(200, {})
+            return
+        if url.path == "/fapi/v1/exchangeInfo":
+            self._reply(200, EXCHANGE_INFO)
+            return
+        if url.path == "/fapi/v1/listenKey":
+            if self.headers.get("X-MBX-APIKEY") != MOCK_API_KEY:
+                self._reply(401, _INVALID_API_KEY)
+            else:
+                self._reply(200, {"listenKey": MOCK_LISTEN_KEY} if method != "DELETE" else {})
+            return
+
+        status, body = self._check_signature(url.query)
+        if status != 200:
+            self._reply(status, body)
+            return
+        if random.random() < config["error_rate"]:
+            self._reply(400, {"code": -2019, "msg": "Margin is insufficient."})
+            return
+
+        params = dict(parse_qsl(url.query))
+        store = self.server.orders
+        if url.path == "/fapi/v1/order" and method == "POST":
+            self._reply(200, store.new_order(params))
+        elif url.path == "/fapi/v1/order" and method in ("GET", "DELETE"):
+            order = store.find_order(params)
+            if method == "DELETE" and order is not None:
+                order = store.cancel_order(order)
+            if order is None:
+                code, msg = (-2013, "Order does not exist.") if method == "GET" else _UNKNOWN_ORDER
+                self._reply(400, {"code": code, "msg": msg})
+            else:
+                self._reply(200, order)
+        elif url.path == "/fapi/v1/openOrders" and method == "GET":
+            self._reply(200, store.open_orders(params.get("symbol")))
+        elif url.path == "/fapi/v1/batchOrders" and method == "POST":
+            orders = json.loads(params["batchOrders"])
+            self._reply(200, [store.new_order(order) for order in orders])
+        elif url.path == "/fapi/v1/batchOrders" and method == "DELETE":
+            self._reply(200, store.cancel_batch(params))
+        elif url.path == "/fapi/v1/allOpenOrders" and method == "DELETE":
+            store.cancel_all(params["symbol"])
+            msg = "The operation of cancel all open order is done."
+            self._reply(200, {"code": 200, "msg": msg})
+        else:
+            self._reply(404, {"code": -1000, "msg": f"Unknown endpoint {method} {url.path}"})
+
+    def _check_signature(self, query: str) -> Tuple[int, Dict[str, Any]]:
+        if self.headers.get("X-MBX-APIKEY") != MOCK_API_KEY:
+            return 401, _INVALID_API_KEY
+        unsigned, _, signature = query.rpartition("&signature=")
+        expected = hmac.new(MOCK_API_SECRET.encode(), unsigned.encode(), hashlib.sha256).hexdigest()
+        if not hmac.compare_digest(signature, expected):
+            return 400, {"code": -1022, "msg": "Signature for this request is not valid."}
+        return 200, {}
+
+    def _reply(self, status: int, body: Any) -> None:
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("X-MBX-USED-WEIGHT-1M", "1")
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], config: Dict[str, float]) -> None:
+        super().__init__(address, _Handler)
+        self.config = config
+        self.orders = MockOrderStore()
+
+
+class MockOrderStore:
+    """In-memory orders of a mock server; shared by the REST and WebSocket API mocks."""
+
+    def __init__(self) -> None:
+        self._order_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        # Every order by orderId, and orderId by clientOrderId
+        self._orders: Dict[int, Dict[str, Any]] = {}
+        self._client_ids: Dict[str, int] = {}
+
+    def new_order(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        order_type = params.get("type", "MARKET")
+        filled = order_type == "MARKET"
+        order = {
+            "orderId": next(self._order_ids),
+            "symbol": params.get("symbol"),
+            "clientOrderId": params.get("newClientOrderId", ""),
+            "status": "FILLED" if filled else "NEW",
+            "side": params.get("side"),
+            "type": order_type,
+            "origQty": params.get("quantity"),
+            "executedQty": params.get("quantity") if filled else "0",
+            "price": params.get("price", "0"),
+            "avgPrice": params.get("price", "65000.0") if filled else "0.00",
+            "timeInForce": params.get("timeInForce", "GTC"),
+            "updateTime": int(time.time() * 1000),
+        }
+        with self._lock:
+            self._orders[order["orderId"]] = order
+            if order["clientOrderId"]:
+                self._client_ids[order["clientOrderId"]] = order["orderId"]
+        return dict(order)
+
+    def find_order(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if "orderId" in params:
+                order = self._orders.get(int(params["orderId"]))
+            else:
+                order_id = self._client_ids.get(params.get("origClientOrderId", ""), -1)
+                order = self._orders.get(order_id)
+            return dict(order) if order is not None else None
+
+    def cancel_order(self, order: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Cancel an open order; None if it is no longer open."""
+        with self._lock:
+            order = self._orders[order["orderId"]]
+            if order["status"] != "NEW":
+                return None
+            order.update(status="CANCELED", updateTime=int(time.time() * 1000))
+            return dict(order)
+
+    def cancel_batch(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if "orderIdList" in params:
+            lookups = [{"orderId": i} for i in json.loads(params["orderIdList"])]
+        else:
+            client_ids = json.loads(params["origClientOrderIdList"])
+            lookups = [{"origClientOrderId": i} for i in client_ids]
+        results: List[Dict[str, Any]] = []
+        for lookup in lookups:
+            order = self.find_order(lookup)
+            canceled = self.cancel_order(order) if order is not None else None
+            if canceled is None:
+                code, msg = _UNKNOWN_ORDER
+                results.append({"code": code, "msg": msg})
+            else:
+                results.append(canceled)
+        return results
+
+    def open_orders(self, symbol: Optional[str]) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [
+                dict(order)
+                for order in self._orders.values()
+                if order["status"] == "NEW" and (symbol is None or order["symbol"] == symbol)
+            ]
+
+    def cancel_all(self, symbol: str) -> None:
+        now = int(time.time() * 1000)
+        with self._lock:
+            for order in self._orders.values():
+                if order["status"] == "NEW" and order["symbol"] == symbol:
+                    order.update(status="CANCELED", updateTime=now)
+
+
+def serve(port: int, latency_ms: float, jitter_ms: float, error_rate: float) -> None:
+    config = {"latency_ms": latency_ms, "jitter_ms": jitter_ms, "error_rate": error_rate}
+    with _MockHTTPServer(("127.0.0.1", port), config) as httpd:
+        httpd.serve_forever()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class MockBinanceServer:
+    """Runs the mock API in a child process for the duration of a `with` block."""
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        port: Optional[int] = None,
+    ) -> None:
+        self.port = port or free_port()
+        self.base_url = f"http://127.0.0.1:{self.port}"
+        self._process = multiprocessing.Process(
+            target=serve,
+            args=(self.port, latency_ms, jitter_ms, error_rate),
+            daemon=True,
+        )
+
+    def __enter__(self) -> "MockBinanceServer":
+        self._process.start()
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", self.port), timeout=0.2).close()
+                return self
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise RuntimeError("mock Binance server did not start")
+                time.sleep(0.05)
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._process.terminate()
+        self._process.join()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local mock Binance Futures REST API.")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    print(f"Mock Binance Futures API on http://127.0.0.1:{args.port}")
+    serve(args.port, args.latency_ms, args.jitter_ms, args.error_rate)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Local stand-in for the Binance Futures user data stream WebSocket.
+
+Accepts connections on `/ws/<listenKey>` and broadcasts whatever events are
+pushed to every connected client; `drop()` closes all connections to
+exercise reconnects. Runs on the caller's event loop:
+
+    async with MockUserStream() as stream:
+        user_stream = UserDataStream(client, stream_url=stream.url)
+        await stream.push(order_trade_update(order_id=1, status="FILLED"))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from typing import Any, Dict, Optional, Set
+
+import websockets
+
+
+def order_trade_update(
+    order_id: int,
+    status: str,
+    symbol: str = "BTCUSDT",
+    side: str = "BUY",
+    executed_qty: str = "0",
+    event_time: Optional[int] = None,
+) -> Dict[str, Any]:
+    """An `ORDER_TRADE_UPDATE` event shaped like Binance's."""
+    now = event_time if event_time is not None else int(time.time() * 1000)
+    return {
+        "e": "ORDER_TRADE_UPDATE",
+        "E": now,
+        "T": now,
+        "o": {
+            "s": symbol,
+            "c": f"mock-{order_id}",
+            "S": side,
+            "o": "LIMIT",
+            "f": "GTC",
+            "q": "0.010",
+            "p": "65000.1",
+            "ap": "0",
+            "sp": "0",
+            "x": "TRADE" if status in ("PARTIALLY_FILLED", "FILLED") else status,
+            "X": status,
+            "i": order_id,
+            "l": "0",
+            "z": executed_qty,
+            "L": "0",
+            "T": now,
+            "t": 0,
+            "b": "0",
+            "a": "0",
+            "m": False,
+            "R": False,
+            "wt": "CONTRACT_PRICE",
+            "ot": "LIMIT",
+            "ps": "BOTH",
+            "cp": False,
+            "rp": "0",
+        },
+    }
+
+
+class MockUserStream:
+    """WebSocket server pushing user data stream events to its clients."""
+
+    def __init__(self) -> None:
+        self._server: Any = None
+        self._clients: Set[Any] = set()
+        self.connections = 0
+
+    @property
+    def url(self) -> str:
+        port = self._server.sockets[0].getsockname()[1]
+        return f"ws://127.0.0.1:{port}/ws"
+
+    async def _handle(self, ws: Any) -> None:
+        self.connections += 1
+        self._clients.add(ws)
+        try:
+            await ws.wait_closed()
+        finally:
+            self._clients.discard(ws)
+
+    async def wait_for_clients(self, count: int = 1, timeout: float = 5.0) -> None:
+        deadline = time.monotonic() + timeout
+        while len(self._clients) < count:
+            if time.monotonic() > deadline:
+                raise TimeoutError("no user data stream client connected")
+            await asyncio.sleep(0.01)
+
+    async def push(self, event: Dict[str, Any]) -> None:
+        message = json.dumps(event, separators=(",", ":"))
+        for ws in list(self._clients):
+            await ws.send(message)
+
+    async def drop(self) -> None:
+        """Close every client connection, as Binance does after 24h."""
+        for ws in list(self._clients):
+            await ws.close()
+
+    async def __aenter__(self) -> "MockUserStream":
+        self._server = await websockets.serve(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._server.close()
+        await self._server.wait_closed()
@@ -0,0 +1,155 @@
+"""
+Local stand-in for the Binance Futures WebSocket API (ws-fapi).
+
+Answers `order.place` and `order.cancel` requests (`{"id", "method",
+"params"}` frames, each HMAC-signed with `apiKey` and `signature` in its
+params) with Binance-shaped responses, after the same configurable latency
+and jitter as `benchmarks.mock_server`. Requests on one connection are
+handled concurrently, so pipelined requests overlap as they do on Binance.
+
+Runs in a separate process so its CPU time does not pollute client
+measurements:
+
+    with MockWsApiServer(latency_ms=1.0) as server:
+        client = BinanceWsApiClient(MOCK_API_KEY, MOCK_API_SECRET, ws_url=server.url)
+
+or standalone: `python -m benchmarks.mock_ws_api --port 8082`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import hmac
+import json
+import multiprocessing
+import random
+import socket
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import websockets
+
+from benchmarks.mock_server import MOCK_API_KEY, MOCK_API_SECRET, MockOrderStore, free_port
+
+WS_API_PATH = "/ws-fapi/v1"
+
+# Reported with every response, as Binance does
+_RATE_LIMITS = [
+    {
+        "rateLimitType": "REQUEST_WEIGHT",
+        "interval": "MINUTE",
+        "intervalNum": 1,
+        "limit": 2400,
+        "count": 1,
+    },
+]
+
+
+def _error(status: int, code: int, msg: str) -> Tuple[int, Dict[str, Any]]:
+    return status, {"error": {"code": code, "msg": msg}}
+
+
+class _WsApi:
+    def __init__(self, config: Dict[str, float]) -> None:
+        self.config = config
+        self.orders = MockOrderStore()
+
+    async def handle(self, ws: Any) -> None:
+        tasks = set()
+        async for message in ws:
+            task = asyncio.create_task(self._answer(ws, message))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+    async def _answer(self, ws: Any, message: Any) -> None:
+        try:
+            request = json.loads(message)
+            request_id = request["id"]
+        except (ValueError, TypeError, KeyError):
+            return
+        config = self.config
+        delay = config["latency_ms"] + random.uniform(0, config["jitter_ms"])
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        status, body = self._dispatch(request.get("method"), dict(request.get("params") or {}))
+        response = {"id": request_id, "status": status, **body, "rateLimits": _RATE_LIMITS}
+        try:
+            await ws.send(json.dumps(response))
+        except websockets.ConnectionClosed:
+            pass
+
+    def _dispatch(self, method: Any, params: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        signature = params.pop("signature", "")
+        if params.get("apiKey") != MOCK_API_KEY:
+            return _error(401, -2015, "Invalid API-key, IP, or permissions for action.")
+        # Signed payload: every other param, sorted by name, apiKey included
+        payload = "&".join(f"{k}={params[k]}" for k in sorted(params))
+        expected = hmac.new(MOCK_API_SECRET.encode(), payload.encode(), hashlib.sha256).hexdigest()
+        if not hmac.compare_digest(str(signature), expected):
+            return _error(400, -1022, "Signature for this request is not valid.")
+
+        params = {k: str(v) for k, v in params.items() if k != "apiKey"}
+        if method == "order.place":
+            return 200, {"result": self.orders.new_order(params)}
+        if method == "order.cancel":
+            order = self.orders.find_order(params)
+            canceled = self.orders.cancel_order(order) if order is not None else None
+            if canceled is None:
+                return _error(400, -2011, "Unknown order sent.")
+            return 200, {"result": canceled}
+        return _error(400, -1000, f"Unknown method {method}")
+
+
+async def _serve(port: int, config: Dict[str, float]) -> None:
+    api = _WsApi(config)
+    async with websockets.serve(api.handle, "127.0.0.1", port):
+        await asyncio.Future()
+
+
+def serve(port: int, latency_ms: float, jitter_ms: float) -> None:
+    asyncio.run(_serve(port, {"latency_ms": latency_ms, "jitter_ms": jitter_ms}))
+
+
+class MockWsApiServer:
+    """Runs the mock WebSocket API in a child process for the duration of a `with` block."""
+
+    def __init__(
+        self, latency_ms: float = 0.0, jitter_ms: float = 0.0, port: Optional[int] = None
+    ) -> None:
+        self.port = port or free_port()
+        self.url = f"ws://127.0.0.1:{self.port}{WS_API_PATH}"
+        self._process = multiprocessing.Process(
+            target=serve, args=(self.port, latency_ms, jitter_ms), daemon=True
+        )
+
+    def __enter__(self) -> "MockWsApiServer":
+        self._process.start()
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", self.port), timeout=0.2).close()
+                return self
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise RuntimeError("mock WebSocket API server did not start")
+                time.sleep(0.05)
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._process.terminate()
+        self._process.join()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local mock Binance Futures WebSocket API.")
+    parser.add_argument("--port", type=int, default=8082)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    print(f"Mock Binance Futures WebSocket API on ws://127.0.0.1:{args.port}{WS_API_PATH}")
+    serve(args.port, args.latency_ms, args.jitter_ms)
+
+
+if __name__ == "__main__":
+    main()
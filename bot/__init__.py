@@ -3,6 +3,8 @@ Binance Futures Testnet trading bot package.
 
 This package provides:
 - `BinanceFuturesClient` for interacting with the Binance Futures Testnet REST API
+- `AsyncBinanceFuturesClient`, an asyncio-native variant for concurrent order submission
+- `BinanceWsApiClient`, order entry over the persistent WebSocket API connection
 - order placement helpers
 - input validation utilities
 - logging configuration
@@ -0,0 +1,505 @@
+"""
+Asyncio-native Binance Futures Testnet REST client.
+
+Shares signing, order parameter building and error mapping with
+`BinanceFuturesClient`, but runs on `httpx.AsyncClient` so many orders can be
+in flight at once, e.g. with `asyncio.gather`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import httpx
+
+from .client import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    ORDER_DOES_NOT_EXIST,
+    TESTNET_BASE_URL,
+    TIMESTAMP_OUTSIDE_RECV_WINDOW,
+    BatchOrderOutcome,
+    BinanceApiError,
+    BinanceNetworkError,
+    Numeric,
+    OrderResult,
+    RequoteResult,
+    _FuturesClientBase,
+)
+from .exchange_info import ExchangeInfoCache
+from .metrics import ClientMetrics
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy, new_client_order_id
+from .time_sync import ServerClock
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBinanceFuturesClient(_FuturesClientBase):
+    """
+    Async counterpart of `BinanceFuturesClient`.
+
+    `max_connections` bounds how many requests share the connection pool at
+    once; requests beyond it wait for a free connection instead of failing.
+    `keepalive_expiry` and `http2` configure the pool as on the sync client;
+    `warm_up` and `start_keepalive` are its coroutine counterparts.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        base_url: str = TESTNET_BASE_URL,
+        recv_window: int = 5_000,
+        timeout: float = 10.0,
+        max_connections: int = 100,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        exchange_info: Optional[ExchangeInfoCache] = None,
+        metrics: Optional[ClientMetrics] = None,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+    ) -> None:
+        super().__init__(
+            api_key,
+            api_secret,
+            base_url=base_url,
+            recv_window=recv_window,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            exchange_info=exchange_info,
+            metrics=metrics,
+        )
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            headers={"X-MBX-APIKEY": api_key},
+            limits=self._pool_limits(max_connections, keepalive_expiry),
+            http2=http2,
+            event_hooks={"request": [self._mark_sent]},
+        )
+        self._time_sync_task: Optional[asyncio.Task] = None
+        self._keepalive_task: Optional[asyncio.Task] = None
+
+    def _trace_extensions(self) -> Optional[Dict[str, Any]]:
+        """httpx request extensions timing connection setup, if metrics are on."""
+        if self.metrics is None:
+            return None
+        trace = self._connection_tracer()
+
+        # httpx's async transport awaits the trace callback.
+        async def async_trace(event_name: str, info: Dict[str, Any]) -> None:
+            trace(event_name, info)
+
+        return {"trace": async_trace}
+
+    async def _mark_sent(self, request: httpx.Request) -> None:
+        self._last_sent = time.monotonic()
+
+    async def _public_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        weight: int = 1,
+    ) -> Any:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(weight=weight)
+
+        url = f"{self.base_url}{path}"
+        log_fields: Dict[str, Any] = {"method": method, "path": path}
+        logger.info(
+            "Sending request to Binance: %s %s params=%s",
+            method,
+            url,
+            params,
+            extra={"event": "request", "params": params, **log_fields},
+        )
+
+        try:
+            start = time.perf_counter()
+            resp = await self._client.request(
+                method.upper(), url, params=params, extensions=self._trace_extensions()
+            )
+        except httpx.HTTPError as exc:
+            logger.exception("Network error during Binance request: %s", exc, extra=log_fields)
+            if self.metrics is not None:
+                self.metrics.count_error(path, "network")
+            raise BinanceNetworkError(str(exc)) from exc
+        log_fields["latency_ms"] = (time.perf_counter() - start) * 1000
+
+        return self._handle_response(resp, log_fields)
+
+    async def ping(self) -> None:
+        """Test connectivity (weight 1); also keeps an idle pooled connection open."""
+        await self._public_request("GET", "/fapi/v1/ping")
+
+    async def warm_up(self, connections: int = 1) -> None:
+        """Open `connections` pooled connections with concurrent pings."""
+        await asyncio.gather(*(self.ping() for _ in range(connections)))
+
+    async def start_keepalive(self, interval: float = 10.0) -> None:
+        """Ping whenever the client has been idle for `interval` seconds."""
+        if self._keepalive_task is None:
+            self._keepalive_task = asyncio.create_task(self._keepalive_loop(interval))
+
+    async def _keepalive_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(self._keepalive_due(interval))
+            if self._keepalive_due(interval):
+                continue  # A request went out while sleeping
+            try:
+                await self.ping()
+            except (BinanceApiError, BinanceNetworkError) as exc:
+                logger.warning("Keep-alive ping failed: %s", exc)
+
+    async def get_server_time(self) -> int:
+        """Return the Binance server time in milliseconds."""
+        return int((await self._public_request("GET", "/fapi/v1/time"))["serverTime"])
+
+    async def get_exchange_info(self) -> Dict[str, Any]:
+        """Return `/fapi/v1/exchangeInfo` (rate limits and symbol rules)."""
+        return await self._public_request("GET", "/fapi/v1/exchangeInfo")
+
+    async def configure_rate_limits(self) -> None:
+        """Seed the rate limiter with the account's limits from exchangeInfo."""
+        if self.rate_limiter is None:
+            self.rate_limiter = RateLimiter()
+        self.rate_limiter.configure((await self.get_exchange_info())["rateLimits"])
+        self._attach_metric_sources()
+
+    async def get_depth(self, symbol: str, limit: int = 1000) -> Dict[str, Any]:
+        """
+        Order book snapshot of `symbol` with `limit` levels per side.
+
+        Returns the raw payload: `lastUpdateId` and `bids`/`asks` as
+        `[price, qty]` string pairs, best first.
+        """
+        params, weight = self._depth_params(symbol, limit)
+        return await self._public_request("GET", "/fapi/v1/depth", params=params, weight=weight)
+
+    async def create_listen_key(self) -> str:
+        """Start the user data stream (or extend the active one); returns its listenKey."""
+        return (await self._public_request("POST", "/fapi/v1/listenKey"))["listenKey"]
+
+    async def keepalive_listen_key(self) -> None:
+        """Extend the active listenKey by 60 minutes."""
+        await self._public_request("PUT", "/fapi/v1/listenKey")
+
+    async def close_listen_key(self) -> None:
+        """Close the user data stream."""
+        await self._public_request("DELETE", "/fapi/v1/listenKey")
+
+    async def sync_time(self, samples: int = 4) -> None:
+        """Sample the server clock and stamp signed requests with its time from now on."""
+        if self.clock is None:
+            self.clock = ServerClock()
+            self._attach_metric_sources()
+        for _ in range(samples):
+            local_send = time.time() * 1000
+            server = await self.get_server_time()
+            self.clock.add_sample(local_send, server, time.time() * 1000)
+
+    async def start_time_sync(self, interval: float = 60.0) -> None:
+        """Sync the server clock now and keep refreshing it every `interval` seconds."""
+        await self.sync_time()
+        if self._time_sync_task is None:
+            self._time_sync_task = asyncio.create_task(self._time_sync_loop(interval))
+
+    async def _time_sync_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.sync_time(samples=1)
+            except (BinanceApiError, BinanceNetworkError):
+                logger.exception("Server time refresh failed")
+
+    async def _signed_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        weight: int = 1,
+        orders: int = 0,
+    ) -> Dict[str, Any]:
+        try:
+            return await self._send_signed(method, path, params, weight, orders)
+        except BinanceApiError as exc:
+            if exc.code != TIMESTAMP_OUTSIDE_RECV_WINDOW or self.clock is None:
+                raise
+            # Rejected before processing: safe to resync and send once more
+            logger.warning("Timestamp rejected by Binance; resyncing server clock")
+            self.clock.clear()
+            await self.sync_time()
+            return await self._send_signed(method, path, params, weight, orders)
+
+    async def _send_signed(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        weight: int,
+        orders: int,
+    ) -> Dict[str, Any]:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(weight=weight, orders=orders)
+
+        query_string, query_string_with_sig = self._build_signed_query(params)
+
+        url = f"{self.base_url}{path}"
+        log_fields: Dict[str, Any] = {
+            "method": method,
+            "path": path,
+            "symbol": params.get("symbol") if params else None,
+        }
+
+        # Log request (without secret, signature)
+        logger.info(
+            "Sending request to Binance: %s %s?%s",
+            method,
+            url,
+            query_string,
+            extra={"event": "request", "params": params, **log_fields},
+        )
+
+        try:
+            start = time.perf_counter()
+            resp = await self._client.request(
+                method.upper(),
+                f"{url}?{query_string_with_sig}",
+                extensions=self._trace_extensions(),
+            )
+        except httpx.HTTPError as exc:
+            logger.exception("Network error during Binance request: %s", exc, extra=log_fields)
+            if self.metrics is not None:
+                self.metrics.count_error(path, "network")
+            raise BinanceNetworkError(str(exc)) from exc
+        log_fields["latency_ms"] = (time.perf_counter() - start) * 1000
+
+        return self._handle_response(resp, log_fields)
+
+    async def place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: Numeric,
+        price: Optional[Numeric] = None,
+        stop_price: Optional[Numeric] = None,
+        time_in_force: Optional[str] = None,
+        client_order_id: Optional[str] = None,
+    ) -> OrderResult:
+        """
+        Place a MARKET, LIMIT, or STOP_LIMIT order on Binance Futures.
+
+        Accepts the same arguments, returns the same `OrderResult` and applies
+        the same retry policy as `BinanceFuturesClient.place_order`.
+        """
+        if client_order_id is None and self.retry_policy is not None:
+            client_order_id = new_client_order_id()
+        params = self._build_order_params(
+            symbol, side, order_type, quantity, price, stop_price, time_in_force, client_order_id
+        )
+
+        retry = self._order_retry(client_order_id)
+        while True:
+            try:
+                if retry.lookup_pending:
+                    existing = retry.looked_up(
+                        await self._find_order(params["symbol"], client_order_id)
+                    )
+                    if existing is not None:
+                        return existing
+                data = await self._signed_request(
+                    "POST", "/fapi/v1/order", params=params, weight=0, orders=1
+                )
+                return self._order_result_from_data(data)
+            except (BinanceApiError, BinanceNetworkError) as exc:
+                delay = retry.next_delay(exc)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+
+    async def get_order(
+        self,
+        symbol: str,
+        order_id: Optional[int] = None,
+        orig_client_order_id: Optional[str] = None,
+    ) -> OrderResult:
+        """Query an order by exchange order id or client order id."""
+        params = self._order_lookup_params(symbol, order_id, orig_client_order_id)
+        data = await self._signed_request("GET", "/fapi/v1/order", params=params)
+        return self._order_result_from_data(data)
+
+    async def _find_order(self, symbol: str, client_order_id: str) -> Optional[OrderResult]:
+        try:
+            return await self.get_order(symbol, orig_client_order_id=client_order_id)
+        except BinanceApiError as exc:
+            if exc.code == ORDER_DOES_NOT_EXIST:
+                return None
+            raise
+
+    async def place_batch_orders(
+        self, orders: Sequence[Mapping[str, Any]]
+    ) -> List[BatchOrderOutcome]:
+        """
+        Place many orders through `/fapi/v1/batchOrders`.
+
+        Same chunking and per-order results as
+        `BinanceFuturesClient.place_batch_orders`; all chunks are sent at once.
+        """
+        chunks = self._chunk_batch_orders(orders)
+        chunk_outcomes = await asyncio.gather(
+            *(self._place_batch_chunk(chunk) for chunk in chunks)
+        )
+        return [outcome for outcomes in chunk_outcomes for outcome in outcomes]
+
+    async def _place_batch_chunk(
+        self, chunk: List[Dict[str, str]]
+    ) -> List[BatchOrderOutcome]:
+        try:
+            data = await self._signed_request(
+                "POST",
+                "/fapi/v1/batchOrders",
+                params=self._batch_params(chunk),
+                weight=5,
+                orders=len(chunk),
+            )
+        except (BinanceApiError, BinanceNetworkError) as exc:
+            return [exc] * len(chunk)
+        return self._batch_outcomes(200, data)
+
+    async def get_open_orders(self, symbol: Optional[str] = None) -> List[OrderResult]:
+        """All open orders, or those on `symbol` (weight 1 instead of 40)."""
+        params = {"symbol": symbol.upper()} if symbol else None
+        data = await self._signed_request(
+            "GET", "/fapi/v1/openOrders", params=params, weight=1 if symbol else 40
+        )
+        return [self._order_result_from_data(item) for item in data]
+
+    async def cancel_order(
+        self,
+        symbol: str,
+        order_id: Optional[int] = None,
+        orig_client_order_id: Optional[str] = None,
+    ) -> OrderResult:
+        """Cancel an open order by exchange order id or client order id."""
+        params = self._order_lookup_params(symbol, order_id, orig_client_order_id)
+        data = await self._signed_request("DELETE", "/fapi/v1/order", params=params)
+        return self._order_result_from_data(data)
+
+    async def cancel_all_open_orders(self, symbol: str) -> Dict[str, Any]:
+        """
+        Cancel every open order on `symbol`; returns Binance's acknowledgement.
+
+        With an `order_tracker` set, the symbol's tracked open orders are
+        resynced afterwards, as by `BinanceFuturesClient.cancel_all_open_orders`.
+        """
+        ack = await self._signed_request(
+            "DELETE", "/fapi/v1/allOpenOrders", params={"symbol": symbol.upper()}
+        )
+        if self.order_tracker is not None:
+            await self._resync_open_orders(symbol)
+        return ack
+
+    async def _resync_open_orders(self, symbol: str) -> None:
+        tracked = self._tracked_open_ids(symbol)
+        try:
+            still_open = {order.order_id for order in await self.get_open_orders(symbol)}
+        except (BinanceApiError, BinanceNetworkError) as exc:
+            logger.warning("Could not resync tracked %s orders: %s", symbol.upper(), exc)
+            return
+        gone = list(tracked - still_open)
+        outcomes = await asyncio.gather(
+            *(self.get_order(symbol, order_id=order_id) for order_id in gone),
+            return_exceptions=True,
+        )
+        for order_id, outcome in zip(gone, outcomes):
+            if isinstance(outcome, (BinanceApiError, BinanceNetworkError)):
+                self._log_resync_failure(symbol, order_id, outcome)
+            elif isinstance(outcome, BaseException):
+                raise outcome
+
+    async def cancel_batch_orders(
+        self,
+        symbol: str,
+        order_ids: Optional[Sequence[int]] = None,
+        orig_client_order_ids: Optional[Sequence[str]] = None,
+    ) -> List[BatchOrderOutcome]:
+        """
+        Cancel many orders on `symbol` through `DELETE /fapi/v1/batchOrders`.
+
+        Same chunking and per-order results as
+        `BinanceFuturesClient.cancel_batch_orders`; all chunks are sent at once.
+        """
+        key, chunks = self._chunk_batch_cancels(order_ids, orig_client_order_ids)
+        chunk_outcomes = await asyncio.gather(
+            *(self._cancel_batch_chunk(symbol, key, chunk) for chunk in chunks)
+        )
+        return [outcome for outcomes in chunk_outcomes for outcome in outcomes]
+
+    async def _cancel_batch_chunk(
+        self, symbol: str, key: str, chunk: List[Any]
+    ) -> List[BatchOrderOutcome]:
+        try:
+            params = self._batch_cancel_params(symbol, key, chunk)
+            data = await self._signed_request("DELETE", "/fapi/v1/batchOrders", params=params)
+        except (BinanceApiError, BinanceNetworkError) as exc:
+            return [exc] * len(chunk)
+        return self._batch_outcomes(200, data)
+
+    async def requote(
+        self,
+        symbol: str,
+        side: str,
+        quantity: Numeric,
+        price: Numeric,
+        order_id: Optional[int] = None,
+        orig_client_order_id: Optional[str] = None,
+        time_in_force: Optional[str] = None,
+        client_order_id: Optional[str] = None,
+    ) -> RequoteResult:
+        """
+        Replace a resting order with a new LIMIT order at `price`.
+
+        Same semantics as `BinanceFuturesClient.requote`: the new order is
+        only placed once the old one is known to be gone.
+        """
+        cancel_params = self._order_lookup_params(symbol, order_id, orig_client_order_id)
+        place_params = self._build_order_params(
+            symbol, side, "LIMIT", quantity, price, None, time_in_force, client_order_id
+        )
+
+        start = time.perf_counter()
+        canceled: BatchOrderOutcome
+        try:
+            canceled = self._order_result_from_data(
+                await self._signed_request("DELETE", "/fapi/v1/order", params=cancel_params)
+            )
+        except (BinanceApiError, BinanceNetworkError) as exc:
+            canceled = exc
+            if not self._order_already_gone(exc):
+                return RequoteResult(canceled, None)
+
+        placed: BatchOrderOutcome
+        try:
+            placed = self._order_result_from_data(
+                await self._signed_request(
+                    "POST", "/fapi/v1/order", params=place_params, weight=0, orders=1
+                )
+            )
+        except (BinanceApiError, BinanceNetworkError) as exc:
+            placed = exc
+        if self.metrics is not None:
+            self.metrics.observe("requote", "/fapi/v1/order", time.perf_counter() - start)
+        return RequoteResult(canceled, placed)
+
+    async def close(self) -> None:
+        if self._time_sync_task is not None:
+            self._time_sync_task.cancel()
+            self._time_sync_task = None
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+        await self._client.aclose()
@@ -8,20 +8,52 @@ https://testnet.binancefuture.com
 
 from __future__ import annotations
 
-import hashlib
-import hmac
+import json
 import logging
+import sys
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError, dataclass
+from decimal import ROUND_DOWN, ROUND_UP, Decimal
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Union
 
 import httpx
 
+from .decoding import dumps, loads
+from .exchange_info import ExchangeInfoCache
+from .logging_config import ResponseLogPolicy, get_response_log_policy
+from .metrics import ClientMetrics
+from .order_tracker import OrderTracker
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy, is_retryable, new_client_order_id
+from .signing import RequestSigner
+from .time_sync import ServerClock
+from .validators import round_to_step, to_decimal
+
 logger = logging.getLogger(__name__)
 
 
 TESTNET_BASE_URL = "https://testnet.binancefuture.com"
 
+# Binance error code for a timestamp outside recvWindow
+TIMESTAMP_OUTSIDE_RECV_WINDOW = -1021
+# Binance error code for an order lookup that matches no order
+ORDER_DOES_NOT_EXIST = -2013
+# Binance error code for cancelling an order that is unknown or no longer open
+CANCEL_REJECTED = -2011
+
+# /fapi/v1/batchOrders accepts at most this many orders per request
+MAX_BATCH_ORDERS = 5
+# ...and cancels at most this many orders per DELETE request
+MAX_BATCH_CANCELS = 10
+# /fapi/v1/depth request weight by `limit` (up to and including the key)
+DEPTH_WEIGHTS = ((50, 2), (100, 5), (500, 10), (1000, 20))
+
+# Seconds an idle pooled connection is kept open (httpx defaults to 5s, so a
+# pause of a few seconds between orders costs a new TCP + TLS handshake)
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
 
 class BinanceApiError(Exception):
     """Represents an error response from the Binance API."""
@@ -37,21 +69,217 @@ class BinanceNetworkError(Exception):
     """Represents a network/transport error talking to Binance."""
 
 
-@dataclass
+# Order quantities and prices: Decimal end to end; floats are still accepted
+Numeric = Union[Decimal, float]
+
+
+def _format_number(value: Any) -> str:
+    # Decimal's str() switches to exponent notation for small values (1E-7)
+    if isinstance(value, Decimal):
+        return format(value, "f")
+    return str(value)
+
+
+# Marks an OrderResult field that is parsed from `raw` on first access
+_UNPARSED: Any = object()
+
+# How much of each order response an OrderResult keeps (see `OrderResult.from_data`)
+RAW_RETENTION_MODES = ("full", "compact", "off")
+
+
 class OrderResult:
+    """
+    Immutable summary of an order response.
+
+    Slotted to keep large in-memory histories (reconciliation) small. `raw`
+    is the response body as a dict, or None when it was not retained; with
+    compact retention it is stored as JSON bytes and decoded on each access.
+    `avg_price` is read from the retained body on first access.
+    """
+
+    __slots__ = ("order_id", "status", "executed_qty", "_avg_price", "_raw")
+
     order_id: int
     status: str
     executed_qty: str
-    avg_price: Optional[str]
-    raw: Dict[str, Any]
+
+    def __init__(
+        self,
+        order_id: int,
+        status: str,
+        executed_qty: str,
+        avg_price: Optional[str] = None,
+        raw: Union[Dict[str, Any], bytes, None] = None,
+    ) -> None:
+        object.__setattr__(self, "order_id", order_id)
+        object.__setattr__(self, "status", status)
+        object.__setattr__(self, "executed_qty", executed_qty)
+        object.__setattr__(self, "_avg_price", avg_price)
+        object.__setattr__(self, "_raw", raw)
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any], raw_retention: str = "full") -> "OrderResult":
+        """
+        Build from a decoded order response.
+
+        `raw_retention` is "full" (keep the dict), "compact" (keep it
+        re-encoded as JSON bytes, about a third of the memory) or "off".
+        """
+        # Runs once per order response; orjson already yields int/str values,
+        # so the conversions are only paid for unexpected types.
+        order_id = data["orderId"]
+        if type(order_id) is not int:
+            order_id = int(order_id)
+        # Statuses repeat across results; share one string per value.
+        status = sys.intern(data.get("status", "UNKNOWN"))
+        executed_qty = data.get("executedQty", "0")
+
+        if raw_retention == "full":
+            return cls(order_id, status, executed_qty, _UNPARSED, data)
+        if raw_retention == "compact":
+            # Copy to an exact-size buffer; orjson's output keeps its spare capacity.
+            return cls(order_id, status, executed_qty, _UNPARSED, bytes(memoryview(dumps(data))))
+        if raw_retention == "off":
+            return cls(order_id, status, executed_qty, _avg_price_from(data), None)
+        raise ValueError(
+            f"Unknown raw retention mode {raw_retention!r}; expected one of {RAW_RETENTION_MODES}"
+        )
+
+    @property
+    def avg_price(self) -> Optional[str]:
+        avg_price = self._avg_price
+        if avg_price is _UNPARSED:
+            avg_price = _avg_price_from(self.raw or {})
+            object.__setattr__(self, "_avg_price", avg_price)
+        return avg_price
+
+    @property
+    def raw(self) -> Optional[Dict[str, Any]]:
+        raw = self._raw
+        if isinstance(raw, bytes):
+            return loads(raw)
+        return raw
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, OrderResult):
+            return NotImplemented
+        return (self.order_id, self.status, self.executed_qty, self.avg_price) == (
+            other.order_id,
+            other.status,
+            other.executed_qty,
+            other.avg_price,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.order_id, self.status, self.executed_qty))
+
+    def __repr__(self) -> str:
+        return (
+            f"OrderResult(order_id={self.order_id!r}, status={self.status!r}, "
+            f"executed_qty={self.executed_qty!r}, avg_price={self.avg_price!r})"
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        fields = (self.order_id, self.status, self.executed_qty, self.avg_price, self._raw)
+        return (OrderResult, fields)
+
+
+def _avg_price_from(data: Dict[str, Any]) -> Optional[str]:
+    avg_price = data.get("avgPrice")
+    if avg_price is None or type(avg_price) is str:
+        return avg_price
+    return str(avg_price)
 
 
-class BinanceFuturesClient:
+# httpx trace events (without ".started"/".complete") recorded as latency stages
+_TRACED_STAGES = {
+    "connection.connect_tcp": "connect",
+    "connection.start_tls": "tls",
+    "http11.receive_response_headers": "ttfb",
+    "http2.receive_response_headers": "ttfb",
+}
+# ...and those marking a request written to a (new or reused) connection
+_REQUEST_SENT_EVENTS = ("http11.send_request_headers", "http2.send_request_headers")
+
+# Per-order outcome of a batch placement: the placed order, or the error that
+# rejected it (a transport error fails every order of the affected chunk).
+BatchOrderOutcome = Union[OrderResult, BinanceApiError, BinanceNetworkError]
+
+
+@dataclass(frozen=True)
+class RequoteResult:
     """
-    Minimal Binance Futures client for placing orders on the testnet.
+    Outcome of a cancel-then-place requote.
 
-    It uses signed requests for trading endpoints and logs requests and responses
-    (excluding sensitive secrets).
+    Each leg holds the resulting order or the error that rejected it;
+    `placed` is None when the new order was not sent because the cancel
+    failed with the old order possibly still resting.
+    """
+
+    canceled: BatchOrderOutcome
+    placed: Optional[BatchOrderOutcome]
+
+
+class _OrderRetry:
+    """
+    Retry decisions for one `place_order` call, shared by the sync and async
+    clients, which only send the requests and sleep for the returned delays.
+
+    A failed attempt may still have reached the matching engine, so after a
+    retryable failure the order is looked up by its client id and resubmitted
+    only once Binance definitely has no such order. A lookup that fails
+    leaves that unknown; it is retried and uses up an attempt.
+    """
+
+    __slots__ = ("client", "client_order_id", "attempt", "lookup_pending")
+
+    def __init__(self, client: "_FuturesClientBase", client_order_id: Optional[str]) -> None:
+        self.client = client
+        self.client_order_id = client_order_id
+        self.attempt = 1
+        # Whether the next step is a status lookup rather than a submission
+        self.lookup_pending = False
+
+    def next_delay(self, exc: Union[BinanceApiError, BinanceNetworkError]) -> Optional[float]:
+        """Backoff before retrying after `exc`, or None if it must be raised."""
+        policy = self.client.retry_policy
+        if policy is None or not is_retryable(exc) or self.attempt >= policy.max_attempts:
+            return None
+        if self.client.metrics is not None:
+            self.client.metrics.count_retry("/fapi/v1/order")
+        logger.warning(
+            "%s %s failed with %s; retrying (attempt %s of %s)",
+            "Status lookup of order" if self.lookup_pending else "Order",
+            self.client_order_id,
+            exc,
+            self.attempt + 1,
+            policy.max_attempts,
+        )
+        delay = policy.backoff(self.attempt)
+        self.attempt += 1
+        self.lookup_pending = True
+        return delay
+
+    def looked_up(self, existing: Optional[OrderResult]) -> Optional[OrderResult]:
+        """Record a lookup's answer; a found order is the call's result."""
+        self.lookup_pending = False
+        if existing is not None:
+            logger.info("Order %s was already placed; not resubmitting", self.client_order_id)
+        return existing
+
+
+class _FuturesClientBase:
+    """
+    Transport-independent parts of the Binance Futures clients.
+
+    Holds credentials and implements request signing, order parameter building
+    and response/error mapping so the sync and async clients behave identically.
     """
 
     def __init__(
@@ -60,86 +288,691 @@ class BinanceFuturesClient:
         api_secret: str,
         base_url: str = TESTNET_BASE_URL,
         recv_window: int = 5_000,
-        timeout: float = 10.0,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        exchange_info: Optional[ExchangeInfoCache] = None,
+        metrics: Optional[ClientMetrics] = None,
     ) -> None:
         self.api_key = api_key
         self.api_secret = api_secret.encode("utf-8")
         self.base_url = base_url.rstrip("/")
         self.recv_window = recv_window
-        self._client = httpx.Client(timeout=timeout)
+        # Server clock estimate; when set, signed requests are stamped with
+        # server time instead of the local clock.
+        self.clock: Optional[ServerClock] = None
+        # Optional, possibly shared, client-side limiter for request weight
+        # and order count budgets.
+        self.rate_limiter = rate_limiter
+        # When set, orders get a stable client order id and ambiguous failures
+        # are retried (see `bot.retry`).
+        self.retry_policy = retry_policy
+        # When set, order values are rendered with the symbol's precision.
+        self.exchange_info = exchange_info
+        # Response body sampling/truncation; None follows configure_logging.
+        self.response_log_policy: Optional[ResponseLogPolicy] = None
+        # How much of each order response OrderResult.raw keeps: "full",
+        # "compact" (JSON bytes) or "off".
+        self.raw_retention = "full"
+        # Records every order response for local status queries, if set.
+        self.order_tracker: Optional[OrderTracker] = None
+        # Latency histograms, error counts and gauges (see `bot.metrics`).
+        self.metrics = metrics
+        # time.monotonic() of the last request handed to the pool (or of
+        # construction), for keep-alive pings that only go out while idle.
+        self._last_sent = time.monotonic()
+        self._attach_metric_sources()
+
+    def _attach_metric_sources(self) -> None:
+        """Expose rate limiter and clock state through `metrics`, if enabled."""
+        if self.metrics is None:
+            return
+        if self.rate_limiter is not None:
+            self.metrics.register_gauges("rate_limit", self.rate_limiter.snapshot)
+        if self.clock is not None:
+            self.metrics.register_gauges("clock", self.clock.metrics)
+
+    @staticmethod
+    def _pool_limits(max_connections: int, keepalive_expiry: float) -> httpx.Limits:
+        """Connection pool limits; every connection may stay open while idle."""
+        return httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+
+    def _keepalive_due(self, interval: float) -> float:
+        """Seconds until a keep-alive ping is due; 0 if the client idled for `interval`."""
+        return max(interval - (time.monotonic() - self._last_sent), 0.0)
+
+    def _connection_tracer(self) -> Callable[[str, Dict[str, Any]], None]:
+        """httpx trace callback timing connect, TLS and time-to-first-byte."""
+        metrics = self.metrics
+        assert metrics is not None
+        host = self.base_url
+        started: Dict[str, float] = {}
+
+        def trace(event_name: str, info: Dict[str, Any]) -> None:
+            name, _, phase = event_name.rpartition(".")
+            if phase == "started":
+                started[name] = time.perf_counter()
+            elif phase == "complete" and name in _TRACED_STAGES:
+                begin = started.pop(name, None)
+                if begin is not None:
+                    metrics.observe(_TRACED_STAGES[name], host, time.perf_counter() - begin)
+                if name == "connection.connect_tcp":
+                    metrics.increment(f"connections_opened:{host}")
+            elif phase == "complete" and name in _REQUEST_SENT_EVENTS:
+                metrics.increment(f"requests_sent:{host}")
+
+        return trace
+
+    @property
+    def recv_window(self) -> int:
+        return self._recv_window
+
+    @recv_window.setter
+    def recv_window(self, value: int) -> None:
+        self._recv_window = value
+        self._signer = RequestSigner(self.api_secret, value)
 
     def _sign(self, query_string: str) -> str:
-        return hmac.new(self.api_secret, query_string.encode("utf-8"), hashlib.sha256).hexdigest()
+        return self._signer.sign(query_string)
 
-    def _signed_request(
+    def _timestamp(self) -> int:
+        clock = self.clock
+        return clock.now_ms() if clock is not None else int(time.time() * 1000)
+
+    def _stamp(self, params: Dict[str, Any]) -> None:
+        """Add the timing parameters every signed request carries."""
+        params["timestamp"] = self._timestamp()
+        params["recvWindow"] = self.recv_window
+
+    def _build_signed_query(self, params: Optional[Dict[str, Any]]) -> Tuple[str, str]:
+        """
+        Stamp and sign request parameters.
+
+        Returns the unsigned query string (safe to log) and the query string
+        with the signature appended (what is actually sent).
+        """
+        return self._signer.build(params or {}, self._timestamp())
+
+    def _handle_response(
+        self, resp: httpx.Response, log_fields: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        if self.rate_limiter is not None:
+            self.rate_limiter.update_from_headers(resp.status_code, resp.headers)
+
+        metrics = self.metrics
+        path = log_fields.get("path") if log_fields else None
+        if metrics is not None and path is not None:
+            latency_ms = log_fields.get("latency_ms") if log_fields else None
+            if latency_ms is not None:
+                metrics.observe("request", path, latency_ms / 1000)
+            used_weight = resp.headers.get("X-MBX-USED-WEIGHT-1M")
+            if used_weight is not None:
+                metrics.set_gauge("used_weight_1m", float(used_weight))
+        decode_start = time.perf_counter()
+
+        error: Optional[BinanceApiError] = None
+        try:
+            data = loads(resp.content)
+        except ValueError:
+            # Non-JSON response
+            error = BinanceApiError(resp.status_code, None, f"Non-JSON response: {resp.text}")
+        else:
+            if resp.status_code >= 400:
+                code = data.get("code") if isinstance(data, dict) else None
+                msg = data.get("msg") if isinstance(data, dict) else resp.text
+                error = BinanceApiError(resp.status_code, code, msg)
+            elif isinstance(data, dict) and data.get("code", 0) not in (0, 200):
+                # Binance sometimes returns 200 with error code in JSON (and
+                # acknowledges some calls, e.g. cancel-all, with code 200)
+                error = BinanceApiError(resp.status_code, data.get("code"), data.get("msg", ""))
+        decode_s = time.perf_counter() - decode_start
+
+        # Rendering the body for the log is skipped entirely when INFO is off
+        # or the response is not sampled; error bodies, including HTTP 200s
+        # that carry an error code, are always logged in full.
+        is_error = error is not None
+        policy = self.response_log_policy or get_response_log_policy()
+        if logger.isEnabledFor(logging.INFO) and policy.should_log(path, is_error):
+            if is_error:
+                body = resp.text
+            else:
+                body = policy.render_body(resp.content, full=logger.isEnabledFor(logging.DEBUG))
+            logger.info(
+                "Received response from Binance: status=%s body=%s",
+                resp.status_code,
+                body,
+                extra={
+                    "event": "response",
+                    "status": resp.status_code,
+                    "weight": resp.headers.get("X-MBX-USED-WEIGHT-1M"),
+                    **(log_fields or {}),
+                },
+            )
+
+        if metrics is not None and path is not None:
+            metrics.observe("decode", path, decode_s)
+            if error is not None:
+                code = error.code if error.code is not None else error.status_code
+                metrics.count_error(path, code)
+        if error is not None:
+            raise error
+
+        return data
+
+    def _build_order_params(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: Numeric,
+        price: Optional[Numeric] = None,
+        stop_price: Optional[Numeric] = None,
+        time_in_force: Optional[str] = None,
+        client_order_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        symbol = symbol.upper()
+        side = side.upper()
+        order_type_upper = order_type.upper()
+        # Binance Futures uses type=STOP for stop-limit orders
+        binance_type = "STOP" if order_type_upper == "STOP_LIMIT" else order_type_upper
+
+        formatter = self.exchange_info.formatter(symbol) if self.exchange_info is not None else None
+        if formatter is not None:
+            format_price, format_quantity = formatter.price, formatter.quantity
+            # Onto the symbol's grid the way apply_symbol_filters rounds: never a
+            # larger or more aggressive order than requested
+            filters = formatter.filters
+            step = filters.market_step_size if binance_type == "MARKET" else filters.step_size
+            quantity = round_to_step(to_decimal(quantity), step, ROUND_DOWN)
+            tick, price_rounding = filters.tick_size, ROUND_DOWN if side == "BUY" else ROUND_UP
+            if price is not None:
+                price = round_to_step(to_decimal(price), tick, price_rounding)
+            if stop_price is not None:
+                stop_price = round_to_step(to_decimal(stop_price), tick, price_rounding)
+        else:
+            format_price = format_quantity = _format_number
+
+        params: Dict[str, Any] = {
+            "symbol": symbol,
+            "side": side,
+            "type": binance_type,
+            "quantity": format_quantity(quantity),
+        }
+
+        if order_type_upper == "LIMIT":
+            if price is None:
+                raise ValueError("price is required for LIMIT orders")
+            params["price"] = format_price(price)
+            params["timeInForce"] = time_in_force or "GTC"
+        elif order_type_upper == "STOP_LIMIT":
+            if price is None:
+                raise ValueError("price is required for STOP_LIMIT orders")
+            if stop_price is None:
+                raise ValueError("stop_price is required for STOP_LIMIT orders")
+            params["price"] = format_price(price)
+            params["stopPrice"] = format_price(stop_price)
+            params["timeInForce"] = time_in_force or "GTC"
+
+        if client_order_id is not None:
+            params["newClientOrderId"] = client_order_id
+
+        return params
+
+    @staticmethod
+    def _order_lookup_params(
+        symbol: str,
+        order_id: Optional[int] = None,
+        orig_client_order_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        if order_id is None and orig_client_order_id is None:
+            raise ValueError("order_id or orig_client_order_id is required")
+
+        params: Dict[str, Any] = {"symbol": symbol.upper()}
+        if order_id is not None:
+            params["orderId"] = order_id
+        if orig_client_order_id is not None:
+            params["origClientOrderId"] = orig_client_order_id
+        return params
+
+    @staticmethod
+    def _depth_params(symbol: str, limit: int) -> Tuple[Dict[str, Any], int]:
+        """`/fapi/v1/depth` params for `symbol` and the request's weight."""
+        for max_limit, weight in DEPTH_WEIGHTS:
+            if limit <= max_limit:
+                return {"symbol": symbol.upper(), "limit": limit}, weight
+        raise ValueError(f"depth limit must be at most {DEPTH_WEIGHTS[-1][0]}")
+
+    def _chunk_batch_orders(
+        self, orders: Sequence[Mapping[str, Any]]
+    ) -> List[List[Dict[str, str]]]:
+        """
+        Split orders into `/fapi/v1/batchOrders`-sized chunks.
+
+        Each entry of `orders` holds `place_order` keyword arguments.
+        """
+        batch_items = []
+        for order in orders:
+            params = self._build_order_params(**order)
+            # Orders inside batchOrders must carry their values as strings
+            batch_items.append({k: str(v) for k, v in params.items()})
+
+        return [
+            batch_items[i : i + MAX_BATCH_ORDERS]
+            for i in range(0, len(batch_items), MAX_BATCH_ORDERS)
+        ]
+
+    @staticmethod
+    def _batch_params(chunk: List[Dict[str, str]]) -> Dict[str, Any]:
+        return {"batchOrders": json.dumps(chunk, separators=(",", ":"))}
+
+    @staticmethod
+    def _chunk_batch_cancels(
+        order_ids: Optional[Sequence[int]] = None,
+        orig_client_order_ids: Optional[Sequence[str]] = None,
+    ) -> Tuple[str, List[List[Any]]]:
+        """Split the ids to cancel into `DELETE /fapi/v1/batchOrders`-sized chunks."""
+        if order_ids is not None and orig_client_order_ids is not None:
+            raise ValueError("pass either order_ids or orig_client_order_ids, not both")
+        if order_ids is not None:
+            key, ids = "orderIdList", list(order_ids)
+        elif orig_client_order_ids is not None:
+            key, ids = "origClientOrderIdList", list(orig_client_order_ids)
+        else:
+            raise ValueError("order_ids or orig_client_order_ids is required")
+        return key, [ids[i : i + MAX_BATCH_CANCELS] for i in range(0, len(ids), MAX_BATCH_CANCELS)]
+
+    @staticmethod
+    def _batch_cancel_params(symbol: str, key: str, chunk: List[Any]) -> Dict[str, Any]:
+        return {"symbol": symbol.upper(), key: json.dumps(chunk, separators=(",", ":"))}
+
+    @staticmethod
+    def _order_already_gone(exc: Union[BinanceApiError, BinanceNetworkError]) -> bool:
+        """Whether a requote may still place its new order after this cancel error."""
+        # The old order is gone (filled, expired or already canceled), so
+        # placing the new one cannot double the exposure.
+        return isinstance(exc, BinanceApiError) and exc.code in (
+            CANCEL_REJECTED,
+            ORDER_DOES_NOT_EXIST,
+        )
+
+    def _batch_outcomes(self, status_code: int, data: Any) -> List[BatchOrderOutcome]:
+        outcomes: List[BatchOrderOutcome] = []
+        for item in data:
+            if "orderId" in item:
+                outcomes.append(self._order_result_from_data(item))
+            else:
+                outcomes.append(BinanceApiError(status_code, item.get("code"), item.get("msg", "")))
+        return outcomes
+
+    def _tracked_open_ids(self, symbol: str) -> Set[int]:
+        assert self.order_tracker is not None
+        return {order.order_id for order in self.order_tracker.open_orders(symbol)}
+
+    def _order_retry(self, client_order_id: Optional[str]) -> _OrderRetry:
+        """Retry state of one `place_order` call; the subclasses only do the I/O."""
+        return _OrderRetry(self, client_order_id)
+
+    @staticmethod
+    def _log_resync_failure(
+        symbol: str, order_id: int, exc: Union[BinanceApiError, BinanceNetworkError]
+    ) -> None:
+        if isinstance(exc, BinanceApiError) and exc.code == ORDER_DOES_NOT_EXIST:
+            # Binance purges canceled/expired orders without fills.
+            logger.warning("Tracked order %s no longer exists on Binance", order_id)
+        else:
+            logger.warning(
+                "Could not resync tracked %s order %s: %s", symbol.upper(), order_id, exc
+            )
+
+    def _order_result_from_data(self, data: Dict[str, Any]) -> OrderResult:
+        if self.order_tracker is not None:
+            self.order_tracker.on_order_response(data)
+        return OrderResult.from_data(data, self.raw_retention)
+
+
+def decode_order(content: bytes, raw_retention: str = "full") -> OrderResult:
+    """Decode an order response body (place, query or cancel) into an `OrderResult`."""
+    return OrderResult.from_data(loads(content), raw_retention)
+
+
+def decode_orders(content: bytes, raw_retention: str = "full") -> List[OrderResult]:
+    """Decode a JSON array of orders, e.g. a `/fapi/v1/openOrders` response."""
+    from_data = OrderResult.from_data
+    return [from_data(item, raw_retention) for item in loads(content)]
+
+
+class BinanceFuturesClient(_FuturesClientBase):
+    """
+    Minimal Binance Futures client for placing orders on the testnet.
+
+    It uses signed requests for trading endpoints and logs requests and responses
+    (excluding sensitive secrets).
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        base_url: str = TESTNET_BASE_URL,
+        recv_window: int = 5_000,
+        timeout: float = 10.0,
+        time_sync: bool = False,
+        time_sync_interval: float = 60.0,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        exchange_info: Optional[ExchangeInfoCache] = None,
+        metrics: Optional[ClientMetrics] = None,
+        max_connections: int = 100,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        warm_up: int = 0,
+        keepalive_interval: Optional[float] = None,
+    ) -> None:
+        """
+        :param time_sync: track the server clock offset (see `ServerClock`),
+            refreshing it every `time_sync_interval` seconds in the background
+        :param rate_limiter: pace requests against Binance weight/order limits;
+            pass the same instance to every client sharing an IP or account
+        :param retry_policy: retry transport failures and unknown-execution
+            errors on `place_order` without risking duplicate orders
+        :param exchange_info: round and render order prices/quantities with
+            each symbol's tick/step sizes; call its `load()` at setup, as
+            orders encoded before then are sent as given
+        :param metrics: record latency histograms, error counts, retries and
+            used weight; one instance can be shared by several clients
+        :param max_connections: size of the connection pool
+        :param keepalive_expiry: seconds an idle pooled connection stays open
+        :param http2: multiplex requests over one HTTP/2 connection (needs the
+            `h2` package, `pip install httpx[http2]`)
+        :param warm_up: open this many connections now (see `warm_up`) so the
+            first orders skip DNS, TCP and TLS setup
+        :param keepalive_interval: ping `/fapi/v1/ping` after this many idle
+            seconds from a background thread (see `start_keepalive`)
+        """
+        super().__init__(
+            api_key,
+            api_secret,
+            base_url=base_url,
+            recv_window=recv_window,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            exchange_info=exchange_info,
+            metrics=metrics,
+        )
+        # The API key header is constant, so it is set once on the pool
+        self._client = httpx.Client(
+            timeout=timeout,
+            headers={"X-MBX-APIKEY": api_key},
+            limits=self._pool_limits(max_connections, keepalive_expiry),
+            http2=http2,
+            event_hooks={"request": [self._mark_sent]},
+        )
+        self._keepalive_stop = threading.Event()
+        self._keepalive_thread: Optional[threading.Thread] = None
+        try:
+            if warm_up:
+                self.warm_up(warm_up)
+            if keepalive_interval is not None:
+                self.start_keepalive(keepalive_interval)
+            if time_sync:
+                self.clock = ServerClock(self.get_server_time, refresh_interval=time_sync_interval)
+                self.clock.sync()
+                self.clock.start()
+                self._attach_metric_sources()
+        except BaseException:
+            # The caller never gets the client, so nothing else would close the pool
+            self.close()
+            raise
+
+    def _trace_extensions(self) -> Optional[Dict[str, Any]]:
+        """httpx request extensions timing connection setup, if metrics are on."""
+        if self.metrics is None:
+            return None
+        return {"trace": self._connection_tracer()}
+
+    def _mark_sent(self, request: httpx.Request) -> None:
+        self._last_sent = time.monotonic()
+
+    def _public_request(
         self,
         method: str,
         path: str,
         params: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
-        if params is None:
-            params = {}
-
-        params["timestamp"] = int(time.time() * 1000)
-        params["recvWindow"] = self.recv_window
+        weight: int = 1,
+    ) -> Any:
+        start = time.perf_counter()
+        resp = self._send_public(method, path, params, weight)
+        latency_ms = (time.perf_counter() - start) * 1000
+        return self._handle_response(
+            resp, {"method": method, "path": path, "latency_ms": latency_ms}
+        )
 
-        # Build query string in a stable order
-        query_items = [f"{k}={params[k]}" for k in sorted(params)]
-        query_string = "&".join(query_items)
-        signature = self._sign(query_string)
-        query_string_with_sig = f"{query_string}&signature={signature}"
+    def _send_public(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        weight: int = 1,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(weight=weight)
 
         url = f"{self.base_url}{path}"
-        headers = {"X-MBX-APIKEY": self.api_key}
-
-        # Log request (without secret, signature)
-        logger.info("Sending request to Binance: %s %s?%s", method, url, query_string)
+        logger.info(
+            "Sending request to Binance: %s %s params=%s",
+            method,
+            url,
+            params,
+            extra={"event": "request", "method": method, "path": path, "params": params},
+        )
 
         try:
-            if method.upper() == "GET":
-                resp = self._client.get(url, params=params, headers=headers)
-            else:
-                # For Binance Futures, signed trading endpoints accept query params
-                # so we keep them in the query string.
-                resp = self._client.request(
-                    method.upper(), f"{url}?{query_string_with_sig}", headers=headers
-                )
+            return self._client.request(
+                method.upper(),
+                url,
+                params=params,
+                headers=headers,
+                extensions=self._trace_extensions(),
+            )
         except httpx.HTTPError as exc:
             logger.exception("Network error during Binance request: %s", exc)
+            if self.metrics is not None:
+                self.metrics.count_error(path, "network")
             raise BinanceNetworkError(str(exc)) from exc
 
-        logger.info(
-            "Received response from Binance: status=%s body=%s",
-            resp.status_code,
-            resp.text,
+    def ping(self) -> None:
+        """Test connectivity (weight 1); also keeps an idle pooled connection open."""
+        self._public_request("GET", "/fapi/v1/ping")
+
+    def warm_up(self, connections: int = 1) -> None:
+        """
+        Open `connections` pooled connections with concurrent pings.
+
+        DNS, TCP and TLS setup then happen here instead of on the first
+        orders. Connections stay open for `keepalive_expiry` seconds of
+        idleness, or as long as `start_keepalive` pings are running.
+        """
+        if connections <= 1:
+            self.ping()
+            return
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            for future in [executor.submit(self.ping) for _ in range(connections)]:
+                future.result()
+
+    def start_keepalive(self, interval: float = 10.0) -> None:
+        """
+        Ping whenever the client has been idle for `interval` seconds, from a
+        daemon thread, so an order after a quiet period finds an open
+        connection. Each ping costs 1 request weight; keep `interval` below
+        `keepalive_expiry`. Only the most recently used connection is kept
+        warm.
+        """
+        if self._keepalive_thread is not None:
+            return
+        self._keepalive_stop.clear()
+        self._keepalive_thread = threading.Thread(
+            target=self._keepalive_loop, args=(interval,), name="binance-keepalive", daemon=True
         )
+        self._keepalive_thread.start()
+
+    def stop_keepalive(self) -> None:
+        self._keepalive_stop.set()
+        if self._keepalive_thread is not None:
+            self._keepalive_thread.join()
+            self._keepalive_thread = None
+
+    def _keepalive_loop(self, interval: float) -> None:
+        while not self._keepalive_stop.wait(self._keepalive_due(interval)):
+            if self._keepalive_due(interval):
+                continue  # A request went out while waiting
+            try:
+                self.ping()
+            except (BinanceApiError, BinanceNetworkError) as exc:
+                # The failed ping still counts as activity, so the next
+                # attempt comes one interval later.
+                logger.warning("Keep-alive ping failed: %s", exc)
 
+    def get_server_time(self) -> int:
+        """Return the Binance server time in milliseconds."""
+        return int(self._public_request("GET", "/fapi/v1/time")["serverTime"])
+
+    def get_exchange_info(self) -> Dict[str, Any]:
+        """Return `/fapi/v1/exchangeInfo` (rate limits and symbol rules)."""
+        return self._public_request("GET", "/fapi/v1/exchangeInfo")
+
+    def fetch_exchange_info(
+        self, etag: Optional[str] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Conditionally fetch exchangeInfo.
+
+        Returns `(None, etag)` when the server reports it unchanged since
+        `etag`, otherwise the fresh payload and its ETag (if any).
+        """
+        headers = {"If-None-Match": etag} if etag else None
+        resp = self._send_public("GET", "/fapi/v1/exchangeInfo", headers=headers)
+        if resp.status_code == 304:
+            logger.info("exchangeInfo not modified since ETag %s", etag)
+            return None, etag
+        data = self._handle_response(resp, {"method": "GET", "path": "/fapi/v1/exchangeInfo"})
+        return data, resp.headers.get("ETag")
+
+    def configure_rate_limits(self) -> None:
+        """Seed the rate limiter with the account's limits from exchangeInfo."""
+        if self.rate_limiter is None:
+            self.rate_limiter = RateLimiter()
+        self.rate_limiter.configure(self.get_exchange_info()["rateLimits"])
+        self._attach_metric_sources()
+
+    def get_depth(self, symbol: str, limit: int = 1000) -> Dict[str, Any]:
+        """
+        Order book snapshot of `symbol` with `limit` levels per side.
+
+        Returns the raw payload: `lastUpdateId` and `bids`/`asks` as
+        `[price, qty]` string pairs, best first.
+        """
+        params, weight = self._depth_params(symbol, limit)
+        return self._public_request("GET", "/fapi/v1/depth", params=params, weight=weight)
+
+    def create_listen_key(self) -> str:
+        """Start the user data stream (or extend the active one); returns its listenKey."""
+        return self._public_request("POST", "/fapi/v1/listenKey")["listenKey"]
+
+    def keepalive_listen_key(self) -> None:
+        """Extend the active listenKey by 60 minutes."""
+        self._public_request("PUT", "/fapi/v1/listenKey")
+
+    def close_listen_key(self) -> None:
+        """Close the user data stream."""
+        self._public_request("DELETE", "/fapi/v1/listenKey")
+
+    def _signed_request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        weight: int = 1,
+        orders: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        Send a signed request.
+
+        `weight` and `orders` are the request's cost against the IP weight
+        and order count limits, used when a rate limiter is configured.
+        """
         try:
-            data = resp.json()
-        except ValueError:
-            # Non-JSON response
-            raise BinanceApiError(resp.status_code, None, f"Non-JSON response: {resp.text}")
+            return self._send_signed(method, path, params, weight, orders)
+        except BinanceApiError as exc:
+            if exc.code != TIMESTAMP_OUTSIDE_RECV_WINDOW or self.clock is None:
+                raise
+            # The request was rejected before it was processed, so it is safe
+            # to resync the clock and send it once more.
+            logger.warning("Timestamp rejected by Binance; resyncing server clock")
+            self.clock.clear()
+            self.clock.sync()
+            return self._send_signed(method, path, params, weight, orders)
 
-        if resp.status_code >= 400:
-            code = data.get("code") if isinstance(data, dict) else None
-            msg = data.get("msg") if isinstance(data, dict) else resp.text
-            raise BinanceApiError(resp.status_code, code, msg)
+    def _send_signed(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        weight: int,
+        orders: int,
+    ) -> Dict[str, Any]:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(weight=weight, orders=orders)
 
-        if isinstance(data, dict) and "code" in data and data.get("code", 0) != 0:
-            # Binance sometimes returns 200 with error code in JSON
-            raise BinanceApiError(resp.status_code, data.get("code"), data.get("msg", ""))
+        query_string, query_string_with_sig = self._build_signed_query(params)
 
-        return data
+        url = f"{self.base_url}{path}"
+        log_fields: Dict[str, Any] = {
+            "method": method,
+            "path": path,
+            "symbol": params.get("symbol") if params else None,
+        }
+
+        # Log request (without secret, signature)
+        logger.info(
+            "Sending request to Binance: %s %s?%s",
+            method,
+            url,
+            query_string,
+            extra={"event": "request", "params": params, **log_fields},
+        )
+
+        try:
+            # Signed endpoints accept their parameters in the query string for
+            # every method, so GET and POST send the same signed bytes.
+            start = time.perf_counter()
+            resp = self._client.request(
+                method.upper(),
+                f"{url}?{query_string_with_sig}",
+                extensions=self._trace_extensions(),
+            )
+        except httpx.HTTPError as exc:
+            logger.exception("Network error during Binance request: %s", exc, extra=log_fields)
+            if self.metrics is not None:
+                self.metrics.count_error(path, "network")
+            raise BinanceNetworkError(str(exc)) from exc
+        log_fields["latency_ms"] = (time.perf_counter() - start) * 1000
+
+        return self._handle_response(resp, log_fields)
 
     def place_order(
         self,
         symbol: str,
         side: str,
         order_type: str,
-        quantity: float,
-        price: Optional[float] = None,
-        stop_price: Optional[float] = None,
+        quantity: Numeric,
+        price: Optional[Numeric] = None,
+        stop_price: Optional[Numeric] = None,
         time_in_force: Optional[str] = None,
+        client_order_id: Optional[str] = None,
     ) -> OrderResult:
         """
         Place a MARKET, LIMIT, or STOP_LIMIT order on Binance Futures.
@@ -147,51 +980,244 @@ class BinanceFuturesClient:
         :param symbol: e.g. "BTCUSDT"
         :param side: "BUY" or "SELL"
         :param order_type: "MARKET", "LIMIT", or "STOP_LIMIT"
-        :param quantity: order quantity
+        :param quantity: order quantity (Decimal preferred; floats are encoded
+            with the symbol's precision when `exchange_info` is set)
         :param price: required for LIMIT and STOP_LIMIT
         :param stop_price: trigger price for STOP_LIMIT
         :param time_in_force: e.g. "GTC" for LIMIT/STOP_LIMIT orders
+        :param client_order_id: newClientOrderId; generated when a retry
+            policy is configured and none is given
         """
-        order_type_upper = order_type.upper()
-        # Binance Futures uses type=STOP for stop-limit orders
-        binance_type = "STOP" if order_type_upper == "STOP_LIMIT" else order_type_upper
+        if client_order_id is None and self.retry_policy is not None:
+            client_order_id = new_client_order_id()
+        params = self._build_order_params(
+            symbol, side, order_type, quantity, price, stop_price, time_in_force, client_order_id
+        )
 
-        params: Dict[str, Any] = {
-            "symbol": symbol.upper(),
-            "side": side.upper(),
-            "type": binance_type,
-            "quantity": quantity,
-        }
+        retry = self._order_retry(client_order_id)
+        while True:
+            try:
+                if retry.lookup_pending:
+                    existing = retry.looked_up(self._find_order(params["symbol"], client_order_id))
+                    if existing is not None:
+                        return existing
+                data = self._signed_request(
+                    "POST", "/fapi/v1/order", params=params, weight=0, orders=1
+                )
+                return self._order_result_from_data(data)
+            except (BinanceApiError, BinanceNetworkError) as exc:
+                delay = retry.next_delay(exc)
+                if delay is None:
+                    raise
+            time.sleep(delay)
 
-        if order_type_upper == "LIMIT":
-            if price is None:
-                raise ValueError("price is required for LIMIT orders")
-            params["price"] = price
-            params["timeInForce"] = time_in_force or "GTC"
-        elif order_type_upper == "STOP_LIMIT":
-            if price is None:
-                raise ValueError("price is required for STOP_LIMIT orders")
-            if stop_price is None:
-                raise ValueError("stop_price is required for STOP_LIMIT orders")
-            params["price"] = price
-            params["stopPrice"] = stop_price
-            params["timeInForce"] = time_in_force or "GTC"
+    def get_order(
+        self,
+        symbol: str,
+        order_id: Optional[int] = None,
+        orig_client_order_id: Optional[str] = None,
+    ) -> OrderResult:
+        """Query an order by exchange order id or client order id."""
+        params = self._order_lookup_params(symbol, order_id, orig_client_order_id)
+        data = self._signed_request("GET", "/fapi/v1/order", params=params)
+        return self._order_result_from_data(data)
 
-        data = self._signed_request("POST", "/fapi/v1/order", params=params)
+    def _find_order(self, symbol: str, client_order_id: str) -> Optional[OrderResult]:
+        try:
+            return self.get_order(symbol, orig_client_order_id=client_order_id)
+        except BinanceApiError as exc:
+            if exc.code == ORDER_DOES_NOT_EXIST:
+                return None
+            raise
 
-        order_id = int(data.get("orderId"))
-        status = data.get("status", "UNKNOWN")
-        executed_qty = data.get("executedQty", "0")
-        avg_price = data.get("avgPrice") or data.get("avgPrice", None)
+    def get_open_orders(self, symbol: Optional[str] = None) -> List[OrderResult]:
+        """All open orders, or those on `symbol` (weight 1 instead of 40)."""
+        params = {"symbol": symbol.upper()} if symbol else None
+        data = self._signed_request(
+            "GET", "/fapi/v1/openOrders", params=params, weight=1 if symbol else 40
+        )
+        return [self._order_result_from_data(item) for item in data]
+
+    def cancel_order(
+        self,
+        symbol: str,
+        order_id: Optional[int] = None,
+        orig_client_order_id: Optional[str] = None,
+    ) -> OrderResult:
+        """Cancel an open order by exchange order id or client order id."""
+        params = self._order_lookup_params(symbol, order_id, orig_client_order_id)
+        data = self._signed_request("DELETE", "/fapi/v1/order", params=params)
+        return self._order_result_from_data(data)
+
+    def cancel_all_open_orders(self, symbol: str) -> Dict[str, Any]:
+        """
+        Cancel every open order on `symbol`.
+
+        Returns Binance's acknowledgement, e.g. `{"code": 200, "msg": "The
+        operation of cancel all open order is done."}`; a rejection raises.
+        The acknowledgement lists no orders, so with an `order_tracker` set
+        the symbol's tracked open orders are then resynced (see
+        `_resync_open_orders`).
+        """
+        ack = self._signed_request(
+            "DELETE", "/fapi/v1/allOpenOrders", params={"symbol": symbol.upper()}
+        )
+        if self.order_tracker is not None:
+            self._resync_open_orders(symbol)
+        return ack
+
+    def _resync_open_orders(self, symbol: str) -> None:
+        """
+        Bring `order_tracker`'s open orders on `symbol` in line with Binance:
+        record the open orders, and query each tracked one that is no longer
+        open to learn how it closed (canceled or filled meanwhile).
+        """
+        tracked = self._tracked_open_ids(symbol)
+        try:
+            still_open = {order.order_id for order in self.get_open_orders(symbol)}
+        except (BinanceApiError, BinanceNetworkError) as exc:
+            logger.warning("Could not resync tracked %s orders: %s", symbol.upper(), exc)
+            return
+        for order_id in tracked - still_open:
+            try:
+                self.get_order(symbol, order_id=order_id)
+            except (BinanceApiError, BinanceNetworkError) as exc:
+                self._log_resync_failure(symbol, order_id, exc)
+
+    def cancel_batch_orders(
+        self,
+        symbol: str,
+        order_ids: Optional[Sequence[int]] = None,
+        orig_client_order_ids: Optional[Sequence[str]] = None,
+        max_workers: int = 4,
+    ) -> List[BatchOrderOutcome]:
+        """
+        Cancel many orders on `symbol` through `DELETE /fapi/v1/batchOrders`.
+
+        Ids are packed `MAX_BATCH_CANCELS` per signed request and the requests
+        are sent concurrently. The result list is aligned with the given ids.
+
+        :param order_ids: exchange order ids to cancel
+        :param orig_client_order_ids: client order ids to cancel (instead of `order_ids`)
+        :param max_workers: maximum number of requests in flight at once
+        """
+        key, chunks = self._chunk_batch_cancels(order_ids, orig_client_order_ids)
+        if not chunks:
+            return []
+
+        def cancel_chunk(chunk: List[Any]) -> List[BatchOrderOutcome]:
+            return self._cancel_batch_chunk(symbol, key, chunk)
+
+        if len(chunks) == 1:
+            chunk_outcomes = [cancel_chunk(chunks[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+                chunk_outcomes = list(pool.map(cancel_chunk, chunks))
+
+        return [outcome for outcomes in chunk_outcomes for outcome in outcomes]
+
+    def _cancel_batch_chunk(
+        self, symbol: str, key: str, chunk: List[Any]
+    ) -> List[BatchOrderOutcome]:
+        try:
+            params = self._batch_cancel_params(symbol, key, chunk)
+            data = self._signed_request("DELETE", "/fapi/v1/batchOrders", params=params)
+        except (BinanceApiError, BinanceNetworkError) as exc:
+            return [exc] * len(chunk)
+        return self._batch_outcomes(200, data)
+
+    def requote(
+        self,
+        symbol: str,
+        side: str,
+        quantity: Numeric,
+        price: Numeric,
+        order_id: Optional[int] = None,
+        orig_client_order_id: Optional[str] = None,
+        time_in_force: Optional[str] = None,
+        client_order_id: Optional[str] = None,
+    ) -> RequoteResult:
+        """
+        Replace a resting order with a new LIMIT order at `price`.
+
+        The cancel and the place go out back to back on the client's
+        keep-alive connection. The new order is only placed once the old one
+        is known to be gone: canceled, or rejected by the cancel as unknown
+        (already filled or expired).
 
-        return OrderResult(
-            order_id=order_id,
-            status=status,
-            executed_qty=executed_qty,
-            avg_price=str(avg_price) if avg_price is not None else None,
-            raw=data,
+        :param order_id: exchange id of the order to replace
+        :param orig_client_order_id: client id of the order to replace
+        """
+        cancel_params = self._order_lookup_params(symbol, order_id, orig_client_order_id)
+        place_params = self._build_order_params(
+            symbol, side, "LIMIT", quantity, price, None, time_in_force, client_order_id
         )
 
+        start = time.perf_counter()
+        canceled: BatchOrderOutcome
+        try:
+            canceled = self._order_result_from_data(
+                self._signed_request("DELETE", "/fapi/v1/order", params=cancel_params)
+            )
+        except (BinanceApiError, BinanceNetworkError) as exc:
+            canceled = exc
+            if not self._order_already_gone(exc):
+                return RequoteResult(canceled, None)
+
+        placed: BatchOrderOutcome
+        try:
+            placed = self._order_result_from_data(
+                self._signed_request(
+                    "POST", "/fapi/v1/order", params=place_params, weight=0, orders=1
+                )
+            )
+        except (BinanceApiError, BinanceNetworkError) as exc:
+            placed = exc
+        if self.metrics is not None:
+            self.metrics.observe("requote", "/fapi/v1/order", time.perf_counter() - start)
+        return RequoteResult(canceled, placed)
+
+    def place_batch_orders(
+        self,
+        orders: Sequence[Mapping[str, Any]],
+        max_workers: int = 4,
+    ) -> List[BatchOrderOutcome]:
+        """
+        Place many orders through `/fapi/v1/batchOrders`.
+
+        Orders are packed `MAX_BATCH_ORDERS` per signed request and the chunks
+        are sent concurrently. The result list is aligned with `orders`.
+
+        :param orders: `place_order` keyword arguments, one mapping per order
+        :param max_workers: maximum number of chunks in flight at once
+        """
+        chunks = self._chunk_batch_orders(orders)
+        if not chunks:
+            return []
+
+        if len(chunks) == 1:
+            chunk_outcomes = [self._place_batch_chunk(chunks[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+                chunk_outcomes = list(pool.map(self._place_batch_chunk, chunks))
+
+        return [outcome for outcomes in chunk_outcomes for outcome in outcomes]
+
+    def _place_batch_chunk(self, chunk: List[Dict[str, str]]) -> List[BatchOrderOutcome]:
+        try:
+            data = self._signed_request(
+                "POST",
+                "/fapi/v1/batchOrders",
+                params=self._batch_params(chunk),
+                weight=5,
+                orders=len(chunk),
+            )
+        except (BinanceApiError, BinanceNetworkError) as exc:
+            return [exc] * len(chunk)
+        return self._batch_outcomes(200, data)
+
     def close(self) -> None:
+        self.stop_keepalive()
+        if self.clock is not None:
+            self.clock.stop()
         self._client.close()
-
@@ -0,0 +1,206 @@
+"""
+Long-running order daemon behind a local Unix domain socket.
+
+`OrderDaemon` keeps one warm `BinanceFuturesClient` (open keep-alive
+connections, a tracked server clock offset and loaded exchangeInfo) and
+places orders sent by local processes through `bot.daemon_client`. Shell
+commands then skip the client's imports, its construction and the TLS
+handshake, leaving only the signed request itself.
+
+The socket is created readable and writable by its owner only: anyone who
+can connect can trade on the account.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .client import BinanceApiError, BinanceFuturesClient, BinanceNetworkError
+from .daemon_client import default_socket_path
+from .decoding import dumps, loads
+from .exchange_info import ExchangeInfoCache
+from .orders import place_order_with_validation
+from .validators import ValidationError
+
+logger = logging.getLogger(__name__)
+
+# Order request fields and the JSON types they accept
+_TEXT_FIELDS = ("symbol", "side", "type")
+_NUMBER_FIELDS = ("quantity", "price", "stop_price")
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: "_UnixServer"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self.server.daemon.handle_message(line)
+            self.wfile.write(dumps(response) + b"\n")
+            self.wfile.flush()
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, daemon: "OrderDaemon") -> None:
+        self.daemon = daemon
+        # Owner-only from the moment the socket file exists
+        umask = os.umask(0o177)
+        try:
+            super().__init__(path, _Handler)
+        finally:
+            os.umask(umask)
+
+
+class OrderDaemon:
+    """
+    Serves order commands for one warm client until `shutdown()`.
+
+    :param keepalive_interval: idle seconds after which the client pings
+        `/fapi/v1/ping` so the pooled connection stays open between orders
+        (see `BinanceFuturesClient.start_keepalive`); stale exchangeInfo is
+        refreshed on the same timer instead of on an order's path
+    """
+
+    def __init__(
+        self,
+        client: BinanceFuturesClient,
+        socket_path: Optional[str] = None,
+        keepalive_interval: float = 10.0,
+    ) -> None:
+        self.client = client
+        self.socket_path = socket_path or default_socket_path()
+        self.keepalive_interval = keepalive_interval
+        if client.exchange_info is None:
+            client.exchange_info = ExchangeInfoCache(fetch=client.fetch_exchange_info)
+        self._server: Optional[_UnixServer] = None
+        self._stop = threading.Event()
+        self._commands: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "order": self._order,
+            "ping": self._ping,
+            "shutdown": self._shutdown,
+        }
+
+    def warm_up(self) -> None:
+        """Open a connection and load exchangeInfo before the first order needs them."""
+        self.client.ping()
+        self.client.exchange_info.load()  # type: ignore[union-attr]
+
+    def serve_forever(self) -> None:
+        """Bind the socket and serve until `shutdown()` (or a `shutdown` command)."""
+        self._remove_stale_socket()
+        self._server = _UnixServer(self.socket_path, self)
+        self.client.start_keepalive(self.keepalive_interval)
+        refresh = threading.Thread(target=self._refresh_loop, name="daemon-exchange-info")
+        refresh.daemon = True
+        refresh.start()
+        logger.info("Order daemon listening on %s", self.socket_path)
+        try:
+            self._server.serve_forever()
+        finally:
+            self._stop.set()
+            self.client.stop_keepalive()
+            self._server.server_close()
+            self._server = None
+            try:
+                os.unlink(self.socket_path)
+            except FileNotFoundError:
+                pass
+
+    def shutdown(self) -> None:
+        """Stop `serve_forever` from another thread."""
+        self._stop.set()
+        if self._server is not None:
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+
+    def _remove_stale_socket(self) -> None:
+        if not os.path.exists(self.socket_path):
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+        except OSError:
+            # Left behind by a daemon that did not exit cleanly
+            os.unlink(self.socket_path)
+        else:
+            raise RuntimeError(f"An order daemon is already listening on {self.socket_path}")
+        finally:
+            probe.close()
+
+    def _refresh_loop(self) -> None:
+        exchange_info = self.client.exchange_info
+        while not self._stop.wait(self.keepalive_interval):
+            try:
+                if exchange_info is not None and exchange_info.is_stale:
+                    exchange_info.refresh()
+            except (BinanceApiError, BinanceNetworkError) as exc:
+                logger.warning("Daemon exchangeInfo refresh failed: %s", exc)
+
+    def handle_message(self, line: bytes) -> Dict[str, Any]:
+        """Answer one protocol line (see `bot.daemon_client`)."""
+        try:
+            message = loads(line)
+            command = message.get("command")
+        except (ValueError, AttributeError):
+            return _error("request", "Request must be a JSON object.")
+        handler = self._commands.get(command) if isinstance(command, str) else None
+        if handler is None:
+            return _error("request", f"Unknown command: {command!r}.")
+        return handler(message)
+
+    def _order(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        start = time.perf_counter()
+        for name in _TEXT_FIELDS:
+            if not isinstance(message.get(name) or "", str):
+                return _error("request", f"{name} must be a string.")
+        for name in _NUMBER_FIELDS:
+            value = message.get(name)
+            if isinstance(value, bool) or not isinstance(value, (str, int, float, type(None))):
+                return _error("request", f"{name} must be a number or a numeric string.")
+        try:
+            result = place_order_with_validation(
+                client=self.client,
+                symbol=message.get("symbol") or "",
+                side=message.get("side") or "",
+                order_type=message.get("type") or "",
+                quantity=message.get("quantity") or "",
+                price=message.get("price"),
+                stop_price=message.get("stop_price"),
+                exchange_info=self.client.exchange_info,
+            )
+        except ValidationError as exc:
+            return _error("validation", str(exc))
+        except BinanceApiError as exc:
+            return _error("api", str(exc))
+        except BinanceNetworkError as exc:
+            return _error("network", str(exc))
+        except (ValueError, TypeError, AttributeError) as exc:
+            return _error("request", str(exc))
+        return {
+            "ok": True,
+            "orderId": result.order_id,
+            "status": result.status,
+            "executedQty": result.executed_qty,
+            "avgPrice": result.avg_price,
+            "latency_ms": round((time.perf_counter() - start) * 1000, 3),
+        }
+
+    def _ping(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        return {"ok": True, "pid": os.getpid()}
+
+    def _shutdown(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        logger.info("Order daemon shutdown requested over the socket")
+        self.shutdown()
+        return {"ok": True}
+
+
+def _error(kind: str, message: str) -> Dict[str, Any]:
+    return {"ok": False, "error": kind, "message": message}
@@ -0,0 +1,104 @@
+"""
+Thin client for the order daemon (`python cli.py daemon`, see `bot.daemon`).
+
+Speaks the daemon's protocol over its Unix domain socket: one JSON object
+per line in each direction. Requests carry a `command` (`order`, `ping` or
+`shutdown`) and its arguments; every response has `ok`, and failed ones an
+`error` kind (`validation`, `api`, `network` or `request`) and a `message`.
+
+Only the standard library is imported here, so forwarding an order from the
+shell costs little more than interpreter startup.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+from typing import Any, Dict, Optional
+
+
+def default_socket_path() -> str:
+    """`$BINANCE_BOT_SOCKET`, else a per-user socket in the temp directory."""
+    path = os.environ.get("BINANCE_BOT_SOCKET")
+    if path:
+        return path
+    tmp = os.environ.get("TMPDIR", "/tmp")
+    return os.path.join(tmp, f"binance-bot-{os.getuid()}.sock")
+
+
+class DaemonUnavailable(Exception):
+    """Raised when no daemon is listening on the socket."""
+
+
+class DaemonClient:
+    """
+    One connection to the order daemon; requests are answered in order.
+
+    Use as a context manager or call `close()`.
+    """
+
+    def __init__(self, socket_path: Optional[str] = None, timeout: float = 30.0) -> None:
+        self.socket_path = socket_path or default_socket_path()
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._reader: Any = None
+
+    def _connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError as exc:
+            sock.close()
+            raise DaemonUnavailable(
+                f"No order daemon on {self.socket_path} ({exc.strerror or exc})"
+            ) from None
+        self._sock = sock
+        self._reader = sock.makefile("rb")
+
+    def request(self, command: str, **params: Any) -> Dict[str, Any]:
+        """Send one command and return the daemon's response."""
+        if self._sock is None:
+            self._connect()
+        message = json.dumps({"command": command, **params}, separators=(",", ":"))
+        self._sock.sendall(message.encode("utf-8") + b"\n")  # type: ignore[union-attr]
+        line = self._reader.readline()
+        if not line:
+            self.close()
+            raise DaemonUnavailable(f"Order daemon on {self.socket_path} closed the connection")
+        return json.loads(line)
+
+    def order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: Any,
+        price: Any = None,
+        stop_price: Any = None,
+    ) -> Dict[str, Any]:
+        """Place an order through the daemon; quantities and prices are sent as strings."""
+        return self.request(
+            "order",
+            symbol=symbol,
+            side=side,
+            type=order_type,
+            quantity=str(quantity),
+            price=None if price is None else str(price),
+            stop_price=None if stop_price is None else str(stop_price),
+        )
+
+    def close(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def __enter__(self) -> "DaemonClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,63 @@
+"""
+JSON decoding for Binance responses.
+
+`loads` uses the fastest decoder that is installed: orjson, then msgspec,
+then the standard library. Response bodies are decoded straight from the raw
+bytes, skipping the charset detection and str round trip of
+`httpx.Response.json()`. Malformed input raises `ValueError` whichever
+backend is active. `dumps` is the matching compact encoder (to bytes).
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:  # Optional fast JSON decoders
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - depends on the environment
+    msgspec = None
+
+
+if orjson is not None:
+    JSON_BACKEND = "orjson"
+
+    def loads(content: Union[bytes, str]) -> Any:
+        """Decode a JSON document."""
+        return orjson.loads(content)
+
+    def dumps(obj: Any) -> bytes:
+        """Encode `obj` as compact JSON bytes."""
+        return orjson.dumps(obj)
+
+elif msgspec is not None:  # pragma: no cover - depends on the environment
+    JSON_BACKEND = "msgspec"
+    _decoder = msgspec.json.Decoder()
+    _encoder = msgspec.json.Encoder()
+
+    def loads(content: Union[bytes, str]) -> Any:
+        """Decode a JSON document."""
+        try:
+            return _decoder.decode(content)
+        except msgspec.DecodeError as exc:
+            raise ValueError(str(exc)) from exc
+
+    def dumps(obj: Any) -> bytes:
+        """Encode `obj` as compact JSON bytes."""
+        return _encoder.encode(obj)
+
+else:  # pragma: no cover - depends on the environment
+    JSON_BACKEND = "json"
+
+    def loads(content: Union[bytes, str]) -> Any:
+        """Decode a JSON document."""
+        return json.loads(content)
+
+    def dumps(obj: Any) -> bytes:
+        """Encode `obj` as compact JSON bytes."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
@@ -0,0 +1,217 @@
+"""
+Cached exchangeInfo and per-symbol trading filters.
+
+Loading `/fapi/v1/exchangeInfo` is expensive (large payload, request weight),
+and its symbol rules change rarely. `ExchangeInfoCache` persists it to disk
+with a TTL, refreshes it conditionally by ETag, and indexes the PRICE_FILTER,
+LOT_SIZE, MARKET_LOT_SIZE and MIN_NOTIONAL filters by symbol so orders can be
+checked locally (see `bot.validators.apply_symbol_filters`) before they cost a
+round trip.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CACHE_FILE = Path(__file__).resolve().parent.parent / "cache" / "exchange_info.json"
+
+# Fetches exchangeInfo given the last known ETag; returns (None, etag) when
+# unchanged. `BinanceFuturesClient.fetch_exchange_info` has this signature.
+ExchangeInfoFetcher = Callable[[Optional[str]], Tuple[Optional[Dict[str, Any]], Optional[str]]]
+
+
+@dataclass(frozen=True)
+class SymbolFilters:
+    symbol: str
+    tick_size: Decimal
+    min_price: Decimal
+    max_price: Decimal
+    step_size: Decimal
+    min_qty: Decimal
+    max_qty: Decimal
+    market_step_size: Decimal
+    market_min_qty: Decimal
+    market_max_qty: Decimal
+    min_notional: Decimal
+
+    @classmethod
+    def from_symbol_info(cls, info: Mapping[str, Any]) -> "SymbolFilters":
+        filters = {f["filterType"]: f for f in info.get("filters", [])}
+        price = filters.get("PRICE_FILTER", {})
+        lot = filters.get("LOT_SIZE", {})
+        market_lot = filters.get("MARKET_LOT_SIZE", lot)
+        notional = filters.get("MIN_NOTIONAL", {})
+
+        def dec(source: Mapping[str, Any], key: str) -> Decimal:
+            return Decimal(str(source.get(key, "0")))
+
+        return cls(
+            symbol=info["symbol"],
+            tick_size=dec(price, "tickSize"),
+            min_price=dec(price, "minPrice"),
+            max_price=dec(price, "maxPrice"),
+            step_size=dec(lot, "stepSize"),
+            min_qty=dec(lot, "minQty"),
+            max_qty=dec(lot, "maxQty"),
+            market_step_size=dec(market_lot, "stepSize"),
+            market_min_qty=dec(market_lot, "minQty"),
+            market_max_qty=dec(market_lot, "maxQty"),
+            # Futures report the threshold as "notional"
+            min_notional=dec(notional, "notional"),
+        )
+
+
+def _fixed_point_spec(*steps: Decimal) -> str:
+    decimals = max(
+        (max(-step.normalize().as_tuple().exponent, 0) for step in steps if step > 0),
+        default=8,
+    )
+    return f".{decimals}f"
+
+
+class SymbolFormatter:
+    """
+    Pre-built renderers for one symbol's prices and quantities.
+
+    The fixed-point format spec is derived once from the tick/step sizes, so
+    encoding an order is a single `format` call per field, with no Decimal
+    quantize on the hot path. Values must already sit on the symbol's grid:
+    `format` would round off-grid values half-even, possibly to a larger or
+    more aggressive order, so callers round them first (see
+    `bot.validators.round_to_step`). Floats are rendered exactly at that
+    precision, e.g. `0.1 + 0.2` as "0.300" rather than "0.30000000000000004".
+    """
+
+    __slots__ = ("filters", "price_spec", "quantity_spec")
+
+    def __init__(self, filters: SymbolFilters) -> None:
+        self.filters = filters
+        self.price_spec = _fixed_point_spec(filters.tick_size)
+        self.quantity_spec = _fixed_point_spec(filters.step_size, filters.market_step_size)
+
+    def price(self, value: Decimal | float) -> str:
+        return format(value, self.price_spec)
+
+    def quantity(self, value: Decimal | float) -> str:
+        return format(value, self.quantity_spec)
+
+
+class ExchangeInfoCache:
+    """
+    Disk-persisted exchangeInfo with a per-symbol filter index.
+
+    :param fetch: conditional fetcher, e.g. `client.fetch_exchange_info`;
+        without one the cache only serves what is on disk or loaded via `update`
+    :param path: cache file location (default: `cache/exchange_info.json`)
+    :param ttl: seconds before the cached copy is revalidated
+    """
+
+    def __init__(
+        self,
+        fetch: Optional[ExchangeInfoFetcher] = None,
+        path: Optional[Path] = DEFAULT_CACHE_FILE,
+        ttl: float = 3_600.0,
+    ) -> None:
+        self._fetch = fetch
+        self.path = path
+        self.ttl = ttl
+        self._data: Optional[Dict[str, Any]] = None
+        self._etag: Optional[str] = None
+        self._fetched_at = 0.0
+        self._symbols: Dict[str, SymbolFilters] = {}
+        self._formatters: Dict[str, SymbolFormatter] = {}
+
+    @property
+    def is_stale(self) -> bool:
+        return self._data is None or time.time() - self._fetched_at >= self.ttl
+
+    def load(self) -> Dict[str, Any]:
+        """Return exchangeInfo, reading the disk cache or refreshing as needed."""
+        if self._data is None:
+            self._read_disk()
+        if self.is_stale and self._fetch is not None:
+            self.refresh()
+        if self._data is None:
+            raise RuntimeError("exchangeInfo is not available (no cache file and no fetcher)")
+        return self._data
+
+    def refresh(self) -> None:
+        """Revalidate with the server, downloading only if it changed."""
+        if self._fetch is None:
+            raise RuntimeError("ExchangeInfoCache has no fetcher")
+        data, etag = self._fetch(self._etag if self._data is not None else None)
+        if data is None:
+            # Unchanged: just extend the cached copy's lifetime
+            self._fetched_at = time.time()
+            self._write_disk()
+            return
+        self.update(data, etag)
+
+    def update(self, data: Dict[str, Any], etag: Optional[str] = None) -> None:
+        """Install a freshly fetched exchangeInfo payload and rebuild the index."""
+        self._data = data
+        self._etag = etag
+        self._fetched_at = time.time()
+        self._index(data)
+        self._write_disk()
+
+    def filters(self, symbol: str) -> SymbolFilters:
+        """Trading filters for `symbol`; raises KeyError for unknown symbols."""
+        self.load()
+        return self._symbols[symbol.upper()]
+
+    def formatter(self, symbol: str) -> Optional[SymbolFormatter]:
+        """
+        Price/quantity formatter for `symbol`, or None for unknown symbols.
+
+        Never loads or refreshes anything, so it is safe to call while
+        encoding orders; it also returns None until `load()` (or `update`)
+        has installed exchangeInfo, which callers do at setup.
+        """
+        if self._data is None:
+            return None
+        return self._formatters.get(symbol.upper())
+
+    @property
+    def rate_limits(self) -> List[Dict[str, Any]]:
+        return self.load().get("rateLimits", [])
+
+    def _index(self, data: Dict[str, Any]) -> None:
+        self._symbols = {
+            info["symbol"]: SymbolFilters.from_symbol_info(info) for info in data.get("symbols", [])
+        }
+        self._formatters = {
+            symbol: SymbolFormatter(filters) for symbol, filters in self._symbols.items()
+        }
+
+    def _read_disk(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            cached = json.loads(self.path.read_text(encoding="utf-8"))
+            data = cached["data"]
+        except (OSError, ValueError, KeyError):
+            logger.warning("Ignoring unreadable exchangeInfo cache at %s", self.path)
+            return
+        self._data = data
+        self._etag = cached.get("etag")
+        self._fetched_at = float(cached.get("fetched_at", 0))
+        self._index(data)
+
+    def _write_disk(self) -> None:
+        if self.path is None or self._data is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"fetched_at": self._fetched_at, "etag": self._etag, "data": self._data}
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        tmp.replace(self.path)
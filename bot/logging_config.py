@@ -1,15 +1,197 @@
+import atexit
+import json
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import random
+from dataclasses import dataclass, field
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Any, Callable, Dict
 
+try:  # Optional fast JSON encoder
+    import orjson
 
-def configure_logging(log_file: str | None = None, level: int = logging.INFO) -> None:
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=str).decode("utf-8")
+
+except ImportError:  # pragma: no cover - depends on the environment
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, default=str, separators=(",", ":"))
+
+
+# Background listener of the queue-backed logging mode, if active
+_listener: QueueListener | None = None
+
+
+@dataclass
+class ResponseLogPolicy:
+    """
+    How much of each successful Binance response body gets logged.
+
+    Error responses (HTTP status >= 400) are always logged in full. Successful
+    ones are logged with probability `path_sample_rates.get(path,
+    success_sample_rate)` and their bodies cut to `max_body_chars`
+    (None = no limit). When the client logger is at DEBUG, sampled bodies are
+    logged in full regardless of `max_body_chars`.
+    """
+
+    max_body_chars: int | None = None
+    success_sample_rate: float = 1.0
+    path_sample_rates: Dict[str, float] = field(default_factory=dict)
+
+    def should_log(self, path: str | None, is_error: bool) -> bool:
+        if is_error:
+            return True
+        rate = self.success_sample_rate
+        if path is not None:
+            rate = self.path_sample_rates.get(path, rate)
+        return rate >= 1.0 or random.random() < rate
+
+    def render_body(self, content: bytes, full: bool = False) -> str:
+        limit = self.max_body_chars
+        if full or limit is None or len(content) <= limit:
+            return content.decode("utf-8", errors="replace")
+        # Slice the raw bytes so large bodies are never decoded in full
+        head = content[:limit].decode("utf-8", errors="replace")
+        return f"{head}...(+{len(content) - limit} bytes)"
+
+
+_response_log_policy = ResponseLogPolicy()
+
+
+def get_response_log_policy() -> ResponseLogPolicy:
+    """The process-wide response log policy set by `configure_logging`."""
+    return _response_log_policy
+
+
+# Record attributes (passed via `extra=`) copied into structured log events
+STRUCTURED_FIELDS = (
+    "event",
+    "method",
+    "path",
+    "symbol",
+    "latency_ms",
+    "status",
+    "order_id",
+    "weight",
+    "params",
+)
+
+# Field names whose values never reach the logs, at any nesting level
+REDACTED_FIELDS = frozenset({"signature", "x-mbx-apikey", "apikey", "api_key", "api_secret"})
+
+
+def _redact(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            k: "***" if str(k).lower() in REDACTED_FIELDS else _redact(v)
+            for k, v in value.items()
+        }
+    return value
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per record: timestamp, level, logger, message, plus the
+    structured fields in `STRUCTURED_FIELDS` that the record carries.
+
+    Serialization happens in `format`, i.e. only for records that a handler
+    actually emits; fields listed in `REDACTED_FIELDS` are masked.
+    """
+
+    def __init__(self, dumps: Callable[[Any], str] = _dumps) -> None:
+        super().__init__()
+        self._dumps = dumps
+
+    def format(self, record: logging.LogRecord) -> str:
+        event = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for name in STRUCTURED_FIELDS:
+            value = getattr(record, name, None)
+            if value is not None:
+                event[name] = _redact(value)
+        if record.exc_info:
+            event["exc"] = self.formatException(record.exc_info)
+        return self._dumps(event)
+
+
+class _BoundedQueueHandler(QueueHandler):
+    """
+    QueueHandler for a bounded queue with a choice of overflow policy.
+
+    Records are enqueued as-is: message formatting happens on the listener
+    thread, not on the thread that logged. Loggers must therefore not mutate
+    objects passed as log arguments after the call.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]", block: bool) -> None:
+        super().__init__(log_queue)
+        self.block = block
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.block:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _FlushingQueueListener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # Wait for room rather than failing when the queue is full at shutdown
+        self.queue.put(self._sentinel)
+
+
+def configure_logging(
+    log_file: str | None = None,
+    level: int = logging.INFO,
+    use_queue: bool = False,
+    queue_size: int = 10_000,
+    on_full: str = "drop",
+    json_format: bool = False,
+    response_body_max_chars: int | None = None,
+    response_sample_rate: float = 1.0,
+    response_path_sample_rates: Dict[str, float] | None = None,
+) -> None:
     """
     Configure application-wide logging.
 
     - Logs to both console and a rotating file in the `logs/` directory.
     - Keeps log format consistent across the app.
+    - With `use_queue`, callers only enqueue records; a background listener
+      formats and writes them, so console/disk I/O stays off the order path.
+      The queue holds `queue_size` records; when it is full, `on_full="drop"`
+      discards new records (counted and reported at exit) and `"block"` makes
+      the logging thread wait. Queued records are flushed at interpreter exit
+      or by `shutdown_logging()`.
+    - With `json_format`, every record is written as one JSON object (see
+      `JsonFormatter`) instead of free text.
+    - `response_body_max_chars`, `response_sample_rate` and
+      `response_path_sample_rates` (e.g. `{"/fapi/v1/order": 0.01}`) set the
+      `ResponseLogPolicy` for successful Binance responses; errors are
+      always logged in full.
     """
+    if on_full not in ("drop", "block"):
+        raise ValueError("on_full must be 'drop' or 'block'")
+
+    global _response_log_policy
+    _response_log_policy = ResponseLogPolicy(
+        max_body_chars=response_body_max_chars,
+        success_sample_rate=response_sample_rate,
+        path_sample_rates=dict(response_path_sample_rates or {}),
+    )
+
     logs_dir = Path(__file__).resolve().parent.parent / "logs"
     logs_dir.mkdir(parents=True, exist_ok=True)
 
@@ -18,9 +200,13 @@ def configure_logging(log_file: str | None = None, level: int = logging.INFO) ->
     else:
         log_file = str(logs_dir / log_file)
 
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
+    formatter: logging.Formatter
+    if json_format:
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        )
 
     root_logger = logging.getLogger()
     # Avoid adding duplicate handlers if configure_logging is called multiple times
@@ -28,16 +214,55 @@ def configure_logging(log_file: str | None = None, level: int = logging.INFO) ->
         return
 
     root_logger.setLevel(level)
+    if json_format:
+        # httpx logs the full signed URL as free text; the client's own
+        # request/response events carry the same information, redacted.
+        logging.getLogger("httpx").setLevel(logging.WARNING)
 
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
 
     # File handler (rotating)
     file_handler = RotatingFileHandler(
         log_file, maxBytes=1_000_000, backupCount=3, encoding="utf-8"
     )
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
 
+    if not use_queue:
+        root_logger.addHandler(console_handler)
+        root_logger.addHandler(file_handler)
+        return
+
+    global _listener
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=queue_size)
+    root_logger.addHandler(_BoundedQueueHandler(log_queue, block=on_full == "block"))
+    _listener = _FlushingQueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the queue-backed logging listener, if one is running."""
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, _BoundedQueueHandler) and handler.dropped:
+            notice = logging.LogRecord(
+                __name__,
+                logging.WARNING,
+                __file__,
+                0,
+                "%d log records were dropped because the logging queue was full",
+                (handler.dropped,),
+                None,
+            )
+            for target in listener.handlers:
+                target.handle(notice)
+            handler.dropped = 0
@@ -0,0 +1,271 @@
+"""
+Streaming market data: book ticker, mark price and aggregate trades.
+
+`MarketDataStream` subscribes to the combined streams of many symbols over a
+single WebSocket connection and writes every update into a `MarketData`
+store. The store keeps, per symbol, fixed-size ring buffers backed by
+`array('d')` (one flat float array per stream, no per-update dicts or
+objects), so the latest value of any stream is an O(1) lookup and recent
+history stays available at a fixed memory cost.
+
+The store is plain memory: pricing helpers (see `bot.orders`) and other
+threads read it without network calls while the stream keeps it current.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import logging
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import websockets
+
+from .decoding import loads
+from .ws_stream import ReconnectingStream
+
+logger = logging.getLogger(__name__)
+
+
+TESTNET_MARKET_STREAM_URL = "wss://fstream.binancefuture.com/stream"
+
+# Stream names per kind, as in `<symbol>@<stream>`
+DEFAULT_STREAMS = ("bookTicker", "markPrice@1s", "aggTrade")
+
+# Columns of each ring buffer; times are event times in ms
+BOOK_TICKER_FIELDS = ("time", "bid", "bid_qty", "ask", "ask_qty")
+MARK_PRICE_FIELDS = ("time", "mark", "index", "funding_rate")
+AGG_TRADE_FIELDS = ("time", "price", "qty", "buyer_is_maker")
+
+
+class RingBuffer:
+    """
+    Fixed-capacity history of float rows in one flat `array('d')`.
+
+    `append` overwrites the oldest row once full; `latest` is O(1).
+    """
+
+    __slots__ = ("fields", "capacity", "_width", "_offsets", "_data", "_next", "_count")
+
+    def __init__(self, fields: Sequence[str], capacity: int = 1024) -> None:
+        self.fields = tuple(fields)
+        self.capacity = capacity
+        self._width = len(self.fields)
+        self._offsets = {field: i for i, field in enumerate(self.fields)}
+        self._data = array("d", bytes(8 * self._width * capacity))
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, *row: float) -> None:
+        data = self._data
+        start = self._next * self._width
+        for i, value in enumerate(row):
+            data[start + i] = value
+        self._next = (self._next + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def latest(self) -> Optional[Tuple[float, ...]]:
+        """The newest row, or None if nothing was appended yet."""
+        if not self._count:
+            return None
+        start = (self._next - 1) % self.capacity * self._width
+        return tuple(self._data[start : start + self._width])
+
+    def latest_value(self, field: str) -> Optional[float]:
+        if not self._count:
+            return None
+        row = (self._next - 1) % self.capacity
+        return self._data[row * self._width + self._offsets[field]]
+
+    def rows(self, n: Optional[int] = None) -> List[Tuple[float, ...]]:
+        """Up to the `n` newest rows (all by default), oldest first."""
+        count = self._count if n is None else min(n, self._count)
+        width = self._width
+        first = (self._next - count) % self.capacity
+        rows = []
+        for i in range(count):
+            start = (first + i) % self.capacity * width
+            rows.append(tuple(self._data[start : start + width]))
+        return rows
+
+
+class SymbolMarketData:
+    """Ring buffers of one symbol's book ticker, mark price and trades."""
+
+    __slots__ = ("symbol", "book_ticker", "mark_price", "agg_trades")
+
+    def __init__(self, symbol: str, capacity: int = 1024) -> None:
+        self.symbol = symbol
+        self.book_ticker = RingBuffer(BOOK_TICKER_FIELDS, capacity)
+        self.mark_price = RingBuffer(MARK_PRICE_FIELDS, capacity)
+        self.agg_trades = RingBuffer(AGG_TRADE_FIELDS, capacity)
+
+
+class MarketData:
+    """
+    Latest market data per symbol, fed by `MarketDataStream` (or `update`).
+
+    Lookups return None until the symbol's first update of that stream.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self.capacity = capacity
+        self._symbols: Dict[str, SymbolMarketData] = {}
+
+    def symbol(self, symbol: str) -> SymbolMarketData:
+        """The per-symbol record, created on first use."""
+        record = self._symbols.get(symbol)
+        if record is None:
+            record = self._symbols[symbol] = SymbolMarketData(symbol, self.capacity)
+        return record
+
+    def update(self, event: Dict[str, Any]) -> None:
+        """Record one decoded stream event (the `data` of a combined stream message)."""
+        kind = event.get("e")
+        record = self.symbol(event["s"])
+        if kind == "bookTicker":
+            record.book_ticker.append(
+                event.get("E", event.get("T", 0)),
+                float(event["b"]),
+                float(event["B"]),
+                float(event["a"]),
+                float(event["A"]),
+            )
+        elif kind == "markPriceUpdate":
+            record.mark_price.append(
+                event["E"],
+                float(event["p"]),
+                float(event.get("i", 0)),
+                float(event.get("r") or 0),
+            )
+        elif kind == "aggTrade":
+            record.agg_trades.append(
+                event["T"], float(event["p"]), float(event["q"]), 1.0 if event.get("m") else 0.0
+            )
+
+    def _latest(self, symbol: str, stream: str, field: str) -> Optional[float]:
+        record = self._symbols.get(symbol.upper())
+        if record is None:
+            return None
+        buffer: RingBuffer = getattr(record, stream)
+        return buffer.latest_value(field)
+
+    def best_bid(self, symbol: str) -> Optional[float]:
+        return self._latest(symbol, "book_ticker", "bid")
+
+    def best_ask(self, symbol: str) -> Optional[float]:
+        return self._latest(symbol, "book_ticker", "ask")
+
+    def quote(self, symbol: str) -> Optional[Tuple[float, float]]:
+        """Best bid and ask from the same book ticker update."""
+        record = self._symbols.get(symbol.upper())
+        row = record.book_ticker.latest() if record is not None else None
+        if row is None:
+            return None
+        return row[1], row[3]
+
+    def mark_price(self, symbol: str) -> Optional[float]:
+        return self._latest(symbol, "mark_price", "mark")
+
+    def last_trade_price(self, symbol: str) -> Optional[float]:
+        return self._latest(symbol, "agg_trades", "price")
+
+    def last_update_ms(self, symbol: str) -> Optional[float]:
+        """Event time of the symbol's newest update on any stream."""
+        record = self._symbols.get(symbol.upper())
+        if record is None:
+            return None
+        times = [
+            buffer.latest_value("time")
+            for buffer in (record.book_ticker, record.mark_price, record.agg_trades)
+        ]
+        return max((t for t in times if t is not None), default=None)
+
+
+class MarketDataStream(ReconnectingStream):
+    """
+    One combined-stream connection feeding a `MarketData` store.
+
+    Use as `async with MarketDataStream(["BTCUSDT", "ETHUSDT"]) as stream:`
+    and read `stream.market_data`, or call `start()` and `stop()`. Symbols
+    can be added later with `subscribe`. The connection is re-established
+    with backoff if it drops.
+    """
+
+    stream_name = "Market data"
+
+    def __init__(
+        self,
+        symbols: Iterable[str],
+        streams: Sequence[str] = DEFAULT_STREAMS,
+        url: str = TESTNET_MARKET_STREAM_URL,
+        market_data: Optional[MarketData] = None,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30.0,
+        timeout: float = 10.0,
+    ) -> None:
+        super().__init__(reconnect_delay, max_reconnect_delay)
+        self.symbols = [symbol.upper() for symbol in symbols]
+        self.streams = tuple(streams)
+        self.url = url
+        self.market_data = market_data if market_data is not None else MarketData()
+        self.timeout = timeout
+        self._task: Optional[asyncio.Task] = None
+        self._ids = itertools.count(1)
+
+    def _stream_names(self, symbols: Iterable[str]) -> List[str]:
+        return [f"{symbol.lower()}@{stream}" for symbol in symbols for stream in self.streams]
+
+    async def start(self) -> None:
+        """Connect; raises if the first connection fails."""
+        await self._connect()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._ws is not None:
+            await self._ws.close()
+            self._ws = None
+
+    async def __aenter__(self) -> "MarketDataStream":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    async def subscribe(self, symbols: Iterable[str]) -> None:
+        """Add symbols to the live connection (and to every reconnect)."""
+        new = [s.upper() for s in symbols if s.upper() not in self.symbols]
+        if not new:
+            return
+        self.symbols.extend(new)
+        if self._ws is not None:
+            params = self._stream_names(new)
+            request = {"method": "SUBSCRIBE", "params": params, "id": next(self._ids)}
+            await self._ws.send(json.dumps(request))
+
+    async def _connect(self) -> None:
+        url = f"{self.url}?streams={'/'.join(self._stream_names(self.symbols))}"
+        logger.info("Connecting to market data streams: %s", url)
+        self._ws = await websockets.connect(url, open_timeout=self.timeout)
+
+    async def _read(self, ws: Any) -> None:
+        update = self.market_data.update
+        async for message in ws:
+            try:
+                data = loads(message).get("data")
+                # Subscription acks ({"result": null, "id": n}) carry no data.
+                if data is not None:
+                    update(data)
+            except (ValueError, TypeError, KeyError, AttributeError) as exc:
+                logger.warning("Ignoring malformed market data frame (%r): %.200r", exc, message)
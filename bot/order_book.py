@@ -0,0 +1,353 @@
+"""
+Local L2 order books kept in sync with the diff depth streams.
+
+`OrderBookStream` subscribes to `<symbol>@depth@100ms` for many symbols over
+one combined-stream connection and maintains an `OrderBook` per symbol,
+following Binance's procedure for a local book:
+
+1. buffer the symbol's diffs while `/fapi/v1/depth` is fetched;
+2. drop buffered diffs with `u` below the snapshot's `lastUpdateId`;
+3. the first diff applied must straddle it (`U <= lastUpdateId <= u`);
+4. every later diff's `pu` must equal the previous diff's `u`.
+
+A diff that breaks the sequence, or a reconnect, marks the book unsynced and
+reloads its snapshot. Each side of a book keeps its prices in a sorted
+`array('d')` with the best level last, so the best price is O(1), levels
+added near the touch move few elements, and cumulative-depth queries are a
+bisect plus a sum over a contiguous slice.
+
+Books are updated on the event loop; read them from the same thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import websockets
+
+from .async_client import AsyncBinanceFuturesClient
+from .client import BinanceApiError, BinanceNetworkError
+from .decoding import loads
+from .market_data import TESTNET_MARKET_STREAM_URL
+from .ws_stream import ReconnectingStream, backoff_delays
+
+logger = logging.getLogger(__name__)
+
+
+class BookSide:
+    """
+    One side of an order book: prices in a sorted `array('d')` with the best
+    level last, quantities in a dict keyed by the same sort key.
+
+    Bids are keyed by price and asks by negated price, so both sides share
+    the ascending order `bisect` and `array` work with. Quantity changes at
+    existing levels, the bulk of a diff, never touch the array.
+    """
+
+    __slots__ = ("is_bid", "max_levels", "_sign", "_keys", "_qtys")
+
+    def __init__(self, is_bid: bool, max_levels: int = 2000) -> None:
+        self.is_bid = is_bid
+        self.max_levels = max_levels
+        self._sign = 1.0 if is_bid else -1.0
+        self._keys = array("d")
+        self._qtys: Dict[float, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def load(self, levels: Iterable[Sequence[str]]) -> None:
+        """Replace the side with `[price, qty]` levels (any order)."""
+        sign = self._sign
+        self._qtys = {float(price) * sign: float(qty) for price, qty in levels if float(qty)}
+        self._keys = array("d", sorted(self._qtys))
+
+    def update(self, levels: Iterable[Sequence[str]]) -> None:
+        """Apply `[price, qty]` changes; a zero quantity removes the level."""
+        sign, keys, qtys = self._sign, self._keys, self._qtys
+        inserted = False
+        for price, qty_str in levels:
+            key = float(price) * sign
+            qty = float(qty_str)
+            if key in qtys:
+                if qty:
+                    qtys[key] = qty
+                else:
+                    del qtys[key]
+                    del keys[bisect_left(keys, key)]
+            elif qty:
+                qtys[key] = qty
+                keys.insert(bisect_left(keys, key), key)
+                inserted = True
+        if inserted and len(keys) > self.max_levels:
+            # Far from the touch and no longer refreshed by the snapshot
+            for key in keys[: len(keys) - self.max_levels]:
+                del qtys[key]
+            del keys[: len(keys) - self.max_levels]
+
+    def best(self) -> Optional[Tuple[float, float]]:
+        """Best `(price, qty)`, or None if the side is empty."""
+        if not self._keys:
+            return None
+        key = self._keys[-1]
+        return key * self._sign, self._qtys[key]
+
+    def levels(self, n: Optional[int] = None) -> List[Tuple[float, float]]:
+        """Up to `n` levels (all by default) as `(price, qty)`, best first."""
+        sign, qtys = self._sign, self._qtys
+        keys = self._keys if n is None else self._keys[-n:] if n > 0 else ()
+        return [(key * sign, qtys[key]) for key in reversed(keys)]
+
+    def cumulative_qty(self, n: int) -> float:
+        """Total quantity of the best `n` levels."""
+        return sum(map(self._qtys.__getitem__, self._keys[-n:])) if n > 0 else 0.0
+
+    def qty_through(self, price: float) -> float:
+        """Total quantity at `price` or better."""
+        keys = self._keys
+        return sum(map(self._qtys.__getitem__, keys[bisect_left(keys, price * self._sign) :]))
+
+    def price_for_qty(self, qty: float) -> Optional[float]:
+        """
+        Price of the level at which the cumulative quantity from the best
+        level reaches `qty`, i.e. the worst price a taker of `qty` would pay;
+        None if the side is not that deep.
+        """
+        total = 0.0
+        qtys = self._qtys
+        for key in reversed(self._keys):
+            total += qtys[key]
+            if total >= qty:
+                return key * self._sign
+        return None
+
+
+class OrderBook:
+    """L2 book of one symbol, built from a depth snapshot plus diffs."""
+
+    __slots__ = ("symbol", "bids", "asks", "last_update_id", "event_time", "synced", "_prev_u")
+
+    def __init__(self, symbol: str, max_levels: int = 2000) -> None:
+        self.symbol = symbol
+        self.bids = BookSide(True, max_levels)
+        self.asks = BookSide(False, max_levels)
+        self.last_update_id = 0
+        self.event_time = 0
+        self.synced = False
+        self._prev_u: Optional[int] = None
+
+    def load_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        """Reset the book to a `/fapi/v1/depth` payload."""
+        self.bids.load(snapshot["bids"])
+        self.asks.load(snapshot["asks"])
+        self.last_update_id = int(snapshot["lastUpdateId"])
+        self.event_time = int(snapshot.get("E", 0))
+        self._prev_u = None
+        self.synced = True
+
+    def apply(self, event: Dict[str, Any]) -> bool:
+        """
+        Apply a `depthUpdate` diff.
+
+        Diffs already covered by the snapshot are skipped. Returns False, and
+        marks the book unsynced, when the diff does not follow on from the
+        book's state; the snapshot must then be reloaded.
+        """
+        if not self.synced:
+            return False
+        final_id = event["u"]
+        if final_id < self.last_update_id:
+            return True
+        if self._prev_u is None:
+            in_sequence = event["U"] <= self.last_update_id
+        else:
+            in_sequence = event["pu"] == self._prev_u
+        if not in_sequence:
+            self.synced = False
+            return False
+
+        self.bids.update(event["b"])
+        self.asks.update(event["a"])
+        self._prev_u = self.last_update_id = final_id
+        self.event_time = event["E"]
+        return True
+
+    def best_bid(self) -> Optional[float]:
+        best = self.bids.best()
+        return best[0] if best is not None else None
+
+    def best_ask(self) -> Optional[float]:
+        best = self.asks.best()
+        return best[0] if best is not None else None
+
+    def mid_price(self) -> Optional[float]:
+        bid, ask = self.bids.best(), self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return (bid[0] + ask[0]) / 2
+
+
+class OrderBookStream(ReconnectingStream):
+    """
+    Local order books for many symbols over one diff depth connection.
+
+    Use as `async with OrderBookStream(client, ["BTCUSDT", "ETHUSDT"]) as
+    stream:` and read `stream.book("BTCUSDT")`, or call `start()` and
+    `stop()`. Snapshots are fetched with `client` (weight 20 each at the
+    default `depth_limit`), at most `max_concurrent_snapshots` at a time.
+    """
+
+    stream_name = "Depth stream"
+
+    def __init__(
+        self,
+        client: AsyncBinanceFuturesClient,
+        symbols: Iterable[str],
+        url: str = TESTNET_MARKET_STREAM_URL,
+        update_speed: str = "100ms",
+        depth_limit: int = 1000,
+        max_levels: int = 2000,
+        max_concurrent_snapshots: int = 4,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30.0,
+        timeout: float = 10.0,
+    ) -> None:
+        super().__init__(reconnect_delay, max_reconnect_delay)
+        self.client = client
+        self.symbols = [symbol.upper() for symbol in symbols]
+        self.url = url
+        self.update_speed = update_speed
+        self.depth_limit = depth_limit
+        self.timeout = timeout
+        self.books = {symbol: OrderBook(symbol, max_levels) for symbol in self.symbols}
+        self.resyncs = 0
+        self._task: Optional[asyncio.Task] = None
+        # Diffs received while the symbol's snapshot is loading
+        self._pending: Dict[str, List[Dict[str, Any]]] = {}
+        self._snapshot_tasks: Set[asyncio.Task] = set()
+        self._snapshot_slots = asyncio.Semaphore(max_concurrent_snapshots)
+
+    def book(self, symbol: str) -> OrderBook:
+        return self.books[symbol.upper()]
+
+    @property
+    def synced(self) -> bool:
+        """Whether every book is currently in sync."""
+        return all(book.synced for book in self.books.values())
+
+    async def wait_synced(self, timeout: Optional[float] = None) -> None:
+        """Wait until every book is in sync."""
+
+        async def poll() -> None:
+            while not self.synced:
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(poll(), timeout)
+
+    async def start(self) -> None:
+        """Connect and start loading snapshots; raises if the first connection fails."""
+        await self._connect()
+        self._task = asyncio.create_task(self._run())
+        for symbol in self.symbols:
+            self._resync(symbol)
+
+    async def stop(self) -> None:
+        tasks = [*self._snapshot_tasks, *([self._task] if self._task is not None else [])]
+        self._task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._ws is not None:
+            await self._ws.close()
+            self._ws = None
+
+    async def __aenter__(self) -> "OrderBookStream":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    async def _connect(self) -> None:
+        streams = "/".join(f"{s.lower()}@depth@{self.update_speed}" for s in self.symbols)
+        url = f"{self.url}?streams={streams}"
+        logger.info("Connecting to depth streams: %s", url)
+        self._ws = await websockets.connect(url, open_timeout=self.timeout)
+
+    async def _on_reconnect(self) -> None:
+        # Diffs were missed while disconnected.
+        for symbol in self.symbols:
+            self.resyncs += 1
+            self._resync(symbol)
+
+    async def _read(self, ws: Any) -> None:
+        async for message in ws:
+            try:
+                event = loads(message).get("data")
+                if event is not None and event.get("e") == "depthUpdate":
+                    self._on_diff(event)
+            except (ValueError, TypeError, KeyError, AttributeError) as exc:
+                logger.warning("Ignoring malformed depth frame (%r): %.200r", exc, message)
+
+    def _on_diff(self, event: Dict[str, Any]) -> None:
+        symbol = event["s"]
+        pending = self._pending.get(symbol)
+        if pending is not None:
+            pending.append(event)
+            return
+        book = self.books.get(symbol)
+        if book is not None and not book.apply(event):
+            logger.warning(
+                "Gap in %s depth stream (pu=%s after u=%s); reloading snapshot",
+                symbol,
+                event.get("pu"),
+                book.last_update_id,
+            )
+            self.resyncs += 1
+            self._resync(symbol, [event])
+
+    def _resync(self, symbol: str, pending: Optional[List[Dict[str, Any]]] = None) -> None:
+        self.books[symbol].synced = False
+        if symbol in self._pending:
+            # A snapshot is already loading; it checks the buffered diffs.
+            self._pending[symbol].extend(pending or [])
+            return
+        self._pending[symbol] = list(pending or [])
+        task = asyncio.create_task(self._load_snapshot(symbol))
+        self._snapshot_tasks.add(task)
+        task.add_done_callback(self._snapshot_tasks.discard)
+
+    async def _load_snapshot(self, symbol: str) -> None:
+        book = self.books[symbol]
+        for delay in backoff_delays(self.reconnect_delay, self.max_reconnect_delay):
+            try:
+                async with self._snapshot_slots:
+                    snapshot = await self.client.get_depth(symbol, self.depth_limit)
+            except (BinanceApiError, BinanceNetworkError) as exc:
+                logger.warning(
+                    "Depth snapshot for %s failed: %s; retrying in %.1fs", symbol, exc, delay
+                )
+            else:
+                book.load_snapshot(snapshot)
+                pending = self._pending[symbol]
+                for i, event in enumerate(pending):
+                    if not book.apply(event):
+                        # Keep the diffs a newer snapshot may connect to.
+                        del pending[:i]
+                        break
+                else:
+                    del self._pending[symbol]
+                    return
+                logger.warning(
+                    "%s snapshot (lastUpdateId=%s) does not connect to the buffered diffs; "
+                    "reloading in %.1fs",
+                    symbol,
+                    snapshot["lastUpdateId"],
+                    delay,
+                )
+            await asyncio.sleep(delay)
+
@@ -0,0 +1,249 @@
+"""
+Bulk order placement from CSV or JSONL order files.
+
+Each row holds one order: `symbol`, `side`, `type`, `quantity` and, where the
+order type needs them, `price` and `stop_price`; an optional
+`client_order_id` is sent as newClientOrderId. For example:
+
+    symbol,side,type,quantity,price,stop_price,client_order_id
+    BTCUSDT,BUY,LIMIT,0.010,65000.1,,grid-1
+
+    {"symbol": "BTCUSDT", "side": "BUY", "type": "MARKET", "quantity": "0.010"}
+
+`read_order_file` validates every row before anything is sent, so a bad row
+cannot leave a file half-executed. `place_orders` then submits the valid
+orders concurrently over one pooled client and yields one result per order
+in input order, which `write_results` streams to a results file.
+"""
+
+from __future__ import annotations
+
+import csv
+import heapq
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from decimal import Decimal
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .client import BinanceApiError, BinanceFuturesClient, BinanceNetworkError, OrderResult
+from .decoding import loads
+from .validators import ValidationError, validate_order_request
+
+logger = logging.getLogger(__name__)
+
+
+ORDER_FILE_FORMATS = ("csv", "jsonl")
+ORDER_FILE_FIELDS = ("symbol", "side", "type", "quantity", "price", "stop_price", "client_order_id")
+RESULT_FIELDS = (
+    "line",
+    *ORDER_FILE_FIELDS,
+    "status",
+    "order_id",
+    "executed_qty",
+    "avg_price",
+    "error",
+)
+# Result status of rows that failed validation and were not sent
+INVALID = "INVALID"
+# ...and of orders Binance rejected or that failed in transit
+FAILED = "FAILED"
+
+
+@dataclass(frozen=True)
+class FileOrder:
+    """A validated order file row, normalized as by `validate_order_request`."""
+
+    line: int
+    symbol: str
+    side: str
+    order_type: str
+    quantity: Decimal
+    price: Optional[Decimal]
+    stop_price: Optional[Decimal]
+    client_order_id: Optional[str]
+
+    def fields(self) -> Dict[str, str]:
+        return {
+            "symbol": self.symbol,
+            "side": self.side,
+            "type": self.order_type,
+            "quantity": str(self.quantity),
+            "price": "" if self.price is None else str(self.price),
+            "stop_price": "" if self.stop_price is None else str(self.stop_price),
+            "client_order_id": self.client_order_id or "",
+        }
+
+
+@dataclass(frozen=True)
+class FileOrderResult:
+    """Outcome of one order file row."""
+
+    line: int
+    fields: Dict[str, str]
+    status: str
+    order_id: Optional[int] = None
+    executed_qty: str = ""
+    avg_price: str = ""
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.status not in (INVALID, FAILED)
+
+    def to_row(self) -> Dict[str, Any]:
+        return {
+            "line": self.line,
+            **self.fields,
+            "status": self.status,
+            "order_id": "" if self.order_id is None else self.order_id,
+            "executed_qty": self.executed_qty,
+            "avg_price": self.avg_price,
+            "error": self.error,
+        }
+
+
+def order_file_format(path: Path, fmt: Optional[str] = None) -> str:
+    """`fmt`, or the format implied by the file suffix (`.csv`, else JSONL)."""
+    if fmt is not None:
+        if fmt not in ORDER_FILE_FORMATS:
+            raise ValueError(f"order file format must be one of {ORDER_FILE_FORMATS}")
+        return fmt
+    return "csv" if path.suffix.lower() == ".csv" else "jsonl"
+
+
+def _rows(f: IO[str], fmt: str) -> Iterator[Tuple[int, Any]]:
+    if fmt == "csv":
+        reader = csv.DictReader(f)
+        for row in reader:
+            yield reader.line_num, row
+        return
+    for line_number, line in enumerate(f, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, loads(line)
+        except ValueError as exc:
+            yield line_number, exc
+
+
+def _text(value: Any) -> str:
+    return "" if value is None else str(value).strip()
+
+
+def _validate_row(line: int, row: Dict[str, Any]) -> FileOrder:
+    for name in ("symbol", "side", "quantity"):
+        if not _text(row.get(name)):
+            raise ValidationError(f"Missing {name}.")
+    order_type = _text(row.get("type") or row.get("order_type"))
+    symbol, side, norm_type, quantity, price, stop_price = validate_order_request(
+        symbol=_text(row["symbol"]),
+        side=_text(row["side"]),
+        order_type=order_type,
+        quantity=_text(row["quantity"]),
+        price=_text(row.get("price")) or None,
+        stop_price=_text(row.get("stop_price")) or None,
+    )
+    return FileOrder(
+        line=line,
+        symbol=symbol,
+        side=side,
+        order_type=norm_type,
+        quantity=quantity,
+        price=price,
+        stop_price=stop_price,
+        client_order_id=_text(row.get("client_order_id")) or None,
+    )
+
+
+def read_order_file(
+    path: Path, fmt: Optional[str] = None
+) -> Tuple[List[FileOrder], List[FileOrderResult]]:
+    """
+    Parse and validate every row of an order file.
+
+    Returns the valid orders and an `INVALID` result for each row that
+    failed, both in file order.
+    """
+    fmt = order_file_format(path, fmt)
+    orders: List[FileOrder] = []
+    invalid: List[FileOrderResult] = []
+    with open(path, newline="", encoding="utf-8") as f:
+        for line, row in _rows(f, fmt):
+            if not isinstance(row, dict):
+                error = f"Invalid JSON: {row}" if isinstance(row, Exception) else "Not an object."
+                fields = dict.fromkeys(ORDER_FILE_FIELDS, "")
+                invalid.append(FileOrderResult(line, fields, INVALID, error=error))
+                continue
+            try:
+                orders.append(_validate_row(line, row))
+            except ValidationError as exc:
+                fields = {name: _text(row.get(name)) for name in ORDER_FILE_FIELDS}
+                invalid.append(FileOrderResult(line, fields, INVALID, error=str(exc)))
+    return orders, invalid
+
+
+def _place(client: BinanceFuturesClient, order: FileOrder) -> FileOrderResult:
+    try:
+        result: OrderResult = client.place_order(
+            symbol=order.symbol,
+            side=order.side,
+            order_type=order.order_type,
+            quantity=order.quantity,
+            price=order.price,
+            stop_price=order.stop_price,
+            time_in_force="GTC",
+            client_order_id=order.client_order_id,
+        )
+    except (BinanceApiError, BinanceNetworkError) as exc:
+        logger.warning("Order file line %s failed: %s", order.line, exc)
+        return FileOrderResult(order.line, order.fields(), FAILED, error=str(exc))
+    return FileOrderResult(
+        order.line,
+        order.fields(),
+        result.status,
+        order_id=result.order_id,
+        executed_qty=result.executed_qty,
+        avg_price=result.avg_price or "",
+    )
+
+
+def place_orders(
+    client: BinanceFuturesClient, orders: Iterable[FileOrder], concurrency: int = 16
+) -> Iterator[FileOrderResult]:
+    """
+    Place `orders` with up to `concurrency` requests in flight.
+
+    Yields one result per order, in input order, as they complete. Failed
+    orders are reported in their result rather than raised. Give `client` a
+    configured rate limiter (`configure_rate_limits()`) so that the requests
+    in flight are held back before Binance's order and weight limits.
+    """
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        yield from executor.map(lambda order: _place(client, order), orders)
+
+
+def merge_results(*results: Iterable[FileOrderResult]) -> Iterator[FileOrderResult]:
+    """Interleave line-ordered result streams (e.g. invalid and placed rows)."""
+    return heapq.merge(*results, key=lambda result: result.line)
+
+
+def write_results(
+    path: Path, results: Iterable[FileOrderResult], fmt: Optional[str] = None
+) -> Iterator[FileOrderResult]:
+    """Write each result to `path` as it arrives, passing it through to the caller."""
+    fmt = order_file_format(path, fmt)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS) if fmt == "csv" else None
+        if writer is not None:
+            writer.writeheader()
+        for result in results:
+            row = result.to_row()
+            if writer is not None:
+                writer.writerow(row)
+            else:
+                f.write(json.dumps(row) + "\n")
+            f.flush()
+            yield result
@@ -0,0 +1,261 @@
+"""
+Local order state, so order status can be answered without API calls.
+
+`OrderTracker` keeps every order the bot has seen, keyed by orderId and
+clientOrderId and indexed by status and by symbol/side for open orders. It is
+fed by REST order responses (set `client.order_tracker` and every place,
+query and cancel result is recorded; cancel-all, whose response lists no
+orders, is followed by a resync of the symbol's open orders) and by
+`ORDER_TRADE_UPDATE` events from the user data stream. Updates go through
+the Binance order state machine:
+
+    NEW -> PARTIALLY_FILLED -> FILLED / CANCELED / EXPIRED
+
+Stale updates (older `updateTime` than the tracked state, as happens when a
+REST response and a stream event race) and transitions out of a final state
+are ignored, so the tracked state only moves forward.
+
+One tracker can be shared by several clients, threads and the user data
+stream.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+OPEN_STATUSES = frozenset({"NEW", "PARTIALLY_FILLED"})
+FINAL_STATUSES = frozenset({"FILLED", "CANCELED", "EXPIRED", "EXPIRED_IN_MATCH", "REJECTED"})
+
+# Allowed status changes; staying in PARTIALLY_FILLED records another fill
+ORDER_TRANSITIONS: Dict[str, FrozenSet[str]] = {
+    "NEW": frozenset({"PARTIALLY_FILLED"}) | FINAL_STATUSES,
+    "PARTIALLY_FILLED": frozenset({"PARTIALLY_FILLED"}) | FINAL_STATUSES,
+    **{status: frozenset() for status in FINAL_STATUSES},
+}
+
+
+@dataclass(slots=True)
+class TrackedOrder:
+    """
+    Latest known state of one order.
+
+    Quantities and prices are Binance strings; fields that no update has
+    carried yet are empty.
+    """
+
+    order_id: int
+    client_order_id: str
+    symbol: str
+    side: str
+    order_type: str
+    status: str
+    orig_qty: str
+    executed_qty: str
+    price: str
+    avg_price: Optional[str]
+    update_time: int
+
+    @property
+    def is_open(self) -> bool:
+        return self.status in OPEN_STATUSES
+
+    @classmethod
+    def from_response(cls, data: Mapping[str, Any]) -> "TrackedOrder":
+        """From a REST order response (place, query or cancel)."""
+        return cls(
+            order_id=int(data["orderId"]),
+            client_order_id=data.get("clientOrderId", ""),
+            symbol=data.get("symbol", ""),
+            side=data.get("side", ""),
+            order_type=data.get("type", ""),
+            status=data.get("status", "NEW"),
+            orig_qty=data.get("origQty", ""),
+            executed_qty=data.get("executedQty", ""),
+            price=data.get("price", ""),
+            avg_price=data.get("avgPrice"),
+            update_time=int(data.get("updateTime", 0)),
+        )
+
+    @classmethod
+    def from_stream_event(cls, order: Mapping[str, Any]) -> "TrackedOrder":
+        """From the `o` object of an `ORDER_TRADE_UPDATE` user data stream event."""
+        return cls(
+            order_id=int(order["i"]),
+            client_order_id=order.get("c", ""),
+            symbol=order.get("s", ""),
+            side=order.get("S", ""),
+            order_type=order.get("o", ""),
+            status=order.get("X", "NEW"),
+            orig_qty=order.get("q", ""),
+            executed_qty=order.get("z", ""),
+            price=order.get("p", ""),
+            avg_price=order.get("ap"),
+            update_time=int(order.get("T", 0)),
+        )
+
+
+# String fields an update only overwrites when it carries them
+_MERGED_FIELDS = (
+    "client_order_id",
+    "symbol",
+    "side",
+    "order_type",
+    "orig_qty",
+    "executed_qty",
+    "price",
+)
+
+
+class OrderTracker:
+    """
+    In-memory order book of the bot's own orders.
+
+    Lookups by id are O(1) and open-order queries are O(k) in the number of
+    matching orders. Orders in a final state are kept for lookups until
+    `max_closed` newer ones have closed.
+    """
+
+    def __init__(self, max_closed: int = 10_000) -> None:
+        self.max_closed = max_closed
+        self._lock = threading.Lock()
+        self._orders: Dict[int, TrackedOrder] = {}
+        self._client_ids: Dict[str, int] = {}
+        # Dicts keyed by orderId serve as insertion-ordered sets.
+        self._by_status: Dict[str, Dict[int, TrackedOrder]] = {}
+        self._open_by_symbol: Dict[str, Dict[int, TrackedOrder]] = {}
+        self._open_by_side: Dict[Tuple[str, str], Dict[int, TrackedOrder]] = {}
+        self._closed: Deque[int] = deque()
+        self._rejected = 0
+
+    def on_order_response(self, data: Mapping[str, Any]) -> bool:
+        """Record a REST order response. Returns False if it was stale or invalid."""
+        return self.apply(TrackedOrder.from_response(data))
+
+    def on_order_update(self, event: Mapping[str, Any]) -> bool:
+        """Record an `ORDER_TRADE_UPDATE` event (the whole event or its `o` object)."""
+        return self.apply(TrackedOrder.from_stream_event(event.get("o", event)))
+
+    def apply(self, update: TrackedOrder) -> bool:
+        """
+        Merge `update` into the tracked state of its order.
+
+        Returns False, leaving the state unchanged, when the update is older
+        than the tracked state or its status cannot follow the tracked one.
+        """
+        with self._lock:
+            current = self._orders.get(update.order_id)
+            if current is None:
+                self._insert(update)
+                return True
+
+            if update.update_time < current.update_time or (
+                update.status != current.status
+                and update.status not in ORDER_TRANSITIONS.get(current.status, FINAL_STATUSES)
+            ):
+                self._rejected += 1
+                logger.debug(
+                    "Ignoring stale or invalid update for order %s: %s@%s -> %s@%s",
+                    update.order_id,
+                    current.status,
+                    current.update_time,
+                    update.status,
+                    update.update_time,
+                )
+                return False
+
+            was_open = current.is_open
+            self._unindex(current)
+            # Responses and events omit some fields; keep what is already known.
+            current.status = update.status
+            current.update_time = update.update_time
+            if update.avg_price is not None:
+                current.avg_price = update.avg_price
+            for name in _MERGED_FIELDS:
+                value = getattr(update, name)
+                if value:
+                    setattr(current, name, value)
+            self._index(current, closing=was_open)
+            return True
+
+    def _insert(self, order: TrackedOrder) -> None:
+        self._orders[order.order_id] = order
+        self._index(order, closing=True)
+
+    def _index(self, order: TrackedOrder, closing: bool) -> None:
+        order_id = order.order_id
+        if order.client_order_id:
+            self._client_ids[order.client_order_id] = order_id
+        self._by_status.setdefault(order.status, {})[order_id] = order
+        if order.is_open:
+            self._open_by_symbol.setdefault(order.symbol, {})[order_id] = order
+            self._open_by_side.setdefault((order.symbol, order.side), {})[order_id] = order
+        elif closing:
+            self._closed.append(order_id)
+            while len(self._closed) > self.max_closed:
+                self._forget(self._closed.popleft())
+
+    def _unindex(self, order: TrackedOrder) -> None:
+        order_id = order.order_id
+        self._by_status.get(order.status, {}).pop(order_id, None)
+        if order.is_open:
+            self._open_by_symbol.get(order.symbol, {}).pop(order_id, None)
+            self._open_by_side.get((order.symbol, order.side), {}).pop(order_id, None)
+
+    def _forget(self, order_id: int) -> None:
+        order = self._orders.get(order_id)
+        if order is None or order.is_open:
+            return
+        del self._orders[order_id]
+        self._unindex(order)
+        if self._client_ids.get(order.client_order_id) == order_id:
+            del self._client_ids[order.client_order_id]
+
+    def get(self, order_id: int) -> Optional[TrackedOrder]:
+        return self._orders.get(order_id)
+
+    def get_by_client_id(self, client_order_id: str) -> Optional[TrackedOrder]:
+        order_id = self._client_ids.get(client_order_id)
+        return self._orders.get(order_id) if order_id is not None else None
+
+    def open_orders(
+        self, symbol: Optional[str] = None, side: Optional[str] = None
+    ) -> List[TrackedOrder]:
+        """Open orders, optionally for one symbol and side, oldest first."""
+        symbol = symbol.upper() if symbol is not None else None
+        side = side.upper() if side is not None else None
+        with self._lock:
+            if symbol is None:
+                orders = [
+                    order
+                    for status in OPEN_STATUSES
+                    for order in self._by_status.get(status, {}).values()
+                    if side is None or order.side == side
+                ]
+                return sorted(orders, key=lambda order: order.order_id)
+            if side is None:
+                return list(self._open_by_symbol.get(symbol, {}).values())
+            return list(self._open_by_side.get((symbol, side), {}).values())
+
+    def orders_with_status(self, status: str) -> List[TrackedOrder]:
+        with self._lock:
+            return list(self._by_status.get(status, {}).values())
+
+    def open_count(self, symbol: Optional[str] = None) -> int:
+        if symbol is None:
+            return sum(len(self._by_status.get(status, {})) for status in OPEN_STATUSES)
+        return len(self._open_by_symbol.get(symbol.upper(), {}))
+
+    def metrics(self) -> Dict[str, float]:
+        """Tracked, open and rejected-update counts, e.g. for `ClientMetrics` gauges."""
+        return {
+            "tracked": float(len(self._orders)),
+            "open": float(self.open_count()),
+            "rejected_updates": float(self._rejected),
+        }
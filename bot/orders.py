@@ -1,10 +1,22 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict
+import time
+from decimal import ROUND_CEILING, ROUND_FLOOR, ROUND_HALF_EVEN, Decimal
+from typing import TYPE_CHECKING, Any, Dict
 
 from .client import BinanceFuturesClient, OrderResult
-from .validators import ValidationError, validate_order_request
+from .exchange_info import ExchangeInfoCache
+from .validators import (
+    ValidationError,
+    apply_symbol_filters,
+    round_to_step,
+    validate_order_request,
+)
+
+if TYPE_CHECKING:
+    # Annotation only; importing it would pull websockets and asyncio into the CLI and daemon
+    from .market_data import MarketData
 
 logger = logging.getLogger(__name__)
 
@@ -14,16 +26,21 @@ def place_order_with_validation(
     symbol: str,
     side: str,
     order_type: str,
-    quantity: float,
-    price: float | None,
-    stop_price: float | None,
+    quantity: Decimal | float,
+    price: Decimal | float | None,
+    stop_price: Decimal | float | None,
+    exchange_info: ExchangeInfoCache | None = None,
 ) -> OrderResult:
     """
     Validate user input, log request summary, and place an order via the client.
 
+    When `exchange_info` is given, quantity and prices are also rounded to the
+    symbol's tick/step sizes and checked against its filters locally.
+
     Raises:
         ValidationError, BinanceApiError, BinanceNetworkError, ValueError
     """
+    validation_start = time.perf_counter()
     (
         norm_symbol,
         norm_side,
@@ -40,21 +57,36 @@ def place_order_with_validation(
         stop_price=stop_price,
     )
 
+    if exchange_info is not None:
+        try:
+            filters = exchange_info.filters(norm_symbol)
+        except KeyError:
+            raise ValidationError(f"Unknown symbol: {norm_symbol}.") from None
+        norm_qty, norm_price, norm_stop_price = apply_symbol_filters(
+            filters, norm_side, norm_type, norm_qty, norm_price, norm_stop_price
+        )
+    if client.metrics is not None:
+        client.metrics.observe("validation", "order", time.perf_counter() - validation_start)
+
     request_summary: Dict[str, Any] = {
         "symbol": norm_symbol,
         "side": norm_side,
         "type": norm_type,
-        "quantity": norm_qty,
+        "quantity": str(norm_qty),
     }
     if norm_type == "LIMIT":
-        request_summary["price"] = norm_price
+        request_summary["price"] = str(norm_price)
         request_summary["timeInForce"] = "GTC"
     elif norm_type == "STOP_LIMIT":
-        request_summary["price"] = norm_price
-        request_summary["stopPrice"] = norm_stop_price
+        request_summary["price"] = str(norm_price)
+        request_summary["stopPrice"] = str(norm_stop_price)
         request_summary["timeInForce"] = "GTC"
 
-    logger.info("Placing order: %s", request_summary)
+    logger.info(
+        "Placing order: %s",
+        request_summary,
+        extra={"event": "order_request", "symbol": norm_symbol},
+    )
 
     result = client.place_order(
         symbol=norm_symbol,
@@ -72,7 +104,113 @@ def place_order_with_validation(
         result.status,
         result.executed_qty,
         result.avg_price,
+        extra={
+            "event": "order_placed",
+            "symbol": norm_symbol,
+            "order_id": result.order_id,
+            "status": result.status,
+        },
     )
 
     return result
 
+
+# Prices `reference_price` can read from streamed market data
+PRICE_REFERENCES = ("bid", "ask", "mid", "mark", "last")
+
+
+def reference_price(
+    market_data: MarketData,
+    symbol: str,
+    reference: str,
+    max_age_ms: float | None = None,
+) -> Decimal:
+    """
+    Current `reference` price of `symbol` (one of `PRICE_REFERENCES`).
+
+    Reads the local market data store only. Raises ValidationError when no
+    such price has been streamed yet, or when the symbol's newest update is
+    older than `max_age_ms`.
+    """
+    symbol = symbol.upper()
+    if reference == "mid":
+        quote = market_data.quote(symbol)
+        value = (quote[0] + quote[1]) / 2 if quote is not None else None
+    elif reference in PRICE_REFERENCES:
+        lookup = {
+            "bid": market_data.best_bid,
+            "ask": market_data.best_ask,
+            "mark": market_data.mark_price,
+            "last": market_data.last_trade_price,
+        }[reference]
+        value = lookup(symbol)
+    else:
+        raise ValidationError(
+            f"Unknown price reference {reference!r}; expected one of {PRICE_REFERENCES}."
+        )
+    if value is None:
+        raise ValidationError(f"No {reference} price for {symbol} yet.")
+
+    if max_age_ms is not None:
+        age_ms = time.time() * 1000 - (market_data.last_update_ms(symbol) or 0)
+        if age_ms > max_age_ms:
+            raise ValidationError(f"Market data for {symbol} is {age_ms:.0f}ms old.")
+    # repr() is the shortest string that round-trips, i.e. the streamed price.
+    return Decimal(repr(value))
+
+
+def _tick_size(
+    symbol: str, tick_size: Decimal | None, exchange_info: ExchangeInfoCache | None
+) -> Decimal:
+    if tick_size is not None:
+        return tick_size
+    if exchange_info is None:
+        raise ValueError("tick_size or exchange_info is required")
+    try:
+        return exchange_info.filters(symbol.upper()).tick_size
+    except KeyError:
+        raise ValidationError(f"Unknown symbol: {symbol.upper()}.") from None
+
+
+def price_at(
+    market_data: MarketData,
+    symbol: str,
+    reference: str,
+    ticks: int = 0,
+    tick_size: Decimal | None = None,
+    exchange_info: ExchangeInfoCache | None = None,
+    max_age_ms: float | None = None,
+) -> Decimal:
+    """
+    `reference` price moved by `ticks` ticks (negative = lower), on the tick grid.
+
+    E.g. `price_at(md, "BTCUSDT", "bid", -2, exchange_info=cache)` is the best
+    bid minus two ticks. The tick size comes from `tick_size` or the symbol's
+    PRICE_FILTER in `exchange_info`.
+    """
+    tick = _tick_size(symbol, tick_size, exchange_info)
+    price = reference_price(market_data, symbol, reference, max_age_ms) + ticks * tick
+    return round_to_step(price, tick, ROUND_HALF_EVEN)
+
+
+def passive_price(
+    market_data: MarketData,
+    symbol: str,
+    side: str,
+    ticks: int = 0,
+    tick_size: Decimal | None = None,
+    exchange_info: ExchangeInfoCache | None = None,
+    max_age_ms: float | None = None,
+) -> Decimal:
+    """
+    A LIMIT price `ticks` ticks behind the touch on the order's own side.
+
+    BUY prices at the best bid minus `ticks` ticks, SELL at the best ask plus
+    `ticks` ticks; off-grid results are rounded away from the spread.
+    """
+    tick = _tick_size(symbol, tick_size, exchange_info)
+    if side.upper() == "BUY":
+        price = reference_price(market_data, symbol, "bid", max_age_ms) - ticks * tick
+        return round_to_step(price, tick, ROUND_FLOOR)
+    price = reference_price(market_data, symbol, "ask", max_age_ms) + ticks * tick
+    return round_to_step(price, tick, ROUND_CEILING)
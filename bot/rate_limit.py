@@ -0,0 +1,183 @@
+"""
+Client-side request-weight and order-count rate limiting.
+
+Binance bans clients that exceed their IP request weight (429, then 418) or
+order count limits. `RateLimiter` keeps one token bucket per limit, seeded
+from `exchangeInfo` rateLimits, reconciles them with the usage Binance
+reports after every response (`X-MBX-USED-WEIGHT-*` / `X-MBX-ORDER-COUNT-*`
+headers, or `rateLimits` on WebSocket API responses) and makes callers wait
+for budget instead of sending requests that would be rejected.
+
+One limiter can be shared by several clients, threads and asyncio tasks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# Documented USDT-M futures limits, used until `configure` is called with the
+# values from exchangeInfo.
+DEFAULT_RATE_LIMITS = [
+    {"rateLimitType": "REQUEST_WEIGHT", "interval": "MINUTE", "intervalNum": 1, "limit": 2400},
+    {"rateLimitType": "ORDERS", "interval": "MINUTE", "intervalNum": 1, "limit": 1200},
+    {"rateLimitType": "ORDERS", "interval": "SECOND", "intervalNum": 10, "limit": 300},
+]
+
+_INTERVAL_SECONDS = {"S": 1, "M": 60, "H": 3_600, "D": 86_400}
+
+_HEADER_KINDS = {
+    "x-mbx-used-weight-": "REQUEST_WEIGHT",
+    "x-mbx-order-count-": "ORDERS",
+}
+
+
+class _Bucket:
+    __slots__ = ("limit", "window_s", "tokens", "updated")
+
+    def __init__(self, limit: int, window_s: float) -> None:
+        self.limit = limit
+        self.window_s = window_s
+        self.tokens = float(limit)
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.limit, self.tokens + elapsed * self.limit / self.window_s)
+            self.updated = now
+
+
+class RateLimiter:
+    """
+    Token buckets for Binance REQUEST_WEIGHT and ORDERS limits.
+
+    Buckets are keyed by limit type and interval, e.g. `("ORDERS", "10S")`,
+    matching the suffix of the corresponding response header.
+    """
+
+    def __init__(self, rate_limits: Optional[Iterable[Mapping[str, Any]]] = None) -> None:
+        self._lock = threading.Lock()
+        self._buckets: Dict[Tuple[str, str], _Bucket] = {}
+        self._blocked_until = 0.0
+        self._throttled = 0
+        self._waited_s = 0.0
+        self.configure(rate_limits if rate_limits is not None else DEFAULT_RATE_LIMITS)
+
+    def configure(self, rate_limits: Iterable[Mapping[str, Any]]) -> None:
+        """Replace the buckets with the `rateLimits` list from exchangeInfo."""
+        buckets: Dict[Tuple[str, str], _Bucket] = {}
+        for rate_limit in rate_limits:
+            kind = rate_limit["rateLimitType"]
+            if kind not in ("REQUEST_WEIGHT", "ORDERS"):
+                continue
+            unit = rate_limit["interval"][0]
+            num = int(rate_limit["intervalNum"])
+            buckets[(kind, f"{num}{unit}")] = _Bucket(
+                int(rate_limit["limit"]), num * _INTERVAL_SECONDS[unit]
+            )
+        with self._lock:
+            self._buckets = buckets
+        logger.info("Rate limits configured: %s", {f"{k}_{i}": b.limit for (k, i), b in buckets.items()})
+
+    def _reserve(self, weight: int, orders: int) -> float:
+        """Take the budget if available; otherwise return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                return self._blocked_until - now
+
+            wait = 0.0
+            for (kind, _), bucket in self._buckets.items():
+                cost = min(weight if kind == "REQUEST_WEIGHT" else orders, bucket.limit)
+                if cost <= 0:
+                    continue
+                bucket.refill(now)
+                if bucket.tokens < cost:
+                    wait = max(wait, (cost - bucket.tokens) * bucket.window_s / bucket.limit)
+            if wait > 0:
+                return wait
+
+            for (kind, _), bucket in self._buckets.items():
+                cost = min(weight if kind == "REQUEST_WEIGHT" else orders, bucket.limit)
+                if cost > 0:
+                    bucket.tokens -= cost
+            return 0.0
+
+    def _record_wait(self, wait: float) -> None:
+        with self._lock:
+            self._throttled += 1
+            self._waited_s += wait
+        logger.debug("Rate limit budget exhausted; waiting %.3fs", wait)
+
+    def acquire(self, weight: int = 1, orders: int = 0) -> None:
+        """Block the calling thread until `weight` and `orders` budget is available."""
+        while True:
+            wait = self._reserve(weight, orders)
+            if wait <= 0:
+                return
+            self._record_wait(wait)
+            time.sleep(wait)
+
+    async def acquire_async(self, weight: int = 1, orders: int = 0) -> None:
+        """Like `acquire`, but waits without blocking the event loop."""
+        while True:
+            wait = self._reserve(weight, orders)
+            if wait <= 0:
+                return
+            self._record_wait(wait)
+            await asyncio.sleep(wait)
+
+    def reconcile(self, kind: str, interval: str, used: int) -> None:
+        """Clamp a bucket to what the server says is left in the current window."""
+        with self._lock:
+            bucket = self._buckets.get((kind, interval.upper()))
+            if bucket is None:
+                return
+            bucket.refill(time.monotonic())
+            bucket.tokens = min(bucket.tokens, float(bucket.limit - used))
+
+    def update_from_headers(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Reconcile with the usage headers of a REST response and honour bans."""
+        for name, value in headers.items():
+            name = name.lower()
+            for prefix, kind in _HEADER_KINDS.items():
+                if name.startswith(prefix):
+                    self.reconcile(kind, name[len(prefix) :], int(value))
+
+        if status_code in (418, 429):
+            retry_after = float(headers.get("Retry-After") or 60)
+            with self._lock:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+            logger.warning(
+                "Binance rate limit hit (status %s); pausing requests for %.0fs",
+                status_code,
+                retry_after,
+            )
+
+    def update_from_rate_limits(self, rate_limits: Iterable[Mapping[str, Any]]) -> None:
+        """Reconcile with the `rateLimits` usage list of a WebSocket API response."""
+        for rate_limit in rate_limits:
+            interval = f"{rate_limit['intervalNum']}{rate_limit['interval'][0]}"
+            self.reconcile(rate_limit["rateLimitType"], interval, int(rate_limit["count"]))
+
+    def snapshot(self) -> Dict[str, float]:
+        """Current budget per bucket plus throttling counters, for metrics."""
+        with self._lock:
+            now = time.monotonic()
+            metrics: Dict[str, float] = {}
+            for (kind, interval), bucket in self._buckets.items():
+                bucket.refill(now)
+                key = f"{kind.lower()}_{interval.lower()}"
+                metrics[f"{key}_limit"] = float(bucket.limit)
+                metrics[f"{key}_available"] = bucket.tokens
+            metrics["blocked_for_s"] = max(self._blocked_until - now, 0.0)
+            metrics["throttled_total"] = float(self._throttled)
+            metrics["throttled_wait_s_total"] = self._waited_s
+            return metrics
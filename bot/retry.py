@@ -0,0 +1,75 @@
+"""
+Retry policy for order submission.
+
+Retrying a failed `place_order` blindly can double-execute an order whose
+request reached Binance but whose response was lost. Orders sent under a
+`RetryPolicy` therefore carry a `newClientOrderId` that stays the same across
+attempts, and after an ambiguous failure the client looks the order up by that
+id before resubmitting it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import uuid
+from dataclasses import dataclass
+
+# Binance codes meaning "request may or may not have been executed"
+UNKNOWN_EXECUTION_CODES = frozenset({-1001, -1007})
+
+# newClientOrderId: ^[.A-Z:/a-z0-9_-]{1,36}$
+_CLIENT_ORDER_ID_MAX_LEN = 36
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Bounded retries with full-jitter exponential backoff.
+
+    :param max_attempts: total attempts, including the first one
+    :param base_delay: backoff before the first retry, in seconds
+    :param max_delay: cap for any single backoff, in seconds
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.05
+    max_delay: float = 1.0
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number `attempt` (1-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+def is_retryable(exc: Exception) -> bool:
+    """
+    Whether a failed request may be retried.
+
+    Transport errors, 5xx responses and unknown-execution codes qualify; any
+    other API error is a definite rejection.
+    """
+    # Imported here to avoid a circular import with bot.client
+    from .client import BinanceApiError, BinanceNetworkError
+
+    if isinstance(exc, BinanceNetworkError):
+        return True
+    if isinstance(exc, BinanceApiError):
+        return exc.status_code >= 500 or exc.code in UNKNOWN_EXECUTION_CODES
+    return False
+
+
+def new_client_order_id(prefix: str = "bot") -> str:
+    """Fresh client order id for a logical order without a natural key."""
+    return f"{prefix}-{uuid.uuid4().hex}"[:_CLIENT_ORDER_ID_MAX_LEN]
+
+
+def client_order_id_for(key: str, prefix: str = "bot") -> str:
+    """
+    Deterministic client order id derived from a caller-chosen order key.
+
+    Re-running a job with the same keys (e.g. a row number in an orders file)
+    reproduces the same ids, so Binance-side lookups can detect orders that
+    were already placed.
+    """
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return f"{prefix}-{digest}"[:_CLIENT_ORDER_ID_MAX_LEN]
@@ -0,0 +1,142 @@
+"""
+Server clock offset tracking for signed requests.
+
+Binance rejects signed requests whose `timestamp` falls outside `recvWindow`
+of its own clock (error -1021). `ServerClock` samples `/fapi/v1/time`,
+estimates the local-to-server offset with a minimum-RTT filter and stamps
+requests with the corrected time, so `recv_window` can be tuned tightly
+instead of padded for drift.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ClockSample:
+    offset_ms: float
+    rtt_ms: float
+    taken_at: float  # time.monotonic() when the sample completed
+
+
+class ServerClock:
+    """
+    Estimates the offset between the local clock and the Binance server clock.
+
+    Each sample brackets a server time read between two local reads; the
+    server is assumed to have stamped it half-way through the round trip, so
+    the error of a sample is bounded by half its RTT. Of the last `window`
+    samples the one with the smallest RTT is used.
+
+    :param fetch_server_time: returns the server time in ms (e.g.
+        `BinanceFuturesClient.get_server_time`); only needed for `sync` and
+        background refresh, async callers can feed `add_sample` directly.
+    :param window: number of recent samples the filter chooses from
+    :param refresh_interval: seconds between background samples
+    """
+
+    def __init__(
+        self,
+        fetch_server_time: Optional[Callable[[], int]] = None,
+        window: int = 8,
+        refresh_interval: float = 60.0,
+    ) -> None:
+        self._fetch_server_time = fetch_server_time
+        self.refresh_interval = refresh_interval
+        self._samples: Deque[ClockSample] = deque(maxlen=window)
+        self._best: Optional[ClockSample] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add_sample(self, local_send_ms: float, server_ms: int, local_recv_ms: float) -> ClockSample:
+        """Record one round trip: local send time, server time, local receive time."""
+        rtt = max(local_recv_ms - local_send_ms, 0.0)
+        sample = ClockSample(
+            offset_ms=server_ms - (local_send_ms + local_recv_ms) / 2,
+            rtt_ms=rtt,
+            taken_at=time.monotonic(),
+        )
+        with self._lock:
+            self._samples.append(sample)
+            self._best = min(self._samples, key=lambda s: s.rtt_ms)
+        return sample
+
+    def sample(self) -> ClockSample:
+        if self._fetch_server_time is None:
+            raise RuntimeError("ServerClock has no fetch_server_time callable")
+        local_send = time.time() * 1000
+        server = self._fetch_server_time()
+        local_recv = time.time() * 1000
+        return self.add_sample(local_send, server, local_recv)
+
+    def sync(self, samples: int = 4) -> None:
+        """Take several samples back to back so the filter has a good estimate."""
+        for _ in range(samples):
+            self.sample()
+        logger.info(
+            "Server clock synced: offset=%.1fms uncertainty=%.1fms",
+            self.offset_ms,
+            self.uncertainty_ms,
+        )
+
+    def clear(self) -> None:
+        """Drop all samples, e.g. after the server rejected our timestamp."""
+        with self._lock:
+            self._samples.clear()
+            self._best = None
+
+    @property
+    def offset_ms(self) -> float:
+        best = self._best
+        return best.offset_ms if best is not None else 0.0
+
+    @property
+    def uncertainty_ms(self) -> float:
+        best = self._best
+        return best.rtt_ms / 2 if best is not None else float("inf")
+
+    def now_ms(self) -> int:
+        """Current server time estimate in milliseconds."""
+        return int(time.time() * 1000 + self.offset_ms)
+
+    def metrics(self) -> Dict[str, float]:
+        best = self._best
+        return {
+            "offset_ms": self.offset_ms,
+            "uncertainty_ms": self.uncertainty_ms,
+            "rtt_ms": best.rtt_ms if best is not None else float("nan"),
+            "samples": float(len(self._samples)),
+            "age_s": time.monotonic() - best.taken_at if best is not None else float("nan"),
+        }
+
+    def start(self) -> None:
+        """Refresh the estimate every `refresh_interval` seconds in a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._refresh_loop, name="binance-time-sync", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.wait(self.refresh_interval):
+            try:
+                self.sample()
+            except Exception:  # keep refreshing; the previous estimate stays valid
+                logger.exception("Server time refresh failed")
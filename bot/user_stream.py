@@ -0,0 +1,227 @@
+"""
+Binance Futures user data stream.
+
+`UserDataStream` creates a listenKey, keeps it alive on a timer, holds a
+WebSocket connection to `<stream_url>/<listenKey>` and dispatches events to
+subscribers by event type (`ORDER_TRADE_UPDATE`, `ACCOUNT_UPDATE`, ...). The
+event type is read from the head of each message, so messages nobody
+subscribed to are never decoded.
+
+The connection is re-established with backoff whenever it drops (Binance
+closes it after 24h) or the listenKey expires. Events sent while disconnected
+are lost, so every reconnect is reported to `GAP_EVENT` subscribers with the
+time range of the gap, and the client's `order_tracker`, if any, is
+resynchronised over REST. A tracker attached to the client is subscribed to
+`ORDER_TRADE_UPDATE` automatically, replacing status polling.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import websockets
+
+from .async_client import AsyncBinanceFuturesClient
+from .client import ORDER_DOES_NOT_EXIST, BinanceApiError, BinanceNetworkError
+from .decoding import loads
+from .ws_stream import ReconnectingStream
+
+logger = logging.getLogger(__name__)
+
+
+TESTNET_USER_STREAM_URL = "wss://fstream.binancefuture.com/ws"
+
+# Synthetic event dispatched after a reconnect: {"e": GAP_EVENT, "since": ms, "until": ms}
+GAP_EVENT = "streamGap"
+# Binance error code for a keepalive of an expired listenKey
+LISTEN_KEY_DOES_NOT_EXIST = -1125
+
+# Subscribers receive the decoded event; coroutine functions are awaited.
+EventHandler = Callable[[Dict[str, Any]], Any]
+
+
+def _event_type(message: Union[str, bytes]) -> Optional[str]:
+    # Binance puts "e" first: {"e":"ORDER_TRADE_UPDATE","T":...
+    if isinstance(message, bytes):
+        message = message.decode("utf-8")
+    start = message.find('"e":"')
+    if start < 0:
+        return None
+    start += 5
+    return message[start : message.find('"', start)]
+
+
+class UserDataStream(ReconnectingStream):
+    """
+    Push-based order and account updates for the client's account.
+
+    Use as `async with UserDataStream(client) as stream:` or call `start()`
+    and `stop()`.
+    """
+
+    stream_name = "User data stream"
+    reconnect_errors = (*ReconnectingStream.reconnect_errors, BinanceApiError, BinanceNetworkError)
+
+    def __init__(
+        self,
+        client: AsyncBinanceFuturesClient,
+        stream_url: str = TESTNET_USER_STREAM_URL,
+        keepalive_interval: float = 30 * 60,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30.0,
+        timeout: float = 10.0,
+    ) -> None:
+        """
+        :param keepalive_interval: seconds between listenKey keepalives
+            (a listenKey expires 60 minutes after the last one)
+        :param reconnect_delay: first retry delay after a disconnect, doubled
+            per failed attempt up to `max_reconnect_delay`
+        """
+        super().__init__(reconnect_delay, max_reconnect_delay)
+        self.client = client
+        self.stream_url = stream_url
+        self.keepalive_interval = keepalive_interval
+        self.timeout = timeout
+        self._handlers: Dict[str, List[EventHandler]] = {}
+        self._listen_key: Optional[str] = None
+        self._tasks: List[asyncio.Task] = []
+        self._last_message_ms = 0.0
+        if client.order_tracker is not None:
+            self.subscribe("ORDER_TRADE_UPDATE", client.order_tracker.on_order_update)
+
+    def subscribe(self, event_type: str, handler: EventHandler) -> None:
+        """Call `handler` with every event of `event_type` (or `GAP_EVENT`)."""
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    def unsubscribe(self, event_type: str, handler: EventHandler) -> None:
+        handlers = self._handlers.get(event_type, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    async def start(self) -> None:
+        """Create the listenKey and connect; raises if the first connection fails."""
+        await self._connect()
+        self._last_message_ms = time.time() * 1000
+        self._tasks = [
+            asyncio.create_task(self._run()),
+            asyncio.create_task(self._keepalive_loop()),
+        ]
+
+    async def stop(self) -> None:
+        """Disconnect and close the listenKey."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._ws is not None:
+            await self._ws.close()
+            self._ws = None
+        if self._listen_key is not None:
+            self._listen_key = None
+            try:
+                await self.client.close_listen_key()
+            except (BinanceApiError, BinanceNetworkError) as exc:
+                logger.warning("Failed to close listenKey: %s", exc)
+
+    async def __aenter__(self) -> "UserDataStream":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    async def _connect(self) -> None:
+        # POST returns the active listenKey, or a new one if it expired.
+        if self._listen_key is None:
+            self._listen_key = await self.client.create_listen_key()
+        logger.info("Connecting to user data stream: %s", self.stream_url)
+        self._ws = await websockets.connect(
+            f"{self.stream_url}/{self._listen_key}", open_timeout=self.timeout
+        )
+
+    async def _on_reconnect(self) -> None:
+        # No message is read while reconnecting, so the gap starts at the last one.
+        since, self._last_message_ms = self._last_message_ms, time.time() * 1000
+        await self._report_gap(since, self._last_message_ms)
+
+    async def _read(self, ws: Any) -> None:
+        handlers = self._handlers
+        async for message in ws:
+            self._last_message_ms = time.time() * 1000
+            event_type = _event_type(message)
+            if event_type == "listenKeyExpired":
+                logger.warning("User data stream listenKey expired")
+                self._listen_key = None
+                return
+            if event_type is not None and not handlers.get(event_type):
+                continue
+            try:
+                event = loads(message)
+                event_type = event.get("e")
+            except (ValueError, AttributeError) as exc:
+                logger.warning("Ignoring malformed user data frame (%r): %.200r", exc, message)
+                continue
+            await self._dispatch(event_type, event)
+
+    async def _dispatch(self, event_type: Optional[str], event: Dict[str, Any]) -> None:
+        for handler in self._handlers.get(event_type or "", ()):
+            try:
+                result = handler(event)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                logger.exception("User data stream handler failed for %s event", event_type)
+
+    async def _report_gap(self, since_ms: float, until_ms: float) -> None:
+        logger.warning(
+            "User data stream reconnected; events between %d and %d may be lost",
+            since_ms,
+            until_ms,
+        )
+        await self._dispatch(
+            GAP_EVENT, {"e": GAP_EVENT, "since": int(since_ms), "until": int(until_ms)}
+        )
+        if self.client.order_tracker is not None:
+            try:
+                await self.resync_orders()
+            except (BinanceApiError, BinanceNetworkError) as exc:
+                logger.warning("Order resync after stream gap failed: %s", exc)
+
+    async def resync_orders(self) -> None:
+        """Bring the client's order tracker up to date over REST."""
+        tracker = self.client.order_tracker
+        if tracker is None:
+            return
+        # Both calls feed the tracker through the client's order results.
+        still_open = {order.order_id for order in await self.client.get_open_orders()}
+        for order in tracker.open_orders():
+            if order.order_id in still_open:
+                continue
+            try:
+                await self.client.get_order(order.symbol, order_id=order.order_id)
+            except BinanceApiError as exc:
+                if exc.code != ORDER_DOES_NOT_EXIST:
+                    raise
+                # Binance purges canceled/expired orders without fills.
+                logger.warning("Tracked order %s no longer exists on Binance", order.order_id)
+
+    async def _keepalive_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            try:
+                await self.client.keepalive_listen_key()
+            except BinanceApiError as exc:
+                if exc.code != LISTEN_KEY_DOES_NOT_EXIST:
+                    logger.warning("listenKey keepalive failed: %s", exc)
+                    continue
+                # Expired: drop the connection; the reader reconnects with a new key.
+                logger.warning("listenKey expired before keepalive; reconnecting")
+                self._listen_key = None
+                if self._ws is not None:
+                    await self._ws.close()
+            except BinanceNetworkError as exc:
+                logger.warning("listenKey keepalive failed: %s", exc)
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from typing import Literal, Tuple
+from decimal import ROUND_DOWN, ROUND_UP, Decimal, InvalidOperation
+from typing import TYPE_CHECKING, Literal, Tuple
+
+if TYPE_CHECKING:
+    # Annotation only; importing it would pull in the exchangeInfo cache at CLI startup
+    from .exchange_info import SymbolFilters
 
 
 Side = Literal["BUY", "SELL"]
@@ -32,21 +37,44 @@ def normalize_order_type(order_type: str) -> OrderType:
     return t  # type: ignore[return-value]
 
 
-def validate_quantity(quantity: float) -> float:
-    if quantity <= 0:
+def to_decimal(value: Decimal | float | str) -> Decimal:
+    """
+    Convert user input to an exact Decimal.
+
+    Floats go through their shortest repr, so 0.1 becomes Decimal("0.1")
+    rather than its binary expansion.
+    """
+    if isinstance(value, Decimal):
+        d = value
+    else:
+        try:
+            d = Decimal(str(value).strip())
+        except InvalidOperation:
+            raise ValidationError(f"Invalid number: {value!r}.") from None
+    if not d.is_finite():
+        raise ValidationError(f"Invalid number: {value!r}.")
+    return d
+
+
+def validate_quantity(quantity: Decimal | float) -> Decimal:
+    qty = to_decimal(quantity)
+    if qty <= 0:
         raise ValidationError("Quantity must be greater than 0.")
-    return quantity
+    return qty
 
 
-def _validate_positive(name: str, value: float) -> float:
-    if value <= 0:
+def _validate_positive(name: str, value: Decimal | float) -> Decimal:
+    d = to_decimal(value)
+    if d <= 0:
         raise ValidationError(f"{name} must be greater than 0.")
-    return value
+    return d
 
 
 def validate_price_and_stop_price(
-    order_type: OrderType, price: float | None, stop_price: float | None
-) -> Tuple[float | None, float | None]:
+    order_type: OrderType,
+    price: Decimal | float | None,
+    stop_price: Decimal | float | None,
+) -> Tuple[Decimal | None, Decimal | None]:
     """
     Validate price/stopPrice combinations for supported order types.
     """
@@ -73,13 +101,13 @@ def validate_order_request(
     symbol: str,
     side: str,
     order_type: str,
-    quantity: float,
-    price: float | None,
-    stop_price: float | None,
-) -> Tuple[str, Side, OrderType, float, float | None, float | None]:
+    quantity: Decimal | float,
+    price: Decimal | float | None,
+    stop_price: Decimal | float | None,
+) -> Tuple[str, Side, OrderType, Decimal, Decimal | None, Decimal | None]:
     """
     Validate and normalize all core order fields from CLI.
-    Returns normalized values.
+    Returns normalized values, with quantity and prices as exact Decimals.
     """
     norm_symbol = normalize_symbol(symbol)
     norm_side = normalize_side(side)
@@ -90,3 +118,64 @@ def validate_order_request(
     )
     return norm_symbol, norm_side, norm_type, norm_qty, norm_price, norm_stop_price
 
+
+def round_to_step(value: Decimal, step: Decimal, rounding: str) -> Decimal:
+    """Round `value` to a multiple of `step` (a tick or lot size); a zero step leaves it as is."""
+    if step <= 0:
+        return value
+    return (value / step).to_integral_value(rounding=rounding) * step
+
+
+def apply_symbol_filters(
+    filters: SymbolFilters,
+    side: Side,
+    order_type: OrderType,
+    quantity: Decimal | float,
+    price: Decimal | float | None,
+    stop_price: Decimal | float | None,
+    reference_price: Decimal | float | None = None,
+) -> Tuple[Decimal, Decimal | None, Decimal | None]:
+    """
+    Round values to the symbol's tick/step sizes and reject what Binance would.
+
+    Quantities round down to the lot step; prices round towards the passive
+    side (down for BUY, up for SELL), so rounding never makes an order larger
+    or more aggressive than requested. The MIN_NOTIONAL check uses `price`,
+    or `reference_price` for MARKET orders (skipped if neither is known).
+    """
+    is_market = order_type == "MARKET"
+    step = filters.market_step_size if is_market else filters.step_size
+    min_qty = filters.market_min_qty if is_market else filters.min_qty
+    max_qty = filters.market_max_qty if is_market else filters.max_qty
+
+    qty = round_to_step(to_decimal(quantity), step, ROUND_DOWN)
+    if qty < min_qty or qty <= 0:
+        raise ValidationError(f"Quantity must be at least {min_qty} for {filters.symbol}.")
+    if max_qty > 0 and qty > max_qty:
+        raise ValidationError(f"Quantity must be at most {max_qty} for {filters.symbol}.")
+
+    price_rounding = ROUND_DOWN if side == "BUY" else ROUND_UP
+
+    def check_price(name: str, value: Decimal | float | None) -> Decimal | None:
+        if value is None:
+            return None
+        rounded = round_to_step(to_decimal(value), filters.tick_size, price_rounding)
+        if rounded < filters.min_price or rounded <= 0:
+            raise ValidationError(f"{name} must be at least {filters.min_price} for {filters.symbol}.")
+        if filters.max_price > 0 and rounded > filters.max_price:
+            raise ValidationError(f"{name} must be at most {filters.max_price} for {filters.symbol}.")
+        return rounded
+
+    norm_price = check_price("Price", price)
+    norm_stop_price = check_price("Stop price", stop_price)
+
+    notional_price = norm_price if norm_price is not None else reference_price
+    if notional_price is not None and filters.min_notional > 0:
+        notional = qty * to_decimal(notional_price)
+        if notional < filters.min_notional:
+            raise ValidationError(
+                f"Order notional {notional} is below the minimum of "
+                f"{filters.min_notional} for {filters.symbol}."
+            )
+
+    return qty, norm_price, norm_stop_price
@@ -0,0 +1,331 @@
+"""
+Binance Futures WebSocket API (ws-fapi) order-entry transport.
+
+Keeps one long-lived WebSocket connection open and multiplexes `order.place`
+and `order.cancel` requests over it by request id, which avoids the HTTP
+framing and header overhead `BinanceFuturesClient` pays on every order.
+Responses are mapped to the same `OrderResult` / `BinanceApiError` types as
+the REST clients.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import logging
+import time
+from typing import Any, Awaitable, Dict, NoReturn, Optional
+
+import websockets
+
+from .client import (
+    BinanceApiError,
+    BinanceNetworkError,
+    BatchOrderOutcome,
+    Numeric,
+    OrderResult,
+    RequoteResult,
+    _FuturesClientBase,
+)
+from .decoding import loads
+from .exchange_info import ExchangeInfoCache
+from .logging_config import get_response_log_policy
+from .metrics import ClientMetrics
+from .rate_limit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+TESTNET_WS_API_URL = "wss://testnet.binancefuture.com/ws-fapi/v1"
+
+
+class BinanceWsApiClient(_FuturesClientBase):
+    """
+    Order entry over the Binance Futures WebSocket API.
+
+    Every request is HMAC-signed individually (session logon is only available
+    for Ed25519 keys). The connection is opened on first use, or explicitly via
+    `connect`, and re-opened transparently if the server drops it.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        api_secret: str,
+        ws_url: str = TESTNET_WS_API_URL,
+        recv_window: int = 5_000,
+        timeout: float = 10.0,
+        rate_limiter: Optional[RateLimiter] = None,
+        exchange_info: Optional[ExchangeInfoCache] = None,
+        metrics: Optional[ClientMetrics] = None,
+    ) -> None:
+        super().__init__(
+            api_key,
+            api_secret,
+            recv_window=recv_window,
+            rate_limiter=rate_limiter,
+            exchange_info=exchange_info,
+            metrics=metrics,
+        )
+        self.ws_url = ws_url
+        self.timeout = timeout
+        self._ws: Any = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._connect_lock = asyncio.Lock()
+
+    async def connect(self) -> None:
+        async with self._connect_lock:
+            if self._ws is not None:
+                return
+            logger.info("Connecting to Binance WebSocket API: %s", self.ws_url)
+            try:
+                self._ws = await websockets.connect(self.ws_url, open_timeout=self.timeout)
+            except (OSError, websockets.WebSocketException) as exc:
+                logger.exception("Failed to connect to Binance WebSocket API: %s", exc)
+                raise BinanceNetworkError(str(exc)) from exc
+            self._reader_task = asyncio.create_task(self._read_loop(self._ws))
+
+    async def _read_loop(self, ws: Any) -> None:
+        error: Exception = BinanceNetworkError("WebSocket API connection closed")
+        try:
+            async for message in ws:
+                try:
+                    data = loads(message)
+                    request_id = str(data.get("id"))
+                except (ValueError, AttributeError):
+                    # Not a JSON object, so it cannot answer a request
+                    logger.warning("Ignoring malformed WebSocket API frame: %.200r", message)
+                    continue
+                future = self._pending.pop(request_id, None)
+                if future is not None and not future.done():
+                    future.set_result(data)
+        except websockets.WebSocketException as exc:
+            error = BinanceNetworkError(f"WebSocket API connection lost: {exc}")
+        finally:
+            if self._ws is ws:
+                self._ws = None
+            pending, self._pending = self._pending, {}
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(error)
+
+    async def _signed_request(
+        self, method: str, params: Dict[str, Any], weight: int = 1, orders: int = 0
+    ) -> Any:
+        return await (await self._send_signed(method, params, weight, orders))
+
+    async def _send_signed(
+        self, method: str, params: Dict[str, Any], weight: int = 1, orders: int = 0
+    ) -> Awaitable[Any]:
+        """
+        Sign and send a request without waiting for its response.
+
+        Returns an awaitable of the request's result, so several requests can
+        be pipelined on the connection before the first response arrives.
+        """
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(weight=weight, orders=orders)
+        # Read after the limiter wait, during which the connection may have dropped
+        ws = self._ws
+        if ws is None:
+            await self.connect()
+            ws = self._ws
+
+        self._stamp(params)
+        # Log request (without API key, signature)
+        logged_params = dict(params)
+        query_string = "&".join(f"{k}={params[k]}" for k in sorted(params))
+        params["apiKey"] = self.api_key
+        payload = "&".join(f"{k}={params[k]}" for k in sorted(params))
+        params["signature"] = self._sign(payload)
+
+        request_id = str(next(self._ids))
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+
+        logger.info(
+            "Sending WebSocket API request: id=%s %s %s",
+            request_id,
+            method,
+            query_string,
+            extra={"event": "request", "method": method, "params": logged_params},
+        )
+
+        start = time.perf_counter()
+        try:
+            await ws.send(json.dumps({"id": request_id, "method": method, "params": params}))
+        except websockets.WebSocketException as exc:
+            self._pending.pop(request_id, None)
+            self._network_error(method, exc)
+        return self._receive(method, request_id, future, start)
+
+    async def _receive(
+        self, method: str, request_id: str, future: asyncio.Future, start: float
+    ) -> Any:
+        try:
+            data = await asyncio.wait_for(future, timeout=self.timeout)
+        except asyncio.TimeoutError as exc:
+            self._pending.pop(request_id, None)
+            self._network_error(method, exc)
+        if self.metrics is not None:
+            self.metrics.observe("request", method, time.perf_counter() - start)
+
+        status = data.get("status", 200)
+        policy = self.response_log_policy or get_response_log_policy()
+        if policy.should_log(method, status >= 400 or "error" in data):
+            logger.info("Received WebSocket API response: id=%s body=%s", request_id, data)
+
+        if self.rate_limiter is not None and data.get("rateLimits"):
+            self.rate_limiter.update_from_rate_limits(data["rateLimits"])
+
+        if status >= 400 or "error" in data:
+            error = data.get("error") or {}
+            if self.metrics is not None:
+                self.metrics.count_error(method, error.get("code", status))
+            raise BinanceApiError(status, error.get("code"), error.get("msg", ""))
+
+        return data.get("result")
+
+    def _network_error(self, method: str, exc: Exception) -> NoReturn:
+        logger.exception("Network error during WebSocket API request: %s", exc)
+        if self.metrics is not None:
+            self.metrics.count_error(method, "network")
+        raise BinanceNetworkError(str(exc) or "WebSocket API request timed out") from exc
+
+    async def place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: Numeric,
+        price: Optional[Numeric] = None,
+        stop_price: Optional[Numeric] = None,
+        time_in_force: Optional[str] = None,
+        client_order_id: Optional[str] = None,
+    ) -> OrderResult:
+        """
+        Place a MARKET, LIMIT, or STOP_LIMIT order via `order.place`.
+
+        Accepts the same arguments as `BinanceFuturesClient.place_order`;
+        `client_order_id` is sent as newClientOrderId. Requests are not
+        retried here, so no client order id is generated when it is omitted.
+        """
+        params = self._build_order_params(
+            symbol, side, order_type, quantity, price, stop_price, time_in_force, client_order_id
+        )
+        data = await self._signed_request("order.place", params, weight=0, orders=1)
+        return self._order_result_from_data(data)
+
+    async def cancel_order(
+        self,
+        symbol: str,
+        order_id: Optional[int] = None,
+        orig_client_order_id: Optional[str] = None,
+    ) -> OrderResult:
+        """Cancel an open order via `order.cancel` by exchange or client order id."""
+        params = self._order_lookup_params(symbol, order_id, orig_client_order_id)
+        data = await self._signed_request("order.cancel", params)
+        return self._order_result_from_data(data)
+
+    async def close(self) -> None:
+        ws, self._ws = self._ws, None
+        if ws is not None:
+            await ws.close()
+        if self._reader_task is not None:
+            await self._reader_task
+            self._reader_task = None
+
+    async def requote(
+        self,
+        symbol: str,
+        side: str,
+        quantity: Numeric,
+        price: Numeric,
+        order_id: Optional[int] = None,
+        orig_client_order_id: Optional[str] = None,
+        time_in_force: Optional[str] = None,
+        client_order_id: Optional[str] = None,
+        pipeline: bool = False,
+    ) -> RequoteResult:
+        """
+        Replace a resting order with a new LIMIT order at `price`.
+
+        As with the REST `requote`, the new order is only placed once the old
+        one is known to be gone: canceled, or rejected by the cancel as
+        unknown (already filled or expired).
+
+        With `pipeline=True` the place is sent right behind the cancel
+        without waiting for its response, so a requote costs one round trip
+        instead of two. If the cancel then fails for any other reason, the
+        new order is canceled straight away and `placed` holds the outcome of
+        that rollback; if the rollback fails too, both orders may be resting
+        and `placed` is the new order.
+        """
+        cancel_params = self._order_lookup_params(symbol, order_id, orig_client_order_id)
+        place_params = self._build_order_params(
+            symbol, side, "LIMIT", quantity, price, None, time_in_force, client_order_id
+        )
+
+        start = time.perf_counter()
+        if pipeline:
+            result = await self._pipelined_requote(symbol, cancel_params, place_params)
+        else:
+            canceled = await self._order_outcome(
+                self._signed_request("order.cancel", cancel_params)
+            )
+            placed: Optional[BatchOrderOutcome] = None
+            if isinstance(canceled, OrderResult) or self._order_already_gone(canceled):
+                placed = await self._order_outcome(
+                    self._signed_request("order.place", place_params, weight=0, orders=1)
+                )
+            result = RequoteResult(canceled, placed)
+        if self.metrics is not None:
+            self.metrics.observe("requote", "order.place", time.perf_counter() - start)
+        return result
+
+    async def _pipelined_requote(
+        self, symbol: str, cancel_params: Dict[str, Any], place_params: Dict[str, Any]
+    ) -> RequoteResult:
+        try:
+            cancel_reply = await self._send_signed("order.cancel", cancel_params)
+        except BinanceNetworkError as exc:
+            return RequoteResult(exc, None)
+        placed: BatchOrderOutcome
+        try:
+            place_reply = await self._send_signed("order.place", place_params, 0, 1)
+        except BinanceNetworkError as exc:
+            place_reply, placed = None, exc
+        canceled = await self._order_outcome(cancel_reply)
+        if place_reply is not None:
+            placed = await self._order_outcome(place_reply)
+
+        if isinstance(canceled, OrderResult) or self._order_already_gone(canceled):
+            return RequoteResult(canceled, placed)
+        if isinstance(placed, OrderResult):
+            # The old order may still be resting: take the new one back out
+            logger.warning(
+                "Requote cancel failed (%s); canceling the new order %s", canceled, placed.order_id
+            )
+            rollback = await self._order_outcome(
+                self._signed_request(
+                    "order.cancel", self._order_lookup_params(symbol, placed.order_id, None)
+                )
+            )
+            if isinstance(rollback, OrderResult):
+                placed = rollback
+            else:
+                logger.error(
+                    "Could not cancel requote order %s (%s); both orders may be resting",
+                    placed.order_id,
+                    rollback,
+                )
+        return RequoteResult(canceled, placed)
+
+    async def _order_outcome(self, reply: Awaitable[Any]) -> BatchOrderOutcome:
+        try:
+            return self._order_result_from_data(await reply)
+        except (BinanceApiError, BinanceNetworkError) as exc:
+            return exc
@@ -0,0 +1,80 @@
+"""
+Shared reconnect loop for the WebSocket streams.
+
+`ReconnectingStream` holds one WebSocket connection, reads it until it drops
+and reconnects with exponential backoff, forever. Subclasses supply
+`_connect` (open `self._ws`) and `_read` (consume one connection), and
+override `_on_reconnect` for work after every reconnect, such as reloading
+state the missed messages would have updated. `_read` logs and skips
+malformed frames, so only connection errors end a connection.
+`MarketDataStream`, `OrderBookStream` and `UserDataStream` are built on it.
+"""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import logging
+from typing import Any, Iterator, Tuple, Type
+
+import websockets
+
+logger = logging.getLogger(__name__)
+
+
+def backoff_delays(initial: float, maximum: float) -> Iterator[float]:
+    """`initial`, doubled on every step up to `maximum`, without end."""
+    delay = initial
+    while True:
+        yield delay
+        delay = min(delay * 2, maximum)
+
+
+class ReconnectingStream(abc.ABC):
+    """Base for streams that read one WebSocket connection and reconnect with backoff."""
+
+    # Named in log messages, e.g. "Market data connection lost: ..."
+    stream_name = "WebSocket"
+    # Failures of a reconnect attempt that are retried after the next delay
+    reconnect_errors: Tuple[Type[BaseException], ...] = (OSError, websockets.WebSocketException)
+
+    def __init__(self, reconnect_delay: float = 0.5, max_reconnect_delay: float = 30.0) -> None:
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.reconnects = 0
+        self._ws: Any = None
+
+    @abc.abstractmethod
+    async def _connect(self) -> None:
+        """Open `self._ws`."""
+
+    @abc.abstractmethod
+    async def _read(self, ws: Any) -> None:
+        """Consume `ws` until it closes; log and skip frames that cannot be handled."""
+
+    async def _on_reconnect(self) -> None:
+        """Called after every successful reconnect."""
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._read(self._ws)
+            except websockets.WebSocketException as exc:
+                logger.warning("%s connection lost: %s", self.stream_name, exc)
+            await self._reconnect()
+            await self._on_reconnect()
+
+    async def _reconnect(self) -> None:
+        if self._ws is not None:
+            await self._ws.close()
+            self._ws = None
+        for delay in backoff_delays(self.reconnect_delay, self.max_reconnect_delay):
+            try:
+                await self._connect()
+                self.reconnects += 1
+                return
+            except self.reconnect_errors as exc:
+                logger.warning(
+                    "%s reconnect failed: %s; retrying in %.1fs", self.stream_name, exc, delay
+                )
+            await asyncio.sleep(delay)
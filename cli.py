@@ -3,16 +3,93 @@ from __future__ import annotations
 import argparse
 import os
 import sys
-from typing import Optional
+import time
+from decimal import Decimal, InvalidOperation
+from typing import TYPE_CHECKING, Optional, Sequence, Tuple
 
-from dotenv import load_dotenv
-from rich import print as rprint
-from rich.table import Table
+if TYPE_CHECKING:
+    from pathlib import Path
 
-from bot.client import BinanceApiError, BinanceFuturesClient, BinanceNetworkError
-from bot.logging_config import configure_logging
-from bot.orders import place_order_with_validation
-from bot.validators import ValidationError
+# Startup cost matters here: the CLI runs from cron and shell loops. Heavy
+# modules (httpx via bot.client, rich, dotenv) are imported inside the
+# handlers that need them, after the arguments are parsed and validated, so
+# `--help`, invalid input and `--daemon` forwarding never load them, and
+# `--plain` output never loads rich. `benchmarks/bench_startup.py` checks this.
+
+
+class Output:
+    """
+    CLI output: rich markup and tables, or plain text with `plain=True`.
+
+    Plain output never imports rich. Results go to stdout as `key=value`
+    pairs and errors to stderr, for pipelines and cron jobs.
+    """
+
+    def __init__(self, plain: bool = False) -> None:
+        self.plain = plain
+
+    def _rich(self, markup: object) -> None:
+        from rich import print as rprint
+
+        rprint(markup)
+
+    def heading(self, text: str) -> None:
+        if self.plain:
+            print(text)
+        else:
+            self._rich(f"[bold cyan]{text}[/bold cyan]")
+
+    def success(self, text: str) -> None:
+        if self.plain:
+            print(text)
+        else:
+            self._rich(f"[bold green]{text}[/bold green]")
+
+    def error(self, text: str, detail: object = None) -> None:
+        if self.plain:
+            print(text if detail is None else f"{text} {detail}", file=sys.stderr)
+        elif detail is None:
+            self._rich(f"[bold red]{text}[/bold red]")
+        else:
+            self._rich(f"[bold red]{text}[/bold red] {detail}")
+
+    def fields(self, pairs: Sequence[Tuple[str, object]]) -> None:
+        """One line of labelled values, e.g. a request summary."""
+        if self.plain:
+            print(", ".join(f"{label}: {value}" for label, value in pairs))
+        else:
+            self._rich(", ".join(f"{label}: [bold]{value}[/bold]" for label, value in pairs))
+
+    def record(
+        self,
+        title: str,
+        headers: Tuple[str, str],
+        rows: Sequence[Tuple[str, object]],
+        justify: str = "left",
+    ) -> None:
+        """A two-column table; one `key=value ...` line in plain mode."""
+        if self.plain:
+            print(" ".join(f"{key}={value}" for key, value in rows))
+            return
+        from rich.table import Table
+
+        table = Table(title=title)
+        table.add_column(headers[0], style="bold")
+        table.add_column(headers[1], justify=justify)  # type: ignore[arg-type]
+        for key, value in rows:
+            table.add_row(key, str(value))
+        self._rich(table)
+
+
+def decimal_arg(value: str) -> Decimal:
+    """argparse type for exact decimal quantities and prices."""
+    try:
+        d = Decimal(value)
+    except InvalidOperation:
+        raise argparse.ArgumentTypeError(f"invalid decimal value: {value!r}") from None
+    if not d.is_finite():
+        raise argparse.ArgumentTypeError(f"invalid decimal value: {value!r}")
+    return d
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -33,68 +110,182 @@ def build_parser() -> argparse.ArgumentParser:
     )
     order_parser.add_argument(
         "quantity",
-        type=float,
+        type=decimal_arg,
         help="Order quantity.",
     )
     order_parser.add_argument(
         "--price",
         "-p",
-        type=float,
+        type=decimal_arg,
         required=False,
         help="Price (required for LIMIT and STOP_LIMIT orders).",
     )
     order_parser.add_argument(
         "--stop-price",
-        type=float,
+        type=decimal_arg,
         required=False,
         help="Trigger price for STOP_LIMIT orders.",
     )
     order_parser.add_argument(
+        "--daemon",
+        "-d",
+        action="store_true",
+        help="Send the order to a running `cli.py daemon` instead of connecting directly.",
+    )
+    order_parser.add_argument(
+        "--socket",
+        help="Daemon socket path (default: $BINANCE_BOT_SOCKET or a per-user temp file).",
+    )
+    _add_output_arguments(order_parser)
+
+    file_parser = subparsers.add_parser(
+        "orders-file",
+        help="Place every order in a CSV or JSONL file over one connection pool.",
+    )
+    file_parser.add_argument(
+        "path",
+        help="Order file with symbol, side, type, quantity, price, stop_price, "
+        "client_order_id columns/keys.",
+    )
+    file_parser.add_argument(
+        "--format",
+        choices=("csv", "jsonl"),
+        help="Order file format (default: from the file suffix, .csv or JSONL).",
+    )
+    file_parser.add_argument(
+        "--results",
+        "-o",
+        help="Results file (default: <path>.results<suffix>), written as orders complete.",
+    )
+    file_parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=16,
+        help="Orders in flight at once (default: 16).",
+    )
+    file_parser.add_argument(
+        "--skip-invalid",
+        action="store_true",
+        help="Place the valid orders even if some rows fail validation.",
+    )
+    _add_output_arguments(file_parser)
+
+    daemon_parser = subparsers.add_parser(
+        "daemon",
+        help="Keep a warm client running and accept orders on a local Unix socket.",
+    )
+    daemon_parser.add_argument(
+        "--socket",
+        help="Socket path (default: $BINANCE_BOT_SOCKET or a per-user temp file).",
+    )
+    daemon_parser.add_argument(
+        "--keepalive-interval",
+        type=float,
+        default=10.0,
+        help="Idle seconds before a ping keeps the connection warm (default: 10).",
+    )
+    _add_output_arguments(daemon_parser)
+
+    return parser
+
+
+def _add_output_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--plain",
+        action="store_true",
+        help="Print plain text (results on stdout, errors on stderr) without rich.",
+    )
+    parser.add_argument(
         "--log-file",
         "-l",
         required=False,
         help="Optional log file name inside logs/ (default: trading_bot.log).",
     )
+    parser.add_argument(
+        "--queue-logging",
+        action="store_true",
+        help="Write logs from a background thread instead of the order path.",
+    )
+    parser.add_argument(
+        "--log-json",
+        action="store_true",
+        help="Write one JSON object per log event instead of free text.",
+    )
 
-    return parser
+
+def _credentials(out: Output) -> Optional[tuple[str, str]]:
+    from dotenv import load_dotenv
+
+    # Load environment variables from .env if present
+    load_dotenv()
+    api_key = os.environ.get("BINANCE_API_KEY")
+    api_secret = os.environ.get("BINANCE_API_SECRET")
+    if not api_key or not api_secret:
+        out.error(
+            "BINANCE_API_KEY and BINANCE_API_SECRET must be set "
+            "(e.g. in a .env file or environment)."
+        )
+        return None
+    return api_key, api_secret
 
 
 def handle_order(
     symbol: str,
     side: str,
     order_type: str,
-    quantity: float,
-    price: Optional[float],
-    stop_price: Optional[float],
+    quantity: Decimal,
+    price: Optional[Decimal],
+    stop_price: Optional[Decimal],
     log_file: Optional[str],
+    queue_logging: bool = False,
+    log_json: bool = False,
+    plain: bool = False,
 ) -> int:
     """
     Place a MARKET, LIMIT, or STOP_LIMIT order on Binance Futures Testnet (USDT-M).
     Returns process exit code.
     """
-    # Load environment variables from .env if present
-    load_dotenv()
+    from bot.validators import ValidationError, validate_order_request
 
-    configure_logging(log_file=log_file)
-
-    api_key = os.environ.get("BINANCE_API_KEY")
-    api_secret = os.environ.get("BINANCE_API_SECRET")
+    out = Output(plain)
+    # Fail fast on bad input, before the client stack is imported
+    try:
+        validate_order_request(symbol, side, order_type, quantity, price, stop_price)
+    except ValidationError as exc:
+        out.error("Validation error:", exc)
+        return 1
 
-    if not api_key or not api_secret:
-        rprint(
-            "[bold red]BINANCE_API_KEY and BINANCE_API_SECRET must be set "
-            "(e.g. in a .env file or environment).[/bold red]"
-        )
+    credentials = _credentials(out)
+    if credentials is None:
         return 1
+    api_key, api_secret = credentials
 
-    rprint("[bold cyan]Order request summary[/bold cyan]")
-    rprint(
-        f"Symbol: [bold]{symbol}[/bold], Side: [bold]{side}[/bold], "
-        f"Type: [bold]{order_type}[/bold], Qty: [bold]{quantity}[/bold], "
-        f"Price: [bold]{price}[/bold], StopPrice: [bold]{stop_price}[/bold]"
+    from bot.client import (
+        TESTNET_BASE_URL,
+        BinanceApiError,
+        BinanceFuturesClient,
+        BinanceNetworkError,
     )
+    from bot.logging_config import configure_logging
+    from bot.orders import place_order_with_validation
 
-    client = BinanceFuturesClient(api_key=api_key, api_secret=api_secret)
+    configure_logging(log_file=log_file, use_queue=queue_logging, json_format=log_json)
+
+    out.heading("Order request summary")
+    out.fields(
+        [
+            ("Symbol", symbol),
+            ("Side", side),
+            ("Type", order_type),
+            ("Qty", quantity),
+            ("Price", price),
+            ("StopPrice", stop_price),
+        ]
+    )
+
+    base_url = os.environ.get("BINANCE_BASE_URL", TESTNET_BASE_URL)
+    client = BinanceFuturesClient(api_key=api_key, api_secret=api_secret, base_url=base_url)
 
     try:
         result = place_order_with_validation(
@@ -107,27 +298,216 @@ def handle_order(
             stop_price=stop_price,
         )
     except ValidationError as exc:
-        rprint(f"[bold red]Validation error:[/bold red] {exc}")
+        out.error("Validation error:", exc)
         return 1
     except BinanceApiError as exc:
-        rprint(f"[bold red]Binance API error:[/bold red] {exc}")
+        out.error("Binance API error:", exc)
         return 1
     except BinanceNetworkError as exc:
-        rprint(f"[bold red]Network error while calling Binance:[/bold red] {exc}")
+        out.error("Network error while calling Binance:", exc)
+        return 1
+    finally:
+        client.close()
+
+    out.record(
+        "Order Response",
+        ("Field", "Value"),
+        [
+            ("orderId", result.order_id),
+            ("status", result.status),
+            ("executedQty", result.executed_qty),
+            ("avgPrice", result.avg_price or "-"),
+        ],
+    )
+    out.success("Order placed successfully on Binance Futures Testnet.")
+    return 0
+
+
+def handle_orders_file(
+    path: Path,
+    fmt: Optional[str],
+    results_path: Optional[Path],
+    concurrency: int,
+    skip_invalid: bool,
+    log_file: Optional[str],
+    queue_logging: bool = False,
+    log_json: bool = False,
+    plain: bool = False,
+) -> int:
+    """
+    Validate every order in an order file, then place them concurrently and
+    write one result row per order. Returns process exit code.
+    """
+    out = Output(plain)
+    if concurrency < 1:
+        out.error("--concurrency must be at least 1.")
+        return 1
+
+    from bot.order_file import (
+        INVALID,
+        merge_results,
+        order_file_format,
+        place_orders,
+        read_order_file,
+        write_results,
+    )
+
+    try:
+        fmt = order_file_format(path, fmt)
+        orders, invalid = read_order_file(path, fmt)
+    except OSError as exc:
+        out.error("Cannot read order file:", exc)
+        return 1
+
+    for result in invalid[:20]:
+        out.error(f"Line {result.line}:", result.error)
+    if len(invalid) > 20:
+        out.error(f"... and {len(invalid) - 20} more invalid rows.")
+    if invalid and not skip_invalid:
+        out.error("No orders placed; fix the file or pass --skip-invalid.")
+        return 1
+
+    credentials = _credentials(out)
+    if credentials is None:
         return 1
+
+    from bot.client import (
+        TESTNET_BASE_URL,
+        BinanceApiError,
+        BinanceFuturesClient,
+        BinanceNetworkError,
+    )
+    from bot.logging_config import configure_logging
+    from bot.rate_limit import RateLimiter
+
+    configure_logging(log_file=log_file, use_queue=queue_logging, json_format=log_json)
+
+    base_url = os.environ.get("BINANCE_BASE_URL", TESTNET_BASE_URL)
+    api_key, api_secret = credentials
+    client = BinanceFuturesClient(
+        api_key=api_key, api_secret=api_secret, base_url=base_url, rate_limiter=RateLimiter()
+    )
+    try:
+        # Hundreds of orders in flight would otherwise run into HTTP 429 and IP bans
+        client.configure_rate_limits()
+    except (BinanceApiError, BinanceNetworkError) as exc:
+        client.close()
+        out.error("Cannot load rate limits from exchangeInfo:", exc)
+        return 1
+
+    if results_path is None:
+        results_path = path.with_name(f"{path.stem}.results{path.suffix or '.jsonl'}")
+    out.heading(f"Placing {len(orders)} orders from {path} ({concurrency} in flight)")
+
+    counts = {"placed": 0, "failed": 0, "invalid": 0}
+    start = time.perf_counter()
+    try:
+        results = merge_results(invalid, place_orders(client, orders, concurrency))
+        for result in write_results(results_path, results, fmt):
+            if result.ok:
+                counts["placed"] += 1
+            else:
+                counts["invalid" if result.status == INVALID else "failed"] += 1
     finally:
         client.close()
+    elapsed = time.perf_counter() - start
+
+    rate = len(orders) / elapsed if elapsed > 0 else 0.0
+    rows = [*counts.items(), ("orders/s", f"{rate:.0f}")]
+    out.record("Order File Results", ("Result", "Orders"), rows, justify="right")
+    out.fields([("Results written to", results_path)])
+    return 0 if counts["failed"] == 0 and counts["invalid"] == 0 else 1
 
-    table = Table(title="Order Response")
-    table.add_column("Field", style="bold")
-    table.add_column("Value")
-    table.add_row("orderId", str(result.order_id))
-    table.add_row("status", result.status)
-    table.add_row("executedQty", result.executed_qty)
-    table.add_row("avgPrice", result.avg_price or "-")
 
-    rprint(table)
-    rprint("[bold green]Order placed successfully on Binance Futures Testnet.[/bold green]")
+def forward_order(
+    symbol: str,
+    side: str,
+    order_type: str,
+    quantity: Decimal,
+    price: Optional[Decimal],
+    stop_price: Optional[Decimal],
+    socket_path: Optional[str],
+) -> int:
+    """
+    Place an order through a running daemon and print its response as plain text.
+    Returns process exit code.
+    """
+    from bot.daemon_client import DaemonClient, DaemonUnavailable
+
+    try:
+        with DaemonClient(socket_path) as daemon:
+            response = daemon.order(symbol, side, order_type, quantity, price, stop_price)
+    except DaemonUnavailable as exc:
+        print(f"{exc}; start one with `python cli.py daemon`.", file=sys.stderr)
+        return 1
+
+    if not response.get("ok"):
+        print(f"{response.get('error')} error: {response.get('message')}", file=sys.stderr)
+        return 1
+    print(
+        f"orderId={response['orderId']} status={response['status']} "
+        f"executedQty={response['executedQty']} avgPrice={response['avgPrice'] or '-'} "
+        f"latency_ms={response['latency_ms']}"
+    )
+    return 0
+
+
+def handle_daemon(
+    socket_path: Optional[str],
+    keepalive_interval: float,
+    log_file: Optional[str],
+    queue_logging: bool = False,
+    log_json: bool = False,
+    plain: bool = False,
+) -> int:
+    """
+    Run the order daemon in the foreground until interrupted or told to shut down.
+    Returns process exit code.
+    """
+    out = Output(plain)
+    credentials = _credentials(out)
+    if credentials is None:
+        return 1
+    api_key, api_secret = credentials
+
+    from bot.client import (
+        TESTNET_BASE_URL,
+        BinanceApiError,
+        BinanceFuturesClient,
+        BinanceNetworkError,
+    )
+    from bot.daemon import OrderDaemon
+    from bot.logging_config import configure_logging
+
+    configure_logging(log_file=log_file, use_queue=queue_logging, json_format=log_json)
+
+    base_url = os.environ.get("BINANCE_BASE_URL", TESTNET_BASE_URL)
+    try:
+        # Closes its own connection pool if the first clock sync fails
+        client = BinanceFuturesClient(
+            api_key=api_key, api_secret=api_secret, base_url=base_url, time_sync=True
+        )
+    except BinanceApiError as exc:
+        out.error("Binance API error:", exc)
+        return 1
+    except BinanceNetworkError as exc:
+        out.error("Network error while calling Binance:", exc)
+        return 1
+    try:
+        daemon = OrderDaemon(client, socket_path, keepalive_interval=keepalive_interval)
+        daemon.warm_up()
+        out.success(f"Order daemon listening on {daemon.socket_path}")
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    except BinanceApiError as exc:
+        out.error("Binance API error:", exc)
+        return 1
+    except (BinanceNetworkError, RuntimeError) as exc:
+        out.error("Order daemon failed:", exc)
+        return 1
+    finally:
+        client.close()
     return 0
 
 
@@ -135,6 +515,17 @@ def main(argv: Optional[list[str]] = None) -> None:
     parser = build_parser()
     args = parser.parse_args(argv)
 
+    if args.command == "order" and args.daemon:
+        exit_code = forward_order(
+            symbol=args.symbol,
+            side=args.side,
+            order_type=args.order_type,
+            quantity=args.quantity,
+            price=args.price,
+            stop_price=args.stop_price,
+            socket_path=args.socket,
+        )
+        sys.exit(exit_code)
     if args.command == "order":
         exit_code = handle_order(
             symbol=args.symbol,
@@ -144,6 +535,34 @@ def main(argv: Optional[list[str]] = None) -> None:
             price=args.price,
             stop_price=args.stop_price,
             log_file=args.log_file,
+            queue_logging=args.queue_logging,
+            log_json=args.log_json,
+            plain=args.plain,
+        )
+        sys.exit(exit_code)
+    if args.command == "orders-file":
+        from pathlib import Path
+
+        exit_code = handle_orders_file(
+            path=Path(args.path),
+            fmt=args.format,
+            results_path=Path(args.results) if args.results else None,
+            concurrency=args.concurrency,
+            skip_invalid=args.skip_invalid,
+            log_file=args.log_file,
+            queue_logging=args.queue_logging,
+            log_json=args.log_json,
+            plain=args.plain,
+        )
+        sys.exit(exit_code)
+    if args.command == "daemon":
+        exit_code = handle_daemon(
+            socket_path=args.socket,
+            keepalive_interval=args.keepalive_interval,
+            log_file=args.log_file,
+            queue_logging=args.queue_logging,
+            log_json=args.log_json,
+            plain=args.plain,
         )
         sys.exit(exit_code)
 